@@ -0,0 +1,98 @@
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, TypeVar
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.response_cache import response_cache
+from src.db.replicas import is_lagging
+
+from .conditional import ETAG_HEADER, is_not_modified, not_modified
+from .routing import REQUEST_PARAM, add_request_param, takes_request
+from .serialization import serialize_json
+
+EndpointType = TypeVar("EndpointType", bound=Callable[..., Awaitable[Any]])
+
+# キャッシュから返したかどうかを示すレスポンスヘッダー（HIT / MISS）
+CACHE_STATUS_HEADER = "X-Cache"
+
+
+def _request_key(request: Request) -> str:
+    """パスとクエリ文字列（パラメータの順序は正規化）からキーを作成"""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def _reads_lagging_replica(kwargs: dict[str, Any]) -> bool:
+    """エンドポイントのセッションに遅延のあるレプリカから読むものがあるか"""
+    return any(
+        isinstance(value, AsyncSession) and is_lagging(value)
+        for value in kwargs.values()
+    )
+
+
+def _encode_entry(etag: str | None, body: bytes) -> bytes:
+    """キャッシュのエントリ（1行目に ETag、2行目以降にレスポンス本文）"""
+    return (etag or "").encode() + b"\n" + body
+
+
+def _decode_entry(entry: bytes) -> tuple[str | None, bytes]:
+    etag, _, body = entry.partition(b"\n")
+    return etag.decode() or None, body
+
+
+def cache_response(
+    namespace: str, ttl: float | None = None
+) -> Callable[[EndpointType], EndpointType]:
+    """GET ルートのレスポンス（JSON のバイト列）をキャッシュするデコレータ
+
+    キーは namespace の現在のバージョン番号・パス・クエリ文字列。namespace への
+    書き込み後に response_cache.invalidate(namespace) を呼ぶとバージョン番号が
+    上がり、それまでのエントリは参照されなくなる。ttl を省略した場合は Settings の
+    既定値。エンドポイントは response_model と同じ型の値か、JSON の Response を
+    返すこと。Response の ETag も保存し、キャッシュから返す場合は If-None-Match と
+    一致すれば 304 を返す。200 以外の Response（304 など）と、遅延のある
+    レプリカから読んだレスポンス（無効化より古いことがある）はキャッシュしない。
+    """
+
+    def decorator(endpoint: EndpointType) -> EndpointType:
+        forward_request = takes_request(endpoint)
+
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = (
+                kwargs[REQUEST_PARAM] if forward_request else kwargs.pop(REQUEST_PARAM)
+            )
+            if not response_cache.enabled:
+                return await endpoint(*args, **kwargs)
+
+            key, entry = await response_cache.lookup(namespace, _request_key(request))
+            if entry is None:
+                status = "MISS"
+                result = await endpoint(*args, **kwargs)
+                if isinstance(result, Response):
+                    if result.status_code != 200:
+                        result.headers[CACHE_STATUS_HEADER] = status
+                        return result
+                    etag, body = result.headers.get(ETAG_HEADER), bytes(result.body)
+                else:
+                    etag, body = None, serialize_json(result)
+                if not _reads_lagging_replica(kwargs):
+                    await response_cache.store(key, _encode_entry(etag, body), ttl)
+            else:
+                status = "HIT"
+                etag, body = _decode_entry(entry)
+
+            headers = {CACHE_STATUS_HEADER: status}
+            if etag is not None:
+                headers[ETAG_HEADER] = etag
+                if is_not_modified(etag, request.headers.get("if-none-match")):
+                    return not_modified(headers)
+            return Response(body, media_type="application/json", headers=headers)
+
+        add_request_param(wrapper, endpoint)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,93 @@
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, TypeVar
+
+from fastapi import Request, Response
+
+from src.core.cache import SingleFlight
+from src.core.config import settings
+
+from .routing import REQUEST_PARAM, add_request_param, takes_request
+from .serialization import ModelJSONResponse
+
+EndpointType = TypeVar("EndpointType", bound=Callable[..., Awaitable[Any]])
+
+# 条件付きリクエストではレスポンス（200 / 304）が変わるため、既定でキーに含める
+DEFAULT_VARY = ("if-none-match", "if-modified-since")
+
+RequestKey = tuple[str, str, str, tuple[str | None, ...]]
+
+
+@dataclass(frozen=True)
+class SharedResponse:
+    """同時のリクエストで共有するシリアライズ済みのレスポンス"""
+
+    status_code: int
+    raw_headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @classmethod
+    def from_result(cls, result: Any) -> "SharedResponse":
+        if not isinstance(result, Response):
+            result = ModelJSONResponse(result)
+        return cls(result.status_code, tuple(result.raw_headers), bytes(result.body))
+
+    def to_response(self) -> Response:
+        # raw_headers は content-length を含めてそのまま引き継ぐ
+        response = Response(status_code=self.status_code)
+        response.body = self.body
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+# ルートごとの実行中のリクエスト（デバッグ API で回数を参照する）
+request_flights: dict[str, SingleFlight[RequestKey, SharedResponse]] = {}
+
+
+def _request_key(request: Request, vary: Sequence[str]) -> RequestKey:
+    """メソッド・パス・クエリ（順序は正規化）・vary のヘッダーからキーを作成"""
+    return (
+        request.method,
+        request.url.path,
+        str(sorted(request.query_params.multi_items())),
+        tuple(request.headers.get(name) for name in vary),
+    )
+
+
+def coalesce_requests(
+    name: str | None = None, vary: Sequence[str] = DEFAULT_VARY
+) -> Callable[[EndpointType], EndpointType]:
+    """同一の同時リクエストを1回の実行にまとめるデコレータ（冪等な GET ルート用）
+
+    メソッド・パス・クエリ・vary のヘッダーが同じリクエストが実行中の場合は、
+    エンドポイントを実行せずにその結果（シリアライズ済みのバイト列、例外を含む）を
+    待って返す。待機中のリクエストはDBに問い合わせないため、プールの接続も
+    取得しない。レスポンスが他のヘッダーによって変わる場合は vary に加えること。
+    エンドポイントは JSON に変換できる値か、本文を持つ Response を返すこと
+    （StreamingResponse は不可）。cache_response と併用する場合は外側に付ける。
+    """
+
+    def decorator(endpoint: EndpointType) -> EndpointType:
+        forward_request = takes_request(endpoint)
+        flights: SingleFlight[RequestKey, SharedResponse] = SingleFlight()
+        request_flights[name or endpoint.__name__] = flights
+
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = (
+                kwargs[REQUEST_PARAM] if forward_request else kwargs.pop(REQUEST_PARAM)
+            )
+            if not settings.request_coalescing:
+                return await endpoint(*args, **kwargs)
+
+            async def execute() -> SharedResponse:
+                return SharedResponse.from_result(await endpoint(*args, **kwargs))
+
+            shared = await flights.do(_request_key(request, vary), execute)
+            return shared.to_response()
+
+        add_request_param(wrapper, endpoint)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
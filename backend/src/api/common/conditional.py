@@ -0,0 +1,72 @@
+import hashlib
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+
+
+def make_etag(*parts: Any) -> str:
+    """値の組から強い ETag を作成（同じ値の組からは常に同じ ETag になる）"""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=12
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """弱い比較のため W/ を除いた ETag"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _as_utc(value: datetime) -> datetime:
+    """タイムゾーンなしの日時（DBの値）をUTCとして扱う"""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def is_not_modified(
+    etag: str,
+    if_none_match: str | None,
+    last_modified: datetime | None = None,
+    if_modified_since: str | None = None,
+) -> bool:
+    """条件付きリクエストに対して 304 を返せるかどうか
+
+    If-None-Match がある場合は ETag の弱い比較のみで判定し、If-Modified-Since は
+    無視する。If-Modified-Since は秒単位で比較する。
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        return _opaque_tag(etag) in tags
+
+    if last_modified is None or not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def validator_headers(
+    etag: str, last_modified: datetime | None = None
+) -> dict[str, str]:
+    """ETag と Last-Modified のレスポンスヘッダー"""
+    headers = {ETAG_HEADER: etag}
+    if last_modified is not None:
+        headers[LAST_MODIFIED_HEADER] = format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+    return headers
+
+
+def not_modified(headers: Mapping[str, str]) -> Response:
+    """本文のない 304 レスポンス"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(headers))
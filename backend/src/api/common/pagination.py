@@ -1,23 +1,126 @@
+import base64
+import json
+from collections.abc import Callable, Hashable, Sequence
+from datetime import datetime
+from enum import Enum
 from typing import Any, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.util import find_tables
 
-from .responses import PaginationMeta
+from src.core.cache import CacheStats, TTLCache
+from src.core.config import settings
+from src.db.replicas import is_lagging
+
+from .exceptions import ValidationException
+from .responses import CursorMeta, PaginationMeta
 
 T = TypeVar("T")
 
 
+class CountMode(str, Enum):
+    """総件数の取得方法"""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class CountCache:
+    """テーブル単位で無効化できる正確な件数のTTLキャッシュ"""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._cache: TTLCache[tuple[Hashable, ...], int] = TTLCache(ttl, max_entries)
+        self._generations: dict[str, int] = {}
+
+    def _key(self, tables: Sequence[str], key: str) -> tuple[Hashable, ...]:
+        # テーブルの世代番号をキーに含め、無効化後は古いエントリを参照しない
+        return (key, *(self._generations.get(table, 0) for table in sorted(tables)))
+
+    def get(self, tables: Sequence[str], key: str) -> int | None:
+        return self._cache.get(self._key(tables, key))
+
+    def set(self, tables: Sequence[str], key: str, value: int) -> None:
+        self._cache.set(self._key(tables, key), value)
+
+    def invalidate(self, table: str) -> None:
+        """テーブルへの書き込み時に、そのテーブルの件数キャッシュを無効化"""
+        self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._generations.clear()
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+
+count_cache = CountCache(
+    settings.pagination_count_cache_ttl, settings.pagination_count_cache_max_entries
+)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """ソートキーの値を不透明なカーソル文字列にエンコード"""
+    serializable = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(serializable, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list[Any]:
+    """カーソル文字列をソートキーの値にデコード"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor length mismatch")
+        return [
+            _decode_cursor_value(value, key)
+            for value, key in zip(values, keys, strict=True)
+        ]
+    except (ValueError, TypeError) as exc:
+        raise ValidationException("Invalid cursor") from exc
+
+
+def _decode_cursor_value(value: Any, key: Any) -> Any:
+    """カラム型に合わせてカーソル値を復元"""
+    python_type = key.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise TypeError("datetime cursor value must be a string")
+        return datetime.fromisoformat(value)
+    if python_type is int and (not isinstance(value, int) or isinstance(value, bool)):
+        raise TypeError("integer cursor value expected")
+    if python_type is float:
+        return float(value)
+    return value
+
+
 class PaginationHelper:
     """ページネーションヘルパー"""
 
+    @staticmethod
+    def calculate_pages(total: int | None, per_page: int) -> int | None:
+        """総ページ数を計算（総件数が不明な場合はNone）"""
+        if total is None:
+            return None
+        return (total + per_page - 1) // per_page if total > 0 else 0
+
     @staticmethod
     def calculate_pagination_meta(
-        total: int, page: int, per_page: int
+        total: int | None,
+        page: int,
+        per_page: int,
+        total_exact: bool = True,
+        has_next: bool | None = None,
     ) -> PaginationMeta:
         """ページネーションメタ情報を計算"""
-        pages = (total + per_page - 1) // per_page if total > 0 else 0
-        has_next = page < pages
+        pages = PaginationHelper.calculate_pages(total, per_page)
+        if has_next is None:
+            has_next = pages is not None and page < pages
         has_prev = page > 1
 
         return PaginationMeta(
@@ -27,26 +130,181 @@ class PaginationHelper:
             pages=pages,
             has_next=has_next,
             has_prev=has_prev,
+            total_exact=total_exact,
         )
 
+    @staticmethod
+    async def count_total(
+        db: AsyncSession, query: Any, mode: CountMode = CountMode.EXACT
+    ) -> tuple[int | None, bool]:
+        """総件数を取得し、(件数, 正確な値かどうか) を返す"""
+        if mode == CountMode.NONE:
+            return None, False
+
+        if mode == CountMode.ESTIMATED:
+            estimated = await PaginationHelper._estimate_count(db, query)
+            # 件数が少ない場合は正確な件数を取得してもコストが小さい
+            if estimated >= settings.pagination_exact_count_threshold:
+                return estimated, False
+
+        return await PaginationHelper._exact_count(db, query), True
+
+    @staticmethod
+    async def _exact_count(db: AsyncSession, query: Any) -> int:
+        """正確な件数を取得（検索条件ごとにTTLキャッシュ）"""
+        tables = sorted({table.name for table in find_tables(query)})
+        compiled = query.compile()
+        key = f"{compiled}|{sorted(compiled.params.items())!r}"
+
+        cached = count_cache.get(tables, key)
+        if cached is not None:
+            return cached
+
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
+
+        # 遅延のあるレプリカの件数は、プライマリへの書き込み後の無効化より
+        # 古いことがあるためキャッシュしない
+        if not is_lagging(db):
+            count_cache.set(tables, key, total)
+        return total
+
+    @staticmethod
+    async def _estimate_count(db: AsyncSession, query: Any) -> int:
+        """プランナー統計から件数を推定"""
+        tables = list({table.fullname: table for table in find_tables(query)})
+
+        # 絞り込みなしの単一テーブルは pg_class.reltuples を参照
+        # （パーティションのテーブルは親ではなく各パーティションの合計）。
+        # 一度もANALYZEされていないテーブルは -1 になるため、まだ1ページも
+        # 記録されていないものは空とみなし、それ以外は EXPLAIN で推定する
+        if query.whereclause is None and len(tables) == 1:
+            result = await db.execute(
+                text(
+                    "SELECT CASE WHEN bool_and(c.reltuples >= 0 OR c.relpages = 0) "
+                    "THEN CAST(sum(greatest(c.reltuples, 0)) AS bigint) END "
+                    "FROM pg_partition_tree(CAST(:table AS regclass)) AS t "
+                    "JOIN pg_class AS c ON c.oid = t.relid "
+                    "WHERE t.isleaf"
+                ),
+                {"table": tables[0]},
+            )
+            reltuples = result.scalar()
+            if reltuples is not None:
+                return int(reltuples)
+
+        # 絞り込みありの場合は EXPLAIN の推定行数を使用
+        dialect = db.get_bind().dialect
+        sql = query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan: Any = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def cursor_for(item: Any, keys: Sequence[Any]) -> str:
+        """アイテムのソートキーからカーソルを生成"""
+        return encode_cursor([getattr(item, key.key) for key in keys])
+
     @staticmethod
     async def paginate_query(
-        db: AsyncSession, query: Any, page: int, per_page: int
+        db: AsyncSession,
+        query: Any,
+        page: int,
+        per_page: int,
+        count_mode: CountMode = CountMode.EXACT,
     ) -> tuple[list[Any], PaginationMeta]:
         """SQLAlchemyクエリをページネーション"""
         # 総件数取得
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+        total, total_exact = await PaginationHelper.count_total(db, query, count_mode)
 
-        # ページネーション適用
+        # ページネーション適用（1件多く取得して次ページの有無を判定）
         offset = (page - 1) * per_page
-        paginated_query = query.offset(offset).limit(per_page)
+        paginated_query = query.offset(offset).limit(per_page + 1)
 
         result = await db.execute(paginated_query)
-        items = result.scalars().all()
+        items = list(result.scalars().all())
+        has_next = len(items) > per_page
 
         # メタ情報計算
-        meta = PaginationHelper.calculate_pagination_meta(total, page, per_page)
+        meta = PaginationHelper.calculate_pagination_meta(
+            total, page, per_page, total_exact=total_exact, has_next=has_next
+        )
+
+        return items[:per_page], meta
+
+    @staticmethod
+    async def paginate_keyset(
+        db: AsyncSession,
+        query: Any,
+        keys: Sequence[Any],
+        per_page: int,
+        after: str | None = None,
+        before: str | None = None,
+        descending: bool = True,
+        scalars: bool = True,
+        cursor_values: Callable[[Any], Sequence[Any]] | None = None,
+    ) -> tuple[list[Any], CursorMeta]:
+        """SQLAlchemyクエリをキーセット（カーソル）方式でページネーション
+
+        keys はソート順に並べたカラム（または型付きの式）で、末尾は一意なカラムで
+        ある必要がある。OFFSETを使わないため、ページの深さに関係なく同じコストで
+        取得できる。複数カラムを返すクエリは scalars=False とし、行からキーの値を
+        取り出す cursor_values を指定する。
+        """
+        if after is not None and before is not None:
+            raise ValidationException("Specify either 'after' or 'before', not both")
+
+        backward = before is not None
+        cursor = before if backward else after
+
+        if cursor is not None:
+            values = decode_cursor(cursor, keys)
+            row = tuple_(*keys)
+            bound = tuple_(
+                *[
+                    literal(value, key.type)
+                    for value, key in zip(values, keys, strict=True)
+                ]
+            )
+            # 先頭キー単独の比較も加え、パーティションの刈り込みに使えるようにする
+            # （行比較のままではプランナーが刈り込みに使わない）
+            lead, lead_bound = keys[0], bound.clauses[0]
+            # 逆方向（before）の場合は比較とソートを反転して取得し、後で並べ直す
+            if backward == descending:
+                query = query.where(row > bound, lead >= lead_bound)
+            else:
+                query = query.where(row < bound, lead <= lead_bound)
+
+        ascending = backward == descending
+        order_by = [key.asc() if ascending else key.desc() for key in keys]
+
+        # 1件多く取得して次ページの有無を判定
+        result = await db.execute(query.order_by(*order_by).limit(per_page + 1))
+        items = list(result.scalars().all() if scalars else result.all())
+        has_more = len(items) > per_page
+        items = items[:per_page]
+
+        if backward:
+            items.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None
+
+        def make_cursor(item: Any) -> str:
+            if cursor_values is None:
+                return PaginationHelper.cursor_for(item, keys)
+            return encode_cursor(cursor_values(item))
+
+        meta = CursorMeta(
+            per_page=per_page,
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=make_cursor(items[-1]) if has_next and items else None,
+            prev_cursor=make_cursor(items[0]) if has_prev and items else None,
+        )
 
-        return list(items), meta
+        return items, meta
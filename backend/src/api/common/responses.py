@@ -31,9 +31,20 @@ class SuccessResponse(BaseModel):
 class PaginationMeta(BaseModel):
     """ページネーションメタ情報"""
 
-    total: int = Field(..., description="総件数")
+    total: int | None = Field(..., description="総件数（count=none の場合はNone）")
     page: int = Field(..., description="現在ページ")
     per_page: int = Field(..., description="ページあたり件数")
-    pages: int = Field(..., description="総ページ数")
+    pages: int | None = Field(..., description="総ページ数")
     has_next: bool = Field(..., description="次ページ有無")
     has_prev: bool = Field(..., description="前ページ有無")
+    total_exact: bool = Field(default=True, description="総件数が正確な値かどうか")
+
+
+class CursorMeta(BaseModel):
+    """カーソルページネーションメタ情報"""
+
+    per_page: int = Field(..., description="ページあたり件数")
+    has_next: bool = Field(..., description="次ページ有無")
+    has_prev: bool = Field(..., description="前ページ有無")
+    next_cursor: str | None = Field(default=None, description="次ページ取得用カーソル")
+    prev_cursor: str | None = Field(default=None, description="前ページ取得用カーソル")
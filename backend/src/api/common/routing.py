@@ -0,0 +1,31 @@
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Request
+
+# ルートのデコレータがエンドポイントに追加するリクエスト引数の名前
+# FastAPI は Request 型の引数を1つにしか渡さないため、デコレータ間で共有する
+REQUEST_PARAM = "_route_request"
+
+
+def takes_request(endpoint: Callable[..., Any]) -> bool:
+    """エンドポイント（内側のデコレータ）がリクエスト引数を受け取るかどうか"""
+    return REQUEST_PARAM in inspect.signature(endpoint).parameters
+
+
+def add_request_param(
+    wrapper: Callable[..., Any], endpoint: Callable[..., Any]
+) -> None:
+    """FastAPI にリクエストを渡させるため、wrapper のシグネチャに引数を追加する"""
+    signature = inspect.signature(endpoint)
+    if REQUEST_PARAM not in signature.parameters:
+        signature = signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request
+                ),
+            ]
+        )
+    wrapper.__signature__ = signature  # type: ignore[attr-defined]
@@ -0,0 +1,29 @@
+import json
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+
+def serialize_json(content: Any) -> bytes:
+    """JSONResponse と同じ形式のバイト列に変換（モデルは model_dump_json で直接）"""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json(by_alias=True).encode()
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class ModelJSONResponse(Response):
+    """検証済みのモデルを再検証せずに返す JSON レスポンス
+
+    エンドポイントが Response を返すと FastAPI は response_model による検証と
+    jsonable_encoder の変換を行わないため、サービスが作成したモデルを
+    一度だけシリアライズする。response_model はドキュメント用に残すこと。
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return serialize_json(content)
@@ -0,0 +1,96 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+
+from src.core.config import settings
+from src.db.timeouts import (
+    ClientDisconnectedError,
+    QueryTimeoutError,
+    set_time_budget,
+)
+
+from .routing import REQUEST_PARAM, add_request_param, takes_request
+
+EndpointType = TypeVar("EndpointType", bound=Callable[..., Awaitable[Any]])
+
+# DB側の statement_timeout を優先させるため、asyncio 側の打ち切りは少し遅らせる
+CANCEL_GRACE = 0.5
+
+# デコレータを適用済みであることを示す属性名
+BUDGETED = "__db_time_budget__"
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """クライアントが切断するまで待つ（リクエストボディは読み込み済みであること）"""
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+def db_time_budget(
+    seconds: float | None = None,
+) -> Callable[[EndpointType], EndpointType]:
+    """ルートのDB時間予算を指定するデコレータ
+
+    予算は SET LOCAL statement_timeout として DB 側で適用する。予算を過ぎても
+    エンドポイントが終わらない場合やクライアントが切断した場合はエンドポイントを
+    キャンセルし、asyncpg に実行中のクエリをキャンセルさせる。
+    seconds を省略した場合は Settings の既定値、0 の場合は無制限。
+    """
+
+    def decorator(endpoint: EndpointType) -> EndpointType:
+        forward_request = takes_request(endpoint)
+
+        @wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = (
+                kwargs[REQUEST_PARAM] if forward_request else kwargs.pop(REQUEST_PARAM)
+            )
+            budget = settings.database_statement_timeout if seconds is None else seconds
+            set_time_budget(budget)
+
+            task = asyncio.current_task()
+            assert task is not None
+            disconnected = False
+
+            async def watch_disconnect() -> None:
+                nonlocal disconnected
+                await _wait_for_disconnect(request)
+                disconnected = True
+                task.cancel()
+
+            watcher = asyncio.create_task(watch_disconnect())
+            try:
+                async with asyncio.timeout(
+                    budget + CANCEL_GRACE if budget > 0 else None
+                ):
+                    return await endpoint(*args, **kwargs)
+            except TimeoutError as exc:
+                raise QueryTimeoutError(
+                    f"Database time budget of {budget}s exceeded"
+                ) from exc
+            except asyncio.CancelledError:
+                if not disconnected:
+                    raise
+                task.uncancel()
+                raise ClientDisconnectedError("Client disconnected") from None
+            finally:
+                watcher.cancel()
+
+        add_request_param(wrapper, endpoint)
+        setattr(wrapper, BUDGETED, True)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class DBTimeBudgetRoute(APIRoute):
+    """db_time_budget を指定していないエンドポイントに既定の予算を適用するルート"""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if not getattr(endpoint, BUDGETED, False):
+            endpoint = db_time_budget()(endpoint)
+        super().__init__(path, endpoint, **kwargs)
@@ -0,0 +1 @@
+# Debug API package
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Query, status
+
+from src.api.common.coalescing import request_flights
+from src.api.common.pagination import count_cache
+from src.api.examples.services import example_cache
+from src.core.compression import compression_stats
+from src.db.instrumentation import query_stats
+
+from .schemas import (
+    CacheStatsResponse,
+    CoalescingStatsResponse,
+    CompressionStatsResponse,
+    QuerySortKey,
+    QueryStatsResponse,
+)
+from .services import DebugService
+
+# 認証がないため、settings.debug_endpoints が有効な場合のみ main で登録する
+router = APIRouter(prefix="/api/debug", tags=["debug"], include_in_schema=False)
+
+
+@router.get("/queries", response_model=QueryStatsResponse)
+async def get_query_stats(
+    sort: QuerySortKey = Query(QuerySortKey.TOTAL_TIME, description="並び順"),  # noqa: B008
+    limit: int = Query(50, ge=1, le=500, description="取得件数"),
+) -> QueryStatsResponse:
+    """SQL文ごとの実行回数・時間・行数を取得（内部向け）"""
+    return DebugService.get_query_stats(query_stats, sort, limit)
+
+
+@router.delete("/queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_stats() -> None:
+    """SQL実行統計をリセット（内部向け）"""
+    query_stats.reset()
+
+
+@router.get("/caches", response_model=CacheStatsResponse)
+async def get_cache_stats() -> CacheStatsResponse:
+    """インメモリキャッシュのヒット率と破棄数を取得（内部向け）"""
+    return DebugService.get_cache_stats(
+        {"example": example_cache.stats(), "count": count_cache.stats()}
+    )
+
+
+@router.get("/coalescing", response_model=CoalescingStatsResponse)
+async def get_coalescing_stats() -> CoalescingStatsResponse:
+    """同一の同時リクエストをまとめた回数を取得（内部向け）"""
+    return DebugService.get_coalescing_stats(request_flights)
+
+
+@router.get("/compression", response_model=CompressionStatsResponse)
+async def get_compression_stats() -> CompressionStatsResponse:
+    """レスポンス圧縮で削減したバイト数とCPU時間を取得（内部向け）"""
+    return DebugService.get_compression_stats(compression_stats)
+
+
+@router.delete("/compression", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_compression_stats() -> None:
+    """レスポンス圧縮の統計をリセット（内部向け）"""
+    compression_stats.reset()
@@ -0,0 +1,99 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class QuerySortKey(str, Enum):
+    """SQL実行統計の並び順"""
+
+    TOTAL_TIME = "total_time"
+    MEAN_TIME = "mean_time"
+    P95_TIME = "p95_time"
+    CALLS = "calls"
+    ROWS = "rows"
+
+
+class QueryStatsItem(BaseModel):
+    """正規化したSQL文ごとの実行統計"""
+
+    statement: str = Field(..., description="リテラルとバインド値を ? にしたSQL文")
+    calls: int = Field(..., description="実行回数")
+    total_time: float = Field(..., description="合計実行時間（秒）")
+    mean_time: float = Field(..., description="平均実行時間（秒）")
+    p95_time: float = Field(..., description="直近の実行時間の95パーセンタイル（秒）")
+    max_time: float = Field(..., description="最大実行時間（秒）")
+    rows: int = Field(..., description="取得・更新した行数の合計")
+
+
+class QueryStatsResponse(BaseModel):
+    """SQL実行統計の一覧"""
+
+    items: list[QueryStatsItem] = Field(..., description="SQL文ごとの実行統計")
+    statements: int = Field(..., description="集計中のSQL文の種類数")
+    dropped: int = Field(
+        ..., description="集計対象の上限を超えたため記録しなかった実行数"
+    )
+    slow_query_threshold: float = Field(
+        ..., description="警告ログに出力する実行時間のしきい値（秒）"
+    )
+
+
+class CacheStatsItem(BaseModel):
+    """インメモリキャッシュの統計（ワーカーごと）"""
+
+    name: str = Field(..., description="キャッシュ名")
+    entries: int = Field(..., description="現在の件数")
+    max_entries: int = Field(..., description="最大件数")
+    ttl: float = Field(..., description="有効期限（秒）")
+    hits: int = Field(..., description="ヒット数")
+    misses: int = Field(..., description="ミス数（期限切れを含む）")
+    hit_ratio: float = Field(..., description="ヒット率")
+    evictions: int = Field(..., description="最大件数を超えたため破棄した件数")
+    expirations: int = Field(..., description="期限切れで破棄した件数")
+    coalesced: int = Field(
+        ..., description="同時のミスを1回の取得にまとめて待機した回数"
+    )
+
+
+class CacheStatsResponse(BaseModel):
+    """インメモリキャッシュの統計の一覧"""
+
+    items: list[CacheStatsItem] = Field(..., description="キャッシュごとの統計")
+
+
+class CoalescingStatsItem(BaseModel):
+    """ルートごとのリクエストをまとめた回数"""
+
+    name: str = Field(..., description="ルート名")
+    executions: int = Field(..., description="エンドポイントを実行した回数")
+    coalesced: int = Field(
+        ..., description="実行中の同一リクエストの結果を待って返した回数"
+    )
+    in_flight: int = Field(..., description="実行中のリクエストの種類数")
+
+
+class CoalescingStatsResponse(BaseModel):
+    """リクエストをまとめた回数の一覧"""
+
+    items: list[CoalescingStatsItem] = Field(..., description="ルートごとの統計")
+
+
+class CompressionStatsItem(BaseModel):
+    """圧縮形式ごとの圧縮量とCPU時間"""
+
+    encoding: str = Field(..., description="圧縮形式（Content-Encoding）")
+    responses: int = Field(..., description="圧縮したレスポンス数")
+    bytes_in: int = Field(..., description="圧縮前のバイト数")
+    bytes_out: int = Field(..., description="圧縮後のバイト数")
+    bytes_saved: int = Field(..., description="削減したバイト数")
+    ratio: float = Field(..., description="圧縮後のサイズの割合")
+    cpu_time: float = Field(..., description="圧縮に使ったCPU時間（秒）")
+
+
+class CompressionStatsResponse(BaseModel):
+    """レスポンス圧縮の統計"""
+
+    items: list[CompressionStatsItem] = Field(..., description="圧縮形式ごとの統計")
+    skipped: int = Field(
+        ..., description="小さい・圧縮済みなどの理由で圧縮しなかったレスポンス数"
+    )
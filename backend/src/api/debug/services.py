@@ -0,0 +1,105 @@
+from collections.abc import Mapping
+from typing import Any
+
+from src.core.cache import CacheStats, SingleFlight
+from src.core.compression import CompressionStats
+from src.core.config import settings
+from src.db.instrumentation import QueryStatsCollector
+
+from .schemas import (
+    CacheStatsItem,
+    CacheStatsResponse,
+    CoalescingStatsItem,
+    CoalescingStatsResponse,
+    CompressionStatsItem,
+    CompressionStatsResponse,
+    QuerySortKey,
+    QueryStatsItem,
+    QueryStatsResponse,
+)
+
+
+class DebugService:
+    """内部向けの診断情報サービス"""
+
+    @staticmethod
+    def get_query_stats(
+        collector: QueryStatsCollector, sort: QuerySortKey, limit: int
+    ) -> QueryStatsResponse:
+        """SQL文ごとの実行統計を sort の降順で上位 limit 件取得"""
+        items = [
+            QueryStatsItem(
+                statement=statement,
+                calls=stats.calls,
+                total_time=stats.total_time,
+                mean_time=stats.mean_time,
+                p95_time=stats.p95_time,
+                max_time=stats.max_time,
+                rows=stats.rows,
+            )
+            for statement, stats in collector.items()
+        ]
+        items.sort(key=lambda item: getattr(item, sort.value), reverse=True)
+        return QueryStatsResponse(
+            items=items[:limit],
+            statements=len(items),
+            dropped=collector.dropped,
+            slow_query_threshold=settings.database_slow_query_threshold,
+        )
+
+    @staticmethod
+    def get_cache_stats(caches: Mapping[str, CacheStats]) -> CacheStatsResponse:
+        """キャッシュごとの件数・ヒット率・破棄数を取得"""
+        return CacheStatsResponse(
+            items=[
+                CacheStatsItem(
+                    name=name,
+                    entries=stats.entries,
+                    max_entries=stats.max_entries,
+                    ttl=stats.ttl,
+                    hits=stats.hits,
+                    misses=stats.misses,
+                    hit_ratio=stats.hit_ratio,
+                    evictions=stats.evictions,
+                    expirations=stats.expirations,
+                    coalesced=stats.coalesced,
+                )
+                for name, stats in caches.items()
+            ]
+        )
+
+    @staticmethod
+    def get_coalescing_stats(
+        flights: Mapping[str, SingleFlight[Any, Any]],
+    ) -> CoalescingStatsResponse:
+        """ルートごとの実行回数とまとめた回数を取得"""
+        return CoalescingStatsResponse(
+            items=[
+                CoalescingStatsItem(
+                    name=name,
+                    executions=flight.executions,
+                    coalesced=flight.coalesced,
+                    in_flight=len(flight.keys()),
+                )
+                for name, flight in flights.items()
+            ]
+        )
+
+    @staticmethod
+    def get_compression_stats(stats: CompressionStats) -> CompressionStatsResponse:
+        """圧縮形式ごとの削減したバイト数とCPU時間を取得"""
+        return CompressionStatsResponse(
+            items=[
+                CompressionStatsItem(
+                    encoding=encoding,
+                    responses=encoding_stats.responses,
+                    bytes_in=encoding_stats.bytes_in,
+                    bytes_out=encoding_stats.bytes_out,
+                    bytes_saved=encoding_stats.bytes_saved,
+                    ratio=encoding_stats.ratio,
+                    cpu_time=encoding_stats.cpu_time,
+                )
+                for encoding, encoding_stats in stats.items()
+            ],
+            skipped=stats.skipped,
+        )
@@ -1,57 +1,203 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.db.database import get_async_session
+from src.api.common.caching import cache_response
+from src.api.common.coalescing import coalesce_requests
+from src.api.common.conditional import (
+    ETAG_HEADER,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from src.api.common.pagination import CountMode
+from src.api.common.serialization import ModelJSONResponse
+from src.api.common.timeouts import DBTimeBudgetRoute, db_time_budget
+from src.db.database import (
+    get_async_session,
+    get_async_session_maker,
+    get_read_session,
+)
 
-from .schemas import ExampleCreate, ExampleListResponse, ExampleResponse, ExampleUpdate
-from .services import ExampleService
+from .schemas import (
+    ExampleBulkCreate,
+    ExampleBulkCreateResponse,
+    ExampleBulkDelete,
+    ExampleBulkDeleteResponse,
+    ExampleBulkUpdate,
+    ExampleBulkUpdateResponse,
+    ExampleCreate,
+    ExampleListResponse,
+    ExampleOrder,
+    ExampleResponse,
+    ExampleSearchResponse,
+    ExampleUpdate,
+    ExportFormat,
+)
+from .services import RESPONSE_CACHE_NAMESPACE, ExampleService
 
-router = APIRouter(prefix="/api/examples", tags=["examples"])
+router = APIRouter(
+    prefix="/api/examples", tags=["examples"], route_class=DBTimeBudgetRoute
+)
 
 
 @router.post("/", response_model=ExampleResponse, status_code=201)
 async def create_example(
     example: ExampleCreate,
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
-) -> ExampleResponse:
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
+) -> Response:
     """新しいExampleを作成"""
-    return await ExampleService.create_example(db, example)
+    created = await ExampleService.create_example(db, example)
+    return ModelJSONResponse(created, status_code=201)
+
+
+@router.post("/bulk", response_model=ExampleBulkCreateResponse, status_code=201)
+async def bulk_create_examples(
+    request: ExampleBulkCreate,
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
+) -> Response:
+    """Exampleを一括作成"""
+    result = await ExampleService.bulk_create_examples(db, request)
+    return ModelJSONResponse(result, status_code=201)
+
+
+@router.patch("/bulk", response_model=ExampleBulkUpdateResponse)
+async def bulk_update_examples(
+    request: ExampleBulkUpdate,
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
+) -> Response:
+    """指定されたIDのExampleを一括更新"""
+    return ModelJSONResponse(await ExampleService.bulk_update_examples(db, request))
+
+
+@router.delete("/bulk", response_model=ExampleBulkDeleteResponse)
+async def bulk_delete_examples(
+    request: ExampleBulkDelete,
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
+) -> Response:
+    """指定されたIDのExampleを一括削除"""
+    return ModelJSONResponse(await ExampleService.bulk_delete_examples(db, request))
 
 
 @router.get("/", response_model=ExampleListResponse)
+@coalesce_requests()
+@cache_response(RESPONSE_CACHE_NAMESPACE)
 async def list_examples(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     search: str = Query(None),
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
-) -> ExampleListResponse:
-    """Exampleリストを取得"""
-    return await ExampleService.list_examples(db, page, per_page, search)
+    after: str | None = Query(None, description="このカーソルより後のページを取得"),
+    before: str | None = Query(None, description="このカーソルより前のページを取得"),
+    count: CountMode = Query(CountMode.EXACT, description="総件数の取得方法"),  # noqa: B008
+    order: ExampleOrder = Query(ExampleOrder.NEWEST, description="並び順"),  # noqa: B008
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_session),  # noqa: B008
+) -> Response:
+    """Exampleリストを取得
+
+    count=exact の場合は件数と最終更新日時から ETag を作成し、If-None-Match と
+    一致すればページを取得せずに 304 を返す（estimated / none では削除を検知
+    できないため ETag を付けない）。search を指定した場合は、ETag の材料の
+    取得がページ本体と同じく検索条件での走査になるため ETag を付けない
+    """
+    etag = None
+    if count == CountMode.EXACT and not search:
+        total, last_updated = await ExampleService.list_validators(db)
+        etag = make_etag(
+            page, per_page, search, after, before, order.value, total, last_updated
+        )
+        if is_not_modified(etag, if_none_match):
+            return not_modified({ETAG_HEADER: etag})
+
+    result = await ExampleService.list_examples(
+        db,
+        page,
+        per_page,
+        search,
+        after=after,
+        before=before,
+        count=count,
+        order=order,
+    )
+    return ModelJSONResponse(result, headers={ETAG_HEADER: etag} if etag else None)
+
+
+@router.get("/search", response_model=ExampleSearchResponse)
+@coalesce_requests()
+@cache_response(RESPONSE_CACHE_NAMESPACE)
+async def search_examples(
+    q: str = Query(..., min_length=1, max_length=200, description="検索クエリ"),
+    per_page: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None, description="このカーソルより後のページを取得"),
+    before: str | None = Query(None, description="このカーソルより前のページを取得"),
+    highlight: bool = Query(False, description="一致箇所のスニペットを含める"),
+    db: AsyncSession = Depends(get_read_session),  # noqa: B008
+) -> Response:
+    """name と description を全文検索"""
+    result = await ExampleService.search_examples(
+        db, q, per_page, after=after, before=before, highlight=highlight
+    )
+    return ModelJSONResponse(result)
+
+
+@router.get("/export")
+@db_time_budget(0)  # 全件の書き出しは件数に比例して時間がかかるため無制限
+async def export_examples(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="出力形式"),  # noqa: B008
+    search: str | None = Query(None),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(  # noqa: B008
+        get_async_session_maker
+    ),
+) -> StreamingResponse:
+    """Exampleを全件エクスポート（NDJSON / CSV のストリーミング）"""
+    media_type = "text/csv" if format == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        ExampleService.export_examples(session_maker, format, search),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="examples.{format.value}"'
+        },
+    )
 
 
 @router.get("/{example_id}", response_model=ExampleResponse)
 async def get_example(
     example_id: int,
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
-) -> ExampleResponse:
-    """指定されたExampleを取得"""
-    return await ExampleService.get_example(db, example_id)
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_session),  # noqa: B008
+    session_maker: async_sessionmaker[AsyncSession] = Depends(  # noqa: B008
+        get_async_session_maker
+    ),
+) -> Response:
+    """指定されたExampleを取得（ETag / Last-Modified による条件付きGETに対応）
+
+    エンティティキャッシュにない場合はプライマリ（session_maker）から読み込む
+    """
+    example = await ExampleService.get_example(db, example_id, session_maker)
+    etag = make_etag(example.id, example.updated_at.isoformat())
+    headers = validator_headers(etag, example.updated_at)
+    if is_not_modified(etag, if_none_match, example.updated_at, if_modified_since):
+        return not_modified(headers)
+    return ModelJSONResponse(example, headers=headers)
 
 
 @router.put("/{example_id}", response_model=ExampleResponse)
 async def update_example(
     example_id: int,
     example: ExampleUpdate,
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
-) -> ExampleResponse:
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
+) -> Response:
     """指定されたExampleを更新"""
-    return await ExampleService.update_example(db, example_id, example)
+    updated = await ExampleService.update_example(db, example_id, example)
+    return ModelJSONResponse(updated)
 
 
 @router.delete("/{example_id}")
 async def delete_example(
     example_id: int,
-    db: AsyncSession = Depends(get_async_session),  # noqa: B008
+    db: AsyncSession = Depends(get_async_session, scope="function"),  # noqa: B008
 ) -> dict[str, str]:
     """指定されたExampleを削除"""
     await ExampleService.delete_example(db, example_id)
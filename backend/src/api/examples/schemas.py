@@ -1,8 +1,33 @@
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
 
+class ExampleOrder(str, Enum):
+    """Exampleリストの並び順"""
+
+    NEWEST = "newest"
+    RELEVANCE = "relevance"
+
+
+class ExportFormat(str, Enum):
+    """エクスポート形式"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class BulkMode(str, Enum):
+    """一括操作のエラー時の扱い"""
+
+    # 1件でも失敗した場合は全件ロールバック
+    ATOMIC = "atomic"
+    # 失敗したアイテムのみスキップし、エラーをアイテム単位で返す
+    PARTIAL = "partial"
+
+
 class ExampleBase(BaseModel):
     """Example基底スキーマ"""
 
@@ -40,7 +65,86 @@ class ExampleListResponse(BaseModel):
     """Exampleリストレスポンス"""
 
     items: list[ExampleResponse] = Field(..., description="アイテムリスト")
-    total: int = Field(..., description="総件数")
+    total: int | None = Field(..., description="総件数（count=none の場合はNone）")
     page: int = Field(..., description="現在ページ")
     per_page: int = Field(..., description="ページあたり件数")
-    pages: int = Field(..., description="総ページ数")
+    pages: int | None = Field(..., description="総ページ数")
+    total_exact: bool = Field(default=True, description="総件数が正確な値かどうか")
+    next_cursor: str | None = Field(default=None, description="次ページ取得用カーソル")
+    prev_cursor: str | None = Field(default=None, description="前ページ取得用カーソル")
+
+
+class ExampleSearchResult(ExampleResponse):
+    """Example全文検索結果"""
+
+    rank: float = Field(..., description="検索スコア")
+    headline: str | None = Field(
+        default=None, description="一致箇所を強調したスニペット（highlight=true時）"
+    )
+
+
+class ExampleSearchResponse(BaseModel):
+    """Example全文検索レスポンス"""
+
+    items: list[ExampleSearchResult] = Field(..., description="アイテムリスト")
+    per_page: int = Field(..., description="ページあたり件数")
+    next_cursor: str | None = Field(default=None, description="次ページ取得用カーソル")
+    prev_cursor: str | None = Field(default=None, description="前ページ取得用カーソル")
+
+
+class ExampleBulkCreate(BaseModel):
+    """Example一括作成リクエスト
+
+    items の各要素は ExampleCreate として個別に検証する（partial モードで
+    アイテム単位のエラーを返すため、リクエスト全体のバリデーションにはしない）
+    """
+
+    items: list[dict[str, Any]] = Field(
+        ..., min_length=1, description="作成するアイテム（ExampleCreate形式）"
+    )
+    mode: BulkMode = Field(default=BulkMode.ATOMIC, description="エラー時の扱い")
+
+
+class BulkItemError(BaseModel):
+    """一括操作のアイテム単位のエラー"""
+
+    index: int = Field(..., description="リクエスト内のアイテム位置")
+    errors: list[dict[str, Any]] = Field(..., description="エラー内容")
+
+
+class ExampleBulkCreateResponse(BaseModel):
+    """Example一括作成レスポンス"""
+
+    items: list[ExampleResponse] = Field(..., description="作成されたアイテム")
+    created: int = Field(..., description="作成件数")
+    errors: list[BulkItemError] = Field(
+        default_factory=list, description="失敗したアイテム（partial モード）"
+    )
+
+
+class ExampleBulkUpdate(ExampleUpdate):
+    """Example一括更新リクエスト（ids の全レコードに同じ変更を適用）"""
+
+    ids: list[int] = Field(..., min_length=1, description="更新対象のID")
+
+
+class ExampleBulkUpdateResponse(BaseModel):
+    """Example一括更新レスポンス"""
+
+    items: list[ExampleResponse] = Field(..., description="更新されたアイテム")
+    updated: int = Field(..., description="更新件数")
+    missing_ids: list[int] = Field(..., description="存在しなかったID")
+
+
+class ExampleBulkDelete(BaseModel):
+    """Example一括削除リクエスト"""
+
+    ids: list[int] = Field(..., min_length=1, description="削除対象のID")
+
+
+class ExampleBulkDeleteResponse(BaseModel):
+    """Example一括削除レスポンス"""
+
+    deleted_ids: list[int] = Field(..., description="削除されたID")
+    deleted: int = Field(..., description="削除件数")
+    missing_ids: list[int] = Field(..., description="存在しなかったID")
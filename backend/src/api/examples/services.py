@@ -1,10 +1,163 @@
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
 
-from src.api.common.exceptions import NotFoundException
-from src.db.models.example import Example
+from asyncpg import PostgresError
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from .schemas import ExampleCreate, ExampleListResponse, ExampleResponse, ExampleUpdate
+from src.api.common.exceptions import NotFoundException, ValidationException
+from src.api.common.pagination import CountMode, PaginationHelper, count_cache
+from src.core.cache import EntityCache
+from src.core.config import settings
+from src.core.response_cache import response_cache
+from src.db.models.example import SEARCH_CONFIG, Example, ExampleKey
+from src.db.statements import statements
+from src.db.unit_of_work import (
+    after_commit,
+    after_commit_async,
+    commit_or_flush,
+    in_unit_of_work,
+)
+from src.db.utils import (
+    allocate_ids,
+    bulk_delete_by_ids,
+    bulk_update_by_ids,
+    copy_records,
+)
+
+from .schemas import (
+    BulkItemError,
+    BulkMode,
+    ExampleBulkCreate,
+    ExampleBulkCreateResponse,
+    ExampleBulkDelete,
+    ExampleBulkDeleteResponse,
+    ExampleBulkUpdate,
+    ExampleBulkUpdateResponse,
+    ExampleCreate,
+    ExampleListResponse,
+    ExampleOrder,
+    ExampleResponse,
+    ExampleSearchResponse,
+    ExampleSearchResult,
+    ExampleUpdate,
+    ExportFormat,
+)
+
+# カーソルページネーションのソートキー（idx_examples_created_at_id と対応）
+CURSOR_KEYS = (Example.created_at, Example.id)
+
+# 一覧のページとエクスポートで読むカラム（search_vector は含めない）
+# ORM のエンティティを作らずに行をそのまま ExampleResponse として検証する
+ROW_COLUMNS = (
+    Example.id,
+    Example.name,
+    Example.description,
+    Example.is_active,
+    Example.created_at,
+    Example.updated_at,
+)
+
+# 一括作成の書き込みのDBエラー（COPY は asyncpg の例外をそのまま送出）
+ROW_WRITE_ERRORS = (DBAPIError, PostgresError)
+
+
+def _is_row_error(exc: Exception) -> bool:
+    """行の値によるエラー（データ例外・整合性制約違反）か
+
+    SQLAlchemy の asyncpg ドライバーは一部のデータ例外を DataError に変換しないため
+    SQLSTATE のクラスで判定する。タイムアウトや接続断などはリクエスト全体の失敗。
+    examples には CHECK 制約がないため、23514 はパーティションがないことを表す。
+    """
+    sqlstate = getattr(getattr(exc, "orig", exc), "sqlstate", None) or ""
+    return sqlstate[:2] in ("22", "23") and sqlstate != "23514"
+
+
+# 頻繁に実行するクエリは構築済みのステートメントを使い回す
+PAGE_ORDER = (Example.created_at.desc(), Example.id.desc())
+# ウォームアップ用の値（検索語はトライグラムインデックスで絞り込める長さにする）
+WARMUP_PAGE_PARAMS = {"offset": 0, "limit": 1, "pattern": "%warm-up%", "search": ""}
+
+
+def _by_id(example_id: Any) -> ColumnElement[bool]:
+    """id の行の条件（example_keys の created_at で実行時にパーティションを刈り込む）"""
+    created_at = select(ExampleKey.created_at).where(ExampleKey.id == example_id)
+    return and_(
+        Example.id == example_id, Example.created_at == created_at.scalar_subquery()
+    )
+
+
+GET_EXAMPLE = statements.register(
+    "example.get",
+    select(Example).where(_by_id(bindparam("example_id"))),
+    warmup_params={"example_id": 0},
+)
+LIST_EXAMPLES_PAGE = statements.register(
+    "example.list_page",
+    select(*ROW_COLUMNS)
+    .order_by(*PAGE_ORDER)
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit")),
+    warmup_params=WARMUP_PAGE_PARAMS,
+)
+SEARCH_EXAMPLES_PAGE = statements.register(
+    "example.search_page",
+    select(*ROW_COLUMNS)
+    .where(Example.name.ilike(bindparam("pattern")))
+    .order_by(*PAGE_ORDER)
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit")),
+    warmup_params=WARMUP_PAGE_PARAMS,
+)
+RELEVANCE_EXAMPLES_PAGE = statements.register(
+    "example.relevance_page",
+    select(*ROW_COLUMNS)
+    .where(Example.name.ilike(bindparam("pattern")))
+    .order_by(func.similarity(Example.name, bindparam("search")).desc(), *PAGE_ORDER)
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit")),
+    warmup_params=WARMUP_PAGE_PARAMS,
+)
+
+# 一覧・検索のレスポンスキャッシュの名前空間（書き込みのコミット後に無効化）
+RESPONSE_CACHE_NAMESPACE: str = Example.__tablename__
+
+# ID指定の取得結果のキャッシュ（ワーカーごと、書き込みのコミット後に破棄）
+# キャッシュにない値はプライマリから読み込み、読み取りレプリカの遅延した値は
+# 登録しない（get_example の session_maker）
+example_cache: EntityCache[int, ExampleResponse] = EntityCache(
+    settings.example_cache_ttl, settings.example_cache_max_entries
+)
+
+# 行のリストをまとめて検証する（1行ずつ model_validate するより速い）
+EXAMPLE_RESPONSES = TypeAdapter(list[ExampleResponse])
+SEARCH_RESULTS = TypeAdapter(list[ExampleSearchResult])
+
+# 全文検索スニペットの強調表示設定
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20"
+
+# COPY で書き込むカラム（id は事前にシーケンスから払い出す）
+COPY_COLUMNS = ("id", "name", "description", "is_active", "created_at", "updated_at")
 
 
 class ExampleService:
@@ -14,18 +167,232 @@ class ExampleService:
     async def create_example(
         db: AsyncSession, example: ExampleCreate
     ) -> ExampleResponse:
-        """新しいExampleを作成"""
-        db_example = Example(**example.model_dump())
-        db.add(db_example)
-        await db.commit()
-        await db.refresh(db_example)
-        return ExampleResponse.model_validate(db_example)
+        """新しいExampleを作成（INSERT ... RETURNING の1文で作成後の値を取得）"""
+        stmt = insert(Example).values(**example.model_dump()).returning(Example)
+        result = await db.execute(stmt)
+        response = ExampleResponse.model_validate(result.scalar_one())
+        await commit_or_flush(db)
+        _invalidate_counts(db)
+        await _invalidate_responses(db)
+        return response
 
     @staticmethod
-    async def get_example(db: AsyncSession, example_id: int) -> ExampleResponse:
-        """指定されたExampleを取得"""
-        stmt = select(Example).where(Example.id == example_id)
-        result = await db.execute(stmt)
+    async def bulk_create_examples(
+        db: AsyncSession, request: ExampleBulkCreate
+    ) -> ExampleBulkCreateResponse:
+        """Exampleを一括作成
+
+        件数が bulk_copy_threshold 未満の場合は複数行の INSERT ... RETURNING、
+        以上の場合は COPY で書き込む。atomic モードは1件でも失敗すると全件を
+        ロールバックし、partial モードは失敗したアイテムのみをエラーとして返す。
+        """
+        ExampleService._check_bulk_size(request.items)
+
+        # アイテム単位のバリデーション
+        indexes: list[int] = []
+        rows: list[dict[str, Any]] = []
+        errors: list[BulkItemError] = []
+        now = datetime.utcnow()
+        for index, item in enumerate(request.items):
+            try:
+                example = ExampleCreate.model_validate(item)
+            except PydanticValidationError as exc:
+                errors.append(
+                    BulkItemError(
+                        index=index,
+                        errors=[
+                            dict(error)
+                            for error in exc.errors(
+                                include_url=False, include_context=False
+                            )
+                        ],
+                    )
+                )
+                continue
+            indexes.append(index)
+            rows.append({**example.model_dump(), "created_at": now, "updated_at": now})
+
+        if errors and request.mode == BulkMode.ATOMIC:
+            raise ValidationException(
+                "Invalid items", details=[error.model_dump() for error in errors]
+            )
+
+        created: list[ExampleResponse] = []
+        if rows and request.mode == BulkMode.ATOMIC:
+            try:
+                created = await ExampleService._write_examples(db, rows)
+            except ROW_WRITE_ERRORS as exc:
+                if not _is_row_error(exc):
+                    raise
+                # ロールバックはセッションの所有者（依存関係・作業単位）が行う
+                raise ValidationException("Failed to create items") from exc
+        elif rows:
+            created = await ExampleService._write_partial(db, indexes, rows, errors)
+
+        await commit_or_flush(db)
+        if created:
+            _invalidate_counts(db)
+            await _invalidate_responses(db)
+
+        return ExampleBulkCreateResponse(
+            items=created,
+            created=len(created),
+            errors=sorted(errors, key=lambda error: error.index),
+        )
+
+    @staticmethod
+    async def _write_partial(
+        db: AsyncSession,
+        indexes: list[int],
+        rows: list[dict[str, Any]],
+        errors: list[BulkItemError],
+    ) -> list[ExampleResponse]:
+        """partial モードの書き込み（失敗した行のエラーを errors に追加する）
+
+        まとめてセーブポイント内で書き込み、行の値による失敗の場合のみ半分ずつに
+        分けて書き込み直す。失敗した行が k 件の場合、1件ずつ書き込む場合の n 回に
+        対して O(k log n) 回の書き込みで失敗箇所を特定できる。
+        """
+        try:
+            async with db.begin_nested():
+                return await ExampleService._write_examples(db, rows)
+        except ROW_WRITE_ERRORS as exc:
+            if not _is_row_error(exc):
+                raise
+        if len(rows) == 1:
+            # ドライバーのメッセージ（SQLや他の行の値を含みうる）は返さない
+            errors.append(
+                BulkItemError(
+                    index=indexes[0],
+                    errors=[
+                        {
+                            "type": "database_error",
+                            "msg": "Item was rejected by the database",
+                        }
+                    ],
+                )
+            )
+            return []
+        middle = len(rows) // 2
+        return [
+            *await ExampleService._write_partial(
+                db, indexes[:middle], rows[:middle], errors
+            ),
+            *await ExampleService._write_partial(
+                db, indexes[middle:], rows[middle:], errors
+            ),
+        ]
+
+    @staticmethod
+    async def _write_examples(
+        db: AsyncSession, rows: list[dict[str, Any]]
+    ) -> list[ExampleResponse]:
+        """件数に応じて INSERT ... RETURNING と COPY を使い分けて書き込む"""
+        if len(rows) >= settings.bulk_copy_threshold:
+            return await ExampleService._copy_examples(db, rows)
+        return await ExampleService._insert_examples(db, rows)
+
+    @staticmethod
+    async def _insert_examples(
+        db: AsyncSession, rows: list[dict[str, Any]]
+    ) -> list[ExampleResponse]:
+        """複数行の INSERT ... RETURNING で書き込む"""
+        stmt = insert(Example).returning(Example, sort_by_parameter_order=True)
+        result = await db.execute(stmt, rows)
+        return EXAMPLE_RESPONSES.validate_python(result.scalars().all())
+
+    @staticmethod
+    async def _copy_examples(
+        db: AsyncSession, rows: list[dict[str, Any]]
+    ) -> list[ExampleResponse]:
+        """COPY で書き込む（RETURNING がないため id は事前に払い出す）"""
+        ids = await allocate_ids(db, Example, len(rows))
+        records = [{"id": id_, **row} for id_, row in zip(ids, rows, strict=True)]
+        await copy_records(
+            db,
+            Example,
+            COPY_COLUMNS,
+            [tuple(record[column] for column in COPY_COLUMNS) for record in records],
+        )
+        return EXAMPLE_RESPONSES.validate_python(records)
+
+    @staticmethod
+    async def bulk_update_examples(
+        db: AsyncSession, request: ExampleBulkUpdate
+    ) -> ExampleBulkUpdateResponse:
+        """指定されたIDのExampleを1文の UPDATE ... RETURNING で一括更新"""
+        ExampleService._check_bulk_size(request.ids)
+        update_data = request.model_dump(exclude_unset=True, exclude={"ids"})
+        if not update_data:
+            raise ValidationException("No fields to update")
+
+        updated, missing_ids = await bulk_update_by_ids(
+            db, Example, request.ids, update_data, keys=ExampleKey
+        )
+        items = EXAMPLE_RESPONSES.validate_python(updated)
+        await commit_or_flush(db)
+        if updated:
+            _invalidate_counts(db)
+            await _invalidate_responses(db)
+            _invalidate_examples(db, [item.id for item in items])
+
+        return ExampleBulkUpdateResponse(
+            items=items, updated=len(items), missing_ids=missing_ids
+        )
+
+    @staticmethod
+    async def bulk_delete_examples(
+        db: AsyncSession, request: ExampleBulkDelete
+    ) -> ExampleBulkDeleteResponse:
+        """指定されたIDのExampleを1文の DELETE ... RETURNING で一括削除"""
+        ExampleService._check_bulk_size(request.ids)
+        deleted_ids, missing_ids = await bulk_delete_by_ids(
+            db, Example, request.ids, keys=ExampleKey
+        )
+        await commit_or_flush(db)
+        if deleted_ids:
+            _invalidate_counts(db)
+            await _invalidate_responses(db)
+            _invalidate_examples(db, deleted_ids)
+
+        return ExampleBulkDeleteResponse(
+            deleted_ids=deleted_ids, deleted=len(deleted_ids), missing_ids=missing_ids
+        )
+
+    @staticmethod
+    def _check_bulk_size(items: Sequence[Any]) -> None:
+        """一括操作の件数上限を検証"""
+        if len(items) > settings.bulk_max_items:
+            raise ValidationException(f"Too many items (max {settings.bulk_max_items})")
+
+    @staticmethod
+    async def get_example(
+        db: AsyncSession,
+        example_id: int,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+    ) -> ExampleResponse:
+        """指定されたExampleを取得（コミット済みの値はエンティティキャッシュから返す）
+
+        db が読み取りレプリカのセッションの場合は、プライマリの session_maker を
+        渡す。キャッシュにない値はプライマリから読み込むため、書き込みの破棄の
+        後にレプリカの遅延した値を ttl の間返し続けることはない。
+        """
+        # 作業単位の中では未コミットの書き込みを読むため、キャッシュを経由しない
+        if in_unit_of_work(db) or not example_cache.enabled:
+            return await ExampleService._load_example(db, example_id)
+
+        async def load() -> ExampleResponse:
+            if session_maker is None:
+                return await ExampleService._load_example(db, example_id)
+            async with session_maker() as session:
+                return await ExampleService._load_example(session, example_id)
+
+        return await example_cache.get_or_load(example_id, load)
+
+    @staticmethod
+    async def _load_example(db: AsyncSession, example_id: int) -> ExampleResponse:
+        """指定されたExampleをDBから取得"""
+        result = await db.execute(GET_EXAMPLE, {"example_id": example_id})
         db_example = result.scalar_one_or_none()
 
         if not db_example:
@@ -33,41 +400,224 @@ class ExampleService:
 
         return ExampleResponse.model_validate(db_example)
 
+    @staticmethod
+    async def list_validators(db: AsyncSession) -> tuple[int, datetime | None]:
+        """絞り込みのない一覧の ETag の材料（正確な件数と最終更新日時）を取得
+
+        件数は count_cache、最終更新日時は idx_examples_updated_at を使うため、
+        ページ本体のクエリよりも安く再検証できる（検索条件があるとどちらも
+        インデックスで求められないため、絞り込んだ一覧には使わない）
+        """
+        total, _ = await PaginationHelper.count_total(
+            db, select(Example), CountMode.EXACT
+        )
+        last_updated = await db.scalar(select(func.max(Example.updated_at)))
+        return total or 0, last_updated
+
     @staticmethod
     async def list_examples(
         db: AsyncSession,
         page: int = 1,
         per_page: int = 10,
         search: str | None = None,
+        after: str | None = None,
+        before: str | None = None,
+        count: CountMode = CountMode.EXACT,
+        order: ExampleOrder = ExampleOrder.NEWEST,
     ) -> ExampleListResponse:
-        """Exampleリストを取得"""
+        """Exampleリストを取得
+
+        after / before を指定した場合はカーソル方式、それ以外はページ番号方式
+        """
+        # 類似度順は検索語がある場合のみ有効（カーソルは作成日時順専用）
+        by_relevance = order == ExampleOrder.RELEVANCE and bool(search)
+        if by_relevance and (after is not None or before is not None):
+            raise ValidationException(
+                "Cursor pagination is not supported with order=relevance"
+            )
+
         # ベースクエリ
-        stmt = select(Example)
+        stmt = select(*ROW_COLUMNS)
 
-        # 検索条件
+        # 検索条件（ix_examples_name_trgm のトライグラムインデックスを利用）
         if search:
             stmt = stmt.where(Example.name.ilike(f"%{search}%"))
 
-        # 総件数取得
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar() or 0
+        # 総件数取得（exact はTTLキャッシュ、estimated は統計情報から推定）
+        total, total_exact = await PaginationHelper.count_total(db, stmt, count)
+        pages = PaginationHelper.calculate_pages(total, per_page)
 
-        # ページネーション
-        offset = (page - 1) * per_page
-        stmt = stmt.offset(offset).limit(per_page).order_by(Example.created_at.desc())
+        # カーソル方式（OFFSETを使わないため深いページでも一定コスト）
+        if after is not None or before is not None:
+            examples, cursor_meta = await PaginationHelper.paginate_keyset(
+                db,
+                stmt,
+                CURSOR_KEYS,
+                per_page,
+                after=after,
+                before=before,
+                scalars=False,
+            )
+            return ExampleListResponse(
+                items=EXAMPLE_RESPONSES.validate_python(examples),
+                total=total,
+                page=page,
+                per_page=per_page,
+                pages=pages,
+                total_exact=total_exact,
+                next_cursor=cursor_meta.next_cursor,
+                prev_cursor=cursor_meta.prev_cursor,
+            )
 
-        result = await db.execute(stmt)
-        examples = result.scalars().all()
+        # ページネーション（1件多く取得して次ページの有無を判定）
+        params: dict[str, Any] = {
+            "offset": (page - 1) * per_page,
+            "limit": per_page + 1,
+        }
+        page_stmt = LIST_EXAMPLES_PAGE
+        if search:
+            page_stmt = SEARCH_EXAMPLES_PAGE
+            params["pattern"] = f"%{search}%"
+        if by_relevance:
+            page_stmt = RELEVANCE_EXAMPLES_PAGE
+            params["search"] = search
 
-        # レスポンス作成
-        items = [ExampleResponse.model_validate(example) for example in examples]
-        pages = (total + per_page - 1) // per_page
+        result = await db.execute(page_stmt, params)
+        examples = list(result.all())
+        has_next = len(examples) > per_page
+        examples = examples[:per_page]
+
+        # レスポンス作成（カーソル方式へ切り替えられるようにカーソルも返す）
+        items = EXAMPLE_RESPONSES.validate_python(examples)
+        with_cursor = bool(examples) and not by_relevance
+        next_cursor = (
+            PaginationHelper.cursor_for(examples[-1], CURSOR_KEYS)
+            if with_cursor and has_next
+            else None
+        )
+        prev_cursor = (
+            PaginationHelper.cursor_for(examples[0], CURSOR_KEYS)
+            if with_cursor and page > 1
+            else None
+        )
 
         return ExampleListResponse(
-            items=items, total=total, page=page, per_page=per_page, pages=pages
+            items=items,
+            total=total,
+            page=page,
+            per_page=per_page,
+            pages=pages,
+            total_exact=total_exact,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    @staticmethod
+    async def search_examples(
+        db: AsyncSession,
+        q: str,
+        per_page: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        highlight: bool = False,
+    ) -> ExampleSearchResponse:
+        """name と description を全文検索し、スコア順に取得"""
+        ts_query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+        rank = func.ts_rank_cd(Example.search_vector, ts_query, type_=Float).label(
+            "rank"
+        )
+
+        # ix_examples_search_vector（GIN）で一致行を絞り込み、(rank, id) でキーセット
+        stmt = select(Example, rank).where(Example.search_vector.op("@@")(ts_query))
+        rows, cursor_meta = await PaginationHelper.paginate_keyset(
+            db,
+            stmt,
+            (rank, Example.id),
+            per_page,
+            after=after,
+            before=before,
+            scalars=False,
+            cursor_values=lambda row: (row.rank, row.Example.id),
+        )
+
+        # スニペットは返却するページの行に対してのみ生成する
+        headlines: dict[int, str] = {}
+        if highlight and rows:
+            document = func.concat_ws(" ", Example.name, Example.description)
+            headline_stmt = select(
+                Example.id,
+                func.ts_headline(
+                    cast(SEARCH_CONFIG, REGCONFIG), document, ts_query, HEADLINE_OPTIONS
+                ),
+            ).where(
+                tuple_(Example.id, Example.created_at).in_(
+                    [(row.Example.id, row.Example.created_at) for row in rows]
+                )
+            )
+            headline_result = await db.execute(headline_stmt)
+            headlines = {row[0]: row[1] for row in headline_result}
+
+        # 行の値に検索スコアとスニペットを加えて1回で検証する
+        items = SEARCH_RESULTS.validate_python(
+            [
+                {
+                    **{
+                        field: getattr(row.Example, field)
+                        for field in ExampleResponse.model_fields
+                    },
+                    "rank": row.rank,
+                    "headline": headlines.get(row.Example.id),
+                }
+                for row in rows
+            ]
+        )
+
+        return ExampleSearchResponse(
+            items=items,
+            per_page=per_page,
+            next_cursor=cursor_meta.next_cursor,
+            prev_cursor=cursor_meta.prev_cursor,
         )
 
+    @staticmethod
+    async def export_examples(
+        session_maker: async_sessionmaker[AsyncSession],
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        search: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Exampleを全件エクスポート
+
+        サーバーサイドカーソルで export_batch_size 件ずつ取得してそのまま書き出すため、
+        件数に関係なくメモリ使用量は一定になる。レスポンス送信中に使うセッションは
+        この中で開き、送信完了（または切断）時に閉じる。
+        """
+        stmt = select(*ROW_COLUMNS)
+        if search:
+            stmt = stmt.where(Example.name.ilike(f"%{search}%"))
+        stmt = stmt.order_by(Example.created_at.desc(), Example.id.desc())
+
+        columns = [column.key for column in ROW_COLUMNS]
+        if export_format == ExportFormat.CSV:
+            yield _csv_lines([columns])
+
+        async with session_maker() as session:
+            result = await session.stream(
+                stmt.execution_options(yield_per=settings.export_batch_size)
+            )
+            async for rows in result.partitions():
+                if export_format == ExportFormat.CSV:
+                    yield _csv_lines(rows)
+                else:
+                    yield "".join(
+                        json.dumps(
+                            dict(zip(columns, row, strict=True)),
+                            default=_json_default,
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                        for row in rows
+                    ).encode()
+
     @staticmethod
     async def list_examples_optimized(
         db: AsyncSession,
@@ -98,7 +648,7 @@ class ExampleService:
         examples = result.scalars().all()
 
         # レスポンス作成
-        items = [ExampleResponse.model_validate(example) for example in examples]
+        items = EXAMPLE_RESPONSES.validate_python(examples)
         pages = (total + per_page - 1) // per_page
 
         return ExampleListResponse(
@@ -109,32 +659,82 @@ class ExampleService:
     async def update_example(
         db: AsyncSession, example_id: int, example: ExampleUpdate
     ) -> ExampleResponse:
-        """指定されたExampleを更新"""
-        stmt = select(Example).where(Example.id == example_id)
+        """指定されたExampleを更新（UPDATE ... RETURNING の1文で更新後の値を取得）"""
+        update_data = example.model_dump(exclude_unset=True)
+        # 更新項目がない場合は現在の値を返す（updated_at も更新しない）
+        if not update_data:
+            return await ExampleService.get_example(db, example_id)
+
+        stmt = (
+            update(Example)
+            .where(_by_id(example_id))
+            .values(**update_data)
+            .returning(Example)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
         result = await db.execute(stmt)
         db_example = result.scalar_one_or_none()
 
         if not db_example:
             raise NotFoundException("Example")
 
-        # 更新データの適用
-        update_data = example.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_example, field, value)
-
-        await db.commit()
-        await db.refresh(db_example)
-        return ExampleResponse.model_validate(db_example)
+        response = ExampleResponse.model_validate(db_example)
+        await commit_or_flush(db)
+        _invalidate_counts(db)
+        await _invalidate_responses(db)
+        _invalidate_examples(db, [example_id])
+        return response
 
     @staticmethod
     async def delete_example(db: AsyncSession, example_id: int) -> None:
-        """指定されたExampleを削除"""
-        stmt = select(Example).where(Example.id == example_id)
+        """指定されたExampleを削除（DELETE ... RETURNING で存在確認を兼ねる）"""
+        stmt = (
+            delete(Example)
+            .where(_by_id(example_id))
+            .returning(Example.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await db.execute(stmt)
-        db_example = result.scalar_one_or_none()
 
-        if not db_example:
+        if result.scalar_one_or_none() is None:
             raise NotFoundException("Example")
 
-        await db.delete(db_example)
-        await db.commit()
+        await commit_or_flush(db)
+        _invalidate_counts(db)
+        await _invalidate_responses(db)
+        _invalidate_examples(db, [example_id])
+
+
+def _invalidate_counts(db: AsyncSession) -> None:
+    """コミット後に examples の件数キャッシュを無効化"""
+    after_commit(db, lambda: count_cache.invalidate(Example.__tablename__))
+
+
+async def _invalidate_responses(db: AsyncSession) -> None:
+    """コミット後に examples のレスポンスキャッシュを無効化"""
+    await after_commit_async(
+        db, lambda: response_cache.invalidate(RESPONSE_CACHE_NAMESPACE)
+    )
+
+
+def _invalidate_examples(db: AsyncSession, example_ids: Sequence[int]) -> None:
+    """コミット後に指定したExampleのエンティティキャッシュを破棄"""
+    after_commit(db, lambda: example_cache.invalidate(*example_ids))
+
+
+def _json_default(value: Any) -> Any:
+    """JSONに変換できない値（日時）をISO 8601文字列に変換"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_lines(rows: Sequence[Sequence[Any]]) -> bytes:
+    """行をCSVとしてエンコード"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
@@ -1,9 +1,23 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .schemas import HealthResponse
+from src.api.common.serialization import ModelJSONResponse
+from src.db.database import get_async_session, named_engines
+
+from .schemas import (
+    HealthResponse,
+    HealthStatus,
+    PartitionHealthResponse,
+    PoolsStatusResponse,
+    StatementCacheResponse,
+)
 from .services import HealthService
 
 router = APIRouter(prefix="/api/health", tags=["health"])
+# 内部向けの診断エンドポイント（settings.debug_endpoints が有効な場合のみ登録）
+internal_router = APIRouter(
+    prefix="/api/health", tags=["health"], include_in_schema=False
+)
 
 
 @router.get("/", response_model=HealthResponse)
@@ -16,3 +30,39 @@ async def get_health() -> HealthResponse:
 async def get_simple_health() -> dict[str, str]:
     """シンプルなヘルスチェック（後方互換性）"""
     return {"status": "healthy"}
+
+
+@router.get(
+    "/partitions",
+    response_model=PartitionHealthResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": PartitionHealthResponse}},
+)
+async def get_partition_health(
+    db: AsyncSession = Depends(get_async_session),  # noqa: B008
+) -> Response:
+    """先の月のパーティションがあるか確認（不足している場合は 503）
+
+    パーティションを作成するプライマリで確認する。
+    """
+    result = await HealthService.get_partition_health(db)
+    return ModelJSONResponse(
+        result,
+        status_code=(
+            status.HTTP_503_SERVICE_UNAVAILABLE
+            if result.status == HealthStatus.UNHEALTHY
+            else status.HTTP_200_OK
+        ),
+    )
+
+
+@internal_router.get("/pool", response_model=PoolsStatusResponse)
+async def get_pool_status() -> PoolsStatusResponse:
+    """プライマリと読み取りレプリカの接続プールの使用状況を取得
+    （内部向け・プールサイズ調整用）"""
+    return HealthService.get_pools_status(named_engines())
+
+
+@internal_router.get("/statements", response_model=StatementCacheResponse)
+async def get_statement_cache_status() -> StatementCacheResponse:
+    """ステートメントのキャッシュ利用状況を取得（内部向け）"""
+    return HealthService.get_statement_cache_status()
@@ -8,6 +8,7 @@ class HealthStatus(str, Enum):
     """ヘルスステータス"""
 
     HEALTHY = "healthy"
+    UNHEALTHY = "unhealthy"
 
 
 class HealthResponse(BaseModel):
@@ -15,3 +16,59 @@ class HealthResponse(BaseModel):
 
     status: HealthStatus = Field(..., description="システムステータス")
     timestamp: datetime = Field(..., description="チェック時刻")
+
+
+class PoolStatusResponse(BaseModel):
+    """接続プールの使用状況"""
+
+    name: str = Field(..., description="エンジンの名前（primary / replica-N）")
+    url: str = Field(..., description="接続先（パスワードは伏せる）")
+    pool_class: str = Field(..., description="プールの実装クラス")
+    size: int = Field(..., description="常時保持する接続数（pool_size）")
+    checked_out: int = Field(..., description="使用中の接続数")
+    checked_in: int = Field(..., description="待機中の接続数")
+    overflow: int = Field(..., description="pool_size を超えて作成された接続数")
+    timeout: float = Field(..., description="接続取得のタイムアウト秒数")
+    checkouts: int = Field(..., description="接続取得の累計回数")
+    timeouts: int = Field(..., description="接続取得がタイムアウトした累計回数")
+    average_wait_time: float = Field(..., description="接続取得の平均待ち時間（秒）")
+    max_wait_time: float = Field(..., description="接続取得の最大待ち時間（秒）")
+
+
+class PoolsStatusResponse(BaseModel):
+    """プライマリと読み取りレプリカの接続プールの使用状況"""
+
+    pools: list[PoolStatusResponse] = Field(..., description="エンジンごとの状況")
+
+
+class StatementCacheResponse(BaseModel):
+    """ステートメントのキャッシュ利用状況"""
+
+    registered: list[str] = Field(..., description="構築済みステートメントの名前")
+    hits: int = Field(..., description="コンパイルキャッシュのヒット数")
+    misses: int = Field(..., description="コンパイルキャッシュのミス数")
+    uncached: int = Field(..., description="キャッシュ対象外の実行数")
+    hit_ratio: float = Field(..., description="コンパイルキャッシュのヒット率")
+    query_cache_size: int = Field(..., description="コンパイルキャッシュの件数上限")
+    prepared_statement_cache_size: int = Field(
+        ..., description="asyncpg のプリペアドステートメントキャッシュの件数上限"
+    )
+
+
+class PartitionCoverage(BaseModel):
+    """範囲パーティションのテーブルの、先の月のパーティションの状況"""
+
+    table: str = Field(..., description="テーブル名")
+    months_ahead: int | None = Field(
+        ...,
+        description="最も新しいパーティションが現在の月の何か月先か"
+        "（パーティションがない場合は null）",
+    )
+
+
+class PartitionHealthResponse(BaseModel):
+    """パーティションのヘルスチェックレスポンス"""
+
+    status: HealthStatus = Field(..., description="パーティションのステータス")
+    min_months_ahead: int = Field(..., description="正常とする先の月数の下限")
+    tables: list[PartitionCoverage] = Field(..., description="テーブルごとの状況")
@@ -1,6 +1,24 @@
+from collections.abc import Sequence
 from datetime import datetime
 
-from .schemas import HealthResponse, HealthStatus
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import Pool, QueuePool
+
+from src.core.config import settings
+from src.db.database import Base
+from src.db.partitions import MIN_MONTHS_AHEAD, partition_coverage, uncovered_tables
+from src.db.pool import InstrumentedAsyncQueuePool, PoolTelemetry
+from src.db.statements import compile_cache_stats, statements
+
+from .schemas import (
+    HealthResponse,
+    HealthStatus,
+    PartitionCoverage,
+    PartitionHealthResponse,
+    PoolsStatusResponse,
+    PoolStatusResponse,
+    StatementCacheResponse,
+)
 
 
 class HealthService:
@@ -13,3 +31,94 @@ class HealthService:
             status=HealthStatus.HEALTHY,
             timestamp=datetime.now(),
         )
+
+    @staticmethod
+    async def get_partition_health(db: AsyncSession) -> PartitionHealthResponse:
+        """範囲パーティションのテーブルに先の月のパーティションがあるか確認
+
+        いずれかのテーブルで MIN_MONTHS_AHEAD か月先までのパーティションがない
+        場合は、保守が止まっているとして UNHEALTHY とする。
+        """
+        conn = await db.connection()
+        coverage = await conn.run_sync(partition_coverage, Base.metadata)
+        return PartitionHealthResponse(
+            status=(
+                HealthStatus.UNHEALTHY
+                if uncovered_tables(coverage)
+                else HealthStatus.HEALTHY
+            ),
+            min_months_ahead=MIN_MONTHS_AHEAD,
+            tables=[
+                PartitionCoverage(table=table, months_ahead=months)
+                for table, months in coverage.items()
+            ],
+        )
+
+    @staticmethod
+    def get_pools_status(
+        engines: Sequence[tuple[str, AsyncEngine]],
+    ) -> PoolsStatusResponse:
+        """名前付きのエンジンごとに接続プールの使用状況を取得"""
+        return PoolsStatusResponse(
+            pools=[
+                HealthService.get_pool_status(
+                    target.pool,
+                    name=name,
+                    url=target.url.render_as_string(hide_password=True),
+                )
+                for name, target in engines
+            ]
+        )
+
+    @staticmethod
+    def get_pool_status(
+        pool: Pool, name: str = "primary", url: str = ""
+    ) -> PoolStatusResponse:
+        """接続プールの現在の使用状況と接続取得待ちの集計を取得"""
+        if isinstance(pool, QueuePool):
+            size = pool.size()
+            checked_out = pool.checkedout()
+            checked_in = pool.checkedin()
+            # 未作成の常時接続分は負の値になるため0に丸める
+            overflow = max(pool.overflow(), 0)
+            timeout = pool.timeout()
+        else:
+            # NullPool（transaction モードのプーラー利用時）は接続を保持しない
+            size = checked_out = checked_in = overflow = 0
+            timeout = 0.0
+        # 待ち時間の集計はプールごと（NullPool は集計しない）
+        telemetry = (
+            pool.telemetry
+            if isinstance(pool, InstrumentedAsyncQueuePool)
+            else PoolTelemetry()
+        )
+
+        return PoolStatusResponse(
+            name=name,
+            url=url,
+            pool_class=type(pool).__name__,
+            size=size,
+            checked_out=checked_out,
+            checked_in=checked_in,
+            overflow=overflow,
+            timeout=timeout,
+            checkouts=telemetry.checkouts,
+            timeouts=telemetry.timeouts,
+            average_wait_time=telemetry.average_wait_time,
+            max_wait_time=telemetry.max_wait_time,
+        )
+
+    @staticmethod
+    def get_statement_cache_status() -> StatementCacheResponse:
+        """構築済みステートメントとコンパイルキャッシュの利用状況を取得"""
+        return StatementCacheResponse(
+            registered=statements.names(),
+            hits=compile_cache_stats.hits,
+            misses=compile_cache_stats.misses,
+            uncached=compile_cache_stats.uncached,
+            hit_ratio=compile_cache_stats.hit_ratio,
+            query_cache_size=settings.database_query_cache_size,
+            prepared_statement_cache_size=(
+                settings.database_prepared_statement_cache_size
+            ),
+        )
@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, replace
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """キャッシュの件数とヒット率などの統計"""
+
+    entries: int
+    max_entries: int
+    ttl: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    coalesced: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """有効期限と最大件数を持つインメモリキャッシュ
+
+    最大件数を超えた場合は最も古く使われたエントリから破棄する。
+    ttl が0以下の場合はキャッシュを無効化する。
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # 最大件数を超えたため破棄した件数と、期限切れで破棄した件数
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: K) -> V | None:
+        """キャッシュから値を取得（期限切れ・未登録はNone）"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            self.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """キャッシュに値を登録（ttl を指定した場合はこのエントリのみ有効期限を変更）"""
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """指定キーを破棄"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """全エントリを破棄し、統計もリセット"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            entries=len(self._entries),
+            max_entries=self.max_entries,
+            ttl=self.ttl,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight(Generic[K, V]):
+    """同じキーに対する同時の呼び出しをまとめ、1回だけ実行する
+
+    実行中のキーを呼び出した場合は新たに実行せず、先行する呼び出しの結果
+    （例外を含む）を待って返す。先行する呼び出しがキャンセルされた場合は、
+    待機していた呼び出しが改めて実行する。
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[K, asyncio.Future[V]] = {}
+        # 実際に実行した回数と、先行する呼び出しの結果を待って返した回数
+        self.executions = 0
+        self.coalesced = 0
+
+    def in_flight(self, key: K) -> bool:
+        return key in self._flights
+
+    def keys(self) -> list[K]:
+        """実行中のキー"""
+        return list(self._flights)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        while (flight := self._flights.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                # 待機側のキャンセルが先行する呼び出しに波及しないよう shield する
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+
+        flight = asyncio.get_running_loop().create_future()
+        # 待機している呼び出しがない場合も例外の未取得の警告を出さない
+        flight.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._flights[key] = flight
+        self.executions += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        finally:
+            del self._flights[key]
+        flight.set_result(value)
+        return value
+
+
+class EntityCache(Generic[K, V]):
+    """IDで引くエンティティの読み取りスルーキャッシュ（LRU + TTL）
+
+    キャッシュにない場合は loader で取得して登録する。同じキーの取得が
+    同時に発生した場合は1回の取得にまとめる。書き込み後は invalidate で
+    破棄する。取得中に破棄されたキーは、取得した値が書き込み前の可能性が
+    あるため登録しない。
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._cache: TTLCache[K, V] = TTLCache(ttl, max_entries)
+        self._flights: SingleFlight[K, V] = SingleFlight()
+        self._invalidated: set[K] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """キャッシュから取得し、ない場合は loader で取得して登録"""
+        if not self.enabled:
+            return await loader()
+
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        return await self._flights.do(key, lambda: self._load(key, loader))
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        try:
+            value = await loader()
+        finally:
+            invalidated = key in self._invalidated
+            self._invalidated.discard(key)
+        if not invalidated:
+            self._cache.set(key, value)
+        return value
+
+    def invalidate(self, *keys: K) -> None:
+        """指定キーを破棄（取得中のキーは取得後に登録しない）"""
+        for key in keys:
+            self._cache.invalidate(key)
+            if self._flights.in_flight(key):
+                self._invalidated.add(key)
+
+    def clear(self) -> None:
+        """全エントリを破棄し、統計もリセット"""
+        self._cache.clear()
+        self._flights.coalesced = 0
+        self._invalidated.update(self._flights.keys())
+
+    def stats(self) -> CacheStats:
+        return replace(self._cache.stats(), coalesced=self._flights.coalesced)
+
+    def __len__(self) -> int:
+        return len(self._cache)
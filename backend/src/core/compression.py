@@ -0,0 +1,345 @@
+import importlib.util
+import logging
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 圧縮する Content-Type（画像・アーカイブなど圧縮済みの形式は対象外）
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+class Compressor(ABC):
+    """1レスポンス分の圧縮器"""
+
+    encoding: ClassVar[str]
+    # 必要な追加のモジュール（標準ライブラリのみの場合は None）
+    module: ClassVar[str | None] = None
+
+    @classmethod
+    def available(cls) -> bool:
+        return cls.module is None or importlib.util.find_spec(cls.module) is not None
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """ここまでの入力をクライアントが復元できるように出力（ストリーミング用）"""
+
+    @abstractmethod
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor(Compressor):
+    encoding = "gzip"
+
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(
+            settings.compression_gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor(Compressor):
+    encoding = "br"
+    module = "brotli"
+
+    def __init__(self) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(
+            quality=settings.compression_brotli_quality
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        output: bytes = self._compressor.process(data)
+        return output
+
+    def flush(self) -> bytes:
+        output: bytes = self._compressor.flush()
+        return output
+
+    def finish(self) -> bytes:
+        output: bytes = self._compressor.finish()
+        return output
+
+
+class ZstdCompressor(Compressor):
+    encoding = "zstd"
+    module = "zstandard"
+
+    def __init__(self) -> None:
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(
+            level=settings.compression_zstd_level
+        ).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        output: bytes = self._compressor.compress(data)
+        return output
+
+    def flush(self) -> bytes:
+        output: bytes = self._compressor.flush(self._flush_block)
+        return output
+
+    def finish(self) -> bytes:
+        output: bytes = self._compressor.flush()
+        return output
+
+
+COMPRESSORS: dict[str, type[Compressor]] = {
+    compressor.encoding: compressor
+    for compressor in (GzipCompressor, BrotliCompressor, ZstdCompressor)
+}
+
+
+def available_encodings(encodings: Sequence[str]) -> list[str]:
+    """設定された順（優先順）のうち、利用できる圧縮形式"""
+    available = []
+    for encoding in encodings:
+        compressor = COMPRESSORS.get(encoding)
+        if compressor is None:
+            logger.warning(f"Unknown compression encoding: {encoding}")
+        elif not compressor.available():
+            logger.info(f"Compression encoding {encoding} requires {compressor.module}")
+        else:
+            available.append(encoding)
+    return available
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """Accept-Encoding の q 値が最も高い圧縮形式（同じ場合は encodings の順）"""
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+@dataclass
+class EncodingStats:
+    """圧縮形式ごとの圧縮量とCPU時間"""
+
+    responses: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_time: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def ratio(self) -> float:
+        """圧縮後のサイズの割合（小さいほど効果が大きい）"""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+
+class CompressionStats:
+    """圧縮したレスポンスの集計（ワーカーごと）"""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def get(self, encoding: str) -> EncodingStats:
+        stats = self._encodings.get(encoding)
+        if stats is None:
+            stats = self._encodings[encoding] = EncodingStats()
+        return stats
+
+    def items(self) -> list[tuple[str, EncodingStats]]:
+        return list(self._encodings.items())
+
+    def reset(self) -> None:
+        self._encodings: dict[str, EncodingStats] = {}
+        # 小さい・圧縮済みなどの理由で圧縮しなかったレスポンス数
+        self.skipped = 0
+
+
+compression_stats = CompressionStats()
+
+
+class CompressionMiddleware:
+    """Accept-Encoding に応じてレスポンスを圧縮する ASGI ミドルウェア
+
+    本文が1回で送られるレスポンスは minimum_size 未満なら圧縮しない。
+    StreamingResponse は本文の断片ごとに圧縮してフラッシュするため、全体を
+    バッファリングせずに送信する（Content-Length のない場合はサイズを判定しない）。
+    Content-Encoding が設定済みのレスポンスと、圧縮対象外の Content-Type は
+    そのまま返す。
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        encodings: Sequence[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = (
+            settings.compression_minimum_size if minimum_size is None else minimum_size
+        )
+        self.encodings = available_encodings(
+            settings.compression_encodings if encodings is None else encodings
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """1リクエスト分の圧縮の状態（開始メッセージは本文の最初の断片まで保留）"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if self._passthrough:
+            await self._send(message)
+            return
+        if message["type"] != "http.response.body":
+            # http.response.pathsend などの本文以外の送信はそのまま返す
+            if self._start is not None:
+                self._passthrough = True
+                await self._send(self._start)
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._compressor is not None:
+            await self._send_compressed(body, more_body)
+            return
+
+        start, self._start = self._start, None
+        assert start is not None
+        if not self._should_compress(start, body, more_body):
+            compression_stats.skipped += 1
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._compressor = COMPRESSORS[self.encoding]()
+        self.stats = compression_stats.get(self.encoding)
+        self.stats.responses += 1
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # 圧縮後は別の表現になるため、強い ETag は弱い ETag にする
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(start)
+            await self._send_compressed(body, more_body=True)
+            return
+
+        data = self._compress(body, more_body=False)
+        headers["Content-Length"] = str(len(data))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": data})
+
+    def _should_compress(self, start: Message, body: bytes, more_body: bool) -> bool:
+        status = start["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+        if not more_body:
+            return len(body) >= self.minimum_size
+        content_length = headers.get("content-length")
+        return content_length is None or int(content_length) >= self.minimum_size
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        assert self._compressor is not None
+        start_time = time.thread_time()
+        data = self._compressor.compress(body)
+        data += self._compressor.flush() if more_body else self._compressor.finish()
+        self.stats.cpu_time += time.thread_time() - start_time
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(data)
+        return data
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        message: dict[str, Any] = {
+            "type": "http.response.body",
+            "body": self._compress(body, more_body),
+            "more_body": more_body,
+        }
+        await self._send(message)
@@ -5,54 +5,132 @@ from typing import Any
 
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.db.instrumentation import check_request_queries, count_request_queries
+from src.db.timeouts import ClientDisconnectedError, is_query_timeout
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """統一エラーハンドラーミドルウェア"""
+class ErrorHandlerMiddleware:
+    """統一エラーハンドラーミドルウェア
+
+    レスポンスの送信を開始する前の例外をエラーの JSON に変換する。送信を開始した
+    後の例外は変換できないため、そのまま送出する。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
         try:
-            response = await call_next(request)
-            return response
-        except HTTPException as exc:
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    "error": True,
-                    "message": exc.detail,
-                    "timestamp": datetime.now().isoformat(),
-                    "path": str(request.url),
-                },
-            )
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            logger.error(f"Unhandled exception: {exc}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": True,
-                    "message": "Internal server error",
-                    "timestamp": datetime.now().isoformat(),
-                    "path": str(request.url),
-                },
+            if response_started:
+                raise
+            response = self.handle_exception(Request(scope), exc)
+            await response(scope, receive, send)
+
+    def handle_exception(self, request: Request, exc: Exception) -> Response:
+        """例外をエラーレスポンスに変換"""
+        if isinstance(exc, HTTPException):
+            return self._error_response(request, exc.status_code, exc.detail)
+        if isinstance(exc, ClientDisconnectedError):
+            # 応答を受け取る相手がいないため、ログのみ残す（nginx の 499 に相当）
+            logger.info(f"Client disconnected: {request.method} {request.url}")
+            return JSONResponse(status_code=499, content={"error": True})
+        if isinstance(exc, PoolTimeoutError):
+            logger.warning(f"Database connection pool exhausted: {exc}")
+            return self._error_response(
+                request, 503, "Database connection pool exhausted"
             )
+        if is_query_timeout(exc):
+            logger.warning(f"Database query timed out: {exc}")
+            return self._error_response(request, 504, "Database query timed out")
+        logger.error(f"Unhandled exception: {exc}", exc_info=exc)
+        return self._error_response(request, 500, "Internal server error")
+
+    @staticmethod
+    def _error_response(request: Request, status_code: int, message: Any) -> Response:
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": True,
+                "message": message,
+                "timestamp": datetime.now().isoformat(),
+                "path": str(request.url),
+            },
+        )
+
 
+class QueryCounterMiddleware:
+    """リクエストごとのSQL文の件数とDB時間を集計し、予算超過と N+1 を検出
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """リクエスト/レスポンスログミドルウェア"""
+    判定はレスポンスの送信開始時に行うため、ストリーミングレスポンスの本文の
+    送信中に実行したSQL文は判定に含まれない。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.debug(
+                    f"Queries: {counter.statements} statements - "
+                    f"{counter.total_time:.3f}s"
+                )
+                check_request_queries(counter, f"{scope['method']} {scope['path']}")
+            await send(message)
+
+        with count_request_queries() as counter:
+            await self.app(scope, receive, send_wrapper)
+
+
+class LoggingMiddleware:
+    """リクエスト/レスポンスログミドルウェア
+
+    処理時間はレスポンスの送信開始（ステータスとヘッダーの送信）までの時間。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
         start_time = time.time()
 
         # リクエストログ
+        request = Request(scope)
         logger.info(f"Request: {request.method} {request.url}")
 
-        response = await call_next(request)
-
-        # レスポンスログ
-        process_time = time.time() - start_time
-        logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # レスポンスログ
+                process_time = time.time() - start_time
+                logger.info(f"Response: {message['status']} - {process_time:.3f}s")
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
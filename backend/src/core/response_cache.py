@@ -0,0 +1,192 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheBackendType(str, Enum):
+    """レスポンスキャッシュの保存先"""
+
+    # ワーカーごとのメモリ（無効化は同じワーカーにのみ反映される）
+    MEMORY = "memory"
+    # Redis（Redis プロトコル互換のサーバー、全ワーカーで共有）
+    REDIS = "redis"
+    # キャッシュしない
+    NONE = "none"
+
+
+class ResponseCacheBackend(ABC):
+    """レスポンスのバイト列と、名前空間ごとのバージョン番号の保存先"""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def get_version(self, namespace: str) -> int: ...
+
+    @abstractmethod
+    async def bump_version(self, namespace: str) -> None: ...
+
+    async def close(self) -> None:  # noqa: B027
+        """接続などを閉じる（アプリケーションの終了時）"""
+
+
+class NullBackend(ResponseCacheBackend):
+    """何も保存しないバックエンド"""
+
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    async def get_version(self, namespace: str) -> int:
+        return 0
+
+    async def bump_version(self, namespace: str) -> None:
+        pass
+
+
+class MemoryBackend(ResponseCacheBackend):
+    """ワーカーごとのメモリに保存するバックエンド（件数の上限を超えたら古い順に破棄）"""
+
+    def __init__(self, max_entries: int) -> None:
+        # 有効期限はエントリごとに set で指定する
+        self._entries: TTLCache[str, bytes] = TTLCache(float("inf"), max_entries)
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def get_version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    async def bump_version(self, namespace: str) -> None:
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+
+class RedisBackend(ResponseCacheBackend):
+    """Redis に保存するバックエンド（redis パッケージの redis.asyncio.Redis を使う）
+
+    バージョン番号のキーには有効期限を付けない。再起動や退避でキーが失われた
+    場合に、古いバージョンのエントリを再び参照しないよう現在時刻で初期化する。
+    """
+
+    def __init__(self, client: "Redis", prefix: str = "") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self.client.get(self.prefix + key)
+        # decode_responses=True のクライアントでは str が返る
+        return value.encode() if isinstance(value, str) else value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    async def get_version(self, namespace: str) -> int:
+        key = self._version_key(namespace)
+        value = await self.client.get(key)
+        if value is None:
+            await self._init_version(key)
+            value = await self.client.get(key)
+        if value is None:
+            # 初期化の直後に退避された場合（キャッシュのミスとして扱われる）
+            raise LookupError(f"Response cache version key is missing: {key}")
+        return int(value)
+
+    async def bump_version(self, namespace: str) -> None:
+        key = self._version_key(namespace)
+        await self._init_version(key)
+        await self.client.incr(key)
+
+    async def _init_version(self, key: str) -> None:
+        await self.client.set(key, time.time_ns(), nx=True)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}version:{namespace}"
+
+
+class ResponseCache:
+    """名前空間のバージョン番号で無効化するレスポンスキャッシュ
+
+    キーに名前空間の現在のバージョン番号を含め、書き込み時はバージョン番号を
+    上げるだけで古いキーを参照しなくなる（古いエントリは有効期限で消える）。
+    保存先のエラーはキャッシュのミスとして扱い、リクエストは失敗させない。
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and not isinstance(self.backend, NullBackend)
+
+    async def lookup(self, namespace: str, key: str) -> tuple[str, bytes | None]:
+        """現在のバージョンのキーと、キャッシュされたレスポンス（ない場合はNone）"""
+        try:
+            version = await self.backend.get_version(namespace)
+            versioned_key = f"{namespace}:{version}:{key}"
+            return versioned_key, await self.backend.get(versioned_key)
+        except Exception as exc:
+            logger.warning(f"Response cache lookup failed: {exc}")
+            return "", None
+
+    async def store(self, versioned_key: str, body: bytes, ttl: float | None) -> None:
+        """lookup で取得したキーにレスポンスを保存"""
+        if not versioned_key:
+            return
+        try:
+            await self.backend.set(versioned_key, body, ttl or self.ttl)
+        except Exception as exc:
+            logger.warning(f"Response cache store failed: {exc}")
+
+    async def invalidate(self, namespace: str) -> None:
+        """名前空間のバージョン番号を上げ、キャッシュされたレスポンスを無効化"""
+        try:
+            await self.backend.bump_version(namespace)
+        except Exception as exc:
+            # 無効化できなかったエントリは有効期限まで返される
+            logger.warning(f"Response cache invalidation failed for {namespace}: {exc}")
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+def create_backend(backend_type: ResponseCacheBackendType) -> ResponseCacheBackend:
+    """設定に応じたバックエンドを作成（Redis への接続は最初のコマンドまで行わない）"""
+    if backend_type == ResponseCacheBackendType.REDIS:
+        from redis.asyncio import Redis
+
+        return RedisBackend(
+            Redis.from_url(settings.response_cache_redis_url),
+            prefix=settings.response_cache_key_prefix,
+        )
+    if backend_type == ResponseCacheBackendType.MEMORY:
+        return MemoryBackend(settings.response_cache_max_entries)
+    return NullBackend()
+
+
+response_cache = ResponseCache(
+    create_backend(ResponseCacheBackendType(settings.response_cache_backend)),
+    settings.response_cache_ttl,
+)
@@ -0,0 +1,231 @@
+import logging
+import re
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# conn.info のキー（実行開始時刻のスタック）
+QUERY_START = "query_start"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+# asyncpg のプレースホルダは型のキャストを伴う（$1::TIMESTAMP WITHOUT TIME ZONE など）
+_PLACEHOLDER = re.compile(
+    r"\$\d+(?:::\w+(?: WITH(?:OUT)? TIME ZONE| VARYING| PRECISION)?(?:\[\])?)?"
+    r"|%\(\w+\)s|\?"
+)
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# 現在のリクエストで実行したSQL文の集計（リクエスト外では None）
+_request_queries: ContextVar["RequestQueryCounter | None"] = ContextVar(
+    "request_queries", default=None
+)
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """SQL文からリテラルとバインド値を取り除き、同じ形の文を1つにまとめる
+
+    文字列・数値のリテラルとプレースホルダは ? に置き換え、IN の要素は件数に
+    よらず (?, ...) にまとめる。
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (?, ...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class StatementStats:
+    """正規化したSQL文ごとの実行統計"""
+
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    # p95 の算出に使う直近の実行時間
+    samples: deque[float] = field(default_factory=deque)
+
+    def record(self, duration: float, rows: int, sample_size: int) -> None:
+        self.calls += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.rows += rows
+        if len(self.samples) >= sample_size:
+            self.samples.popleft()
+        self.samples.append(duration)
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def p95_time(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+
+class QueryStatsCollector:
+    """SQL文ごとの実行回数・時間・行数をメモリ上で集計
+
+    集計する文の種類は max_statements 件までとし、超えた分は dropped に数える。
+    """
+
+    def __init__(self, max_statements: int, sample_size: int) -> None:
+        self.max_statements = max_statements
+        self.sample_size = sample_size
+        self.reset()
+
+    def record(self, statement: str, duration: float, rows: int) -> None:
+        key = normalize_sql(statement)
+        stats = self._statements.get(key)
+        if stats is None:
+            if len(self._statements) >= self.max_statements:
+                self.dropped += 1
+                return
+            stats = self._statements[key] = StatementStats()
+        stats.record(duration, rows, self.sample_size)
+
+    def items(self) -> list[tuple[str, StatementStats]]:
+        return list(self._statements.items())
+
+    def reset(self) -> None:
+        self._statements: dict[str, StatementStats] = {}
+        self.dropped = 0
+
+
+class QueryBudgetExceededError(Exception):
+    """1リクエストで実行したSQL文が予算を超えた"""
+
+
+@dataclass
+class RequestQueryCounter:
+    """1リクエストで実行したSQL文の件数・DB時間・文ごとの回数"""
+
+    statements: int = 0
+    total_time: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """正規化済みのSQL文を1回分記録"""
+        self.statements += 1
+        self.total_time += duration
+        self.shapes[statement] += 1
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        """最も多く繰り返された文とその回数"""
+        most_common = self.shapes.most_common(1)
+        return most_common[0] if most_common else None
+
+    def violations(self) -> list[str]:
+        """文の件数の予算と同じ文の繰り返し（N+1）の上限を超えた内容"""
+        problems = []
+        budget = settings.database_request_statement_budget
+        if budget > 0 and self.statements > budget:
+            problems.append(f"{self.statements} statements (budget {budget})")
+        limit = settings.database_request_repeated_statement_limit
+        repeated = self.most_repeated()
+        if limit > 0 and repeated is not None and repeated[1] >= limit:
+            statement, count = repeated
+            problems.append(f"same statement repeated {count} times: {statement}")
+        return problems
+
+
+@contextmanager
+def count_request_queries() -> Iterator[RequestQueryCounter]:
+    """ブロック内（とそこから起動したタスク）で実行したSQL文を数える"""
+    counter = RequestQueryCounter()
+    token = _request_queries.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_queries.reset(token)
+
+
+def check_request_queries(counter: RequestQueryCounter, label: str) -> None:
+    """予算超過や N+1 の疑いを警告ログに出力（strict の場合は例外）"""
+    problems = counter.violations()
+    if not problems:
+        return
+    message = f"Query budget exceeded for {label}: " + "; ".join(problems)
+    if settings.database_query_budget_strict:
+        raise QueryBudgetExceededError(message)
+    logger.warning(message)
+
+
+query_stats = QueryStatsCollector(
+    settings.database_query_stats_max_statements,
+    settings.database_query_stats_sample_size,
+)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault(QUERY_START, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    starts = conn.info.get(QUERY_START)
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+    rows = max(getattr(cursor, "rowcount", -1), 0)
+    query_stats.record(statement, duration, rows)
+    counter = _request_queries.get()
+    if counter is not None:
+        counter.record(normalize_sql(statement), duration)
+
+    threshold = settings.database_slow_query_threshold
+    if threshold > 0 and duration >= threshold:
+        # バインド値には個人情報などが含まれ得るため、件数のみ出力する
+        parameter_count = len(parameters) if parameters else 0
+        logger.warning(
+            f"Slow query ({duration:.3f}s, {rows} rows, "
+            f"{parameter_count} parameters redacted): {normalize_sql(statement)}"
+        )
+
+
+def _handle_error(context: Any) -> None:
+    # 失敗した実行の開始時刻を取り除く
+    conn = context.connection
+    if conn is not None and conn.info.get(QUERY_START):
+        conn.info[QUERY_START].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """エンジンで実行されたSQL文の統計を query_stats と実行中のリクエストの集計に
+    記録し、遅い文をログに出力"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
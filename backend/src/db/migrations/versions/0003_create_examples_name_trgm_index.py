@@ -0,0 +1,30 @@
+"""Add trigram index to examples
+
+Revision ID: 39ec3ca3c5cf
+Revises: fa69feb049fd
+Create Date: 2026-10-16 10:04:17.552930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39ec3ca3c5cf'
+down_revision: Union[str, Sequence[str], None] = 'fa69feb049fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_examples_name_trgm', 'examples', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 拡張は他のオブジェクトが利用している可能性があるため削除しない
+    op.drop_index('ix_examples_name_trgm', table_name='examples', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
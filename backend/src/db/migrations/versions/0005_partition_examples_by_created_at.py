@@ -0,0 +1,249 @@
+"""Partition examples by created_at (monthly)
+
+Revision ID: 7c3d9a1e5b42
+Revises: bf57ba00e0c0
+Create Date: 2026-10-16 15:02:41.318204
+
+"""
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3d9a1e5b42'
+down_revision: Union[str, Sequence[str], None] = 'bf57ba00e0c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, name, description, is_active, created_at, updated_at"
+
+SEARCH_VECTOR = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(description, ''))"
+)
+
+# 既存の行を新しいテーブルへコピーする1文あたりの行数
+COPY_BATCH_SIZE = 10000
+
+# 現在の月に加えて作成しておく月数（DATABASE_PARTITION_MONTHS_AHEAD の既定値）
+# 以降の月は python -m src.script.partition_maintenance が作成する
+MONTHS_AHEAD = 3
+
+# パーティション単位の TRUNCATE で対応表のキーを削除するトリガー関数
+# （親テーブルの TRUNCATE トリガーはパーティションを直接 TRUNCATE すると
+# 実行されないため、src/db/partitions.py がパーティションごとに作成する）
+# 引数: 対応表, パーティションキーの列, パーティションの範囲の下限, 上限
+PARTITION_KEYS_FUNCTION = """
+CREATE OR REPLACE FUNCTION delete_partition_keys() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    EXECUTE format('DELETE FROM %I WHERE %I >= $1 AND %I < $2',
+                   TG_ARGV[0], TG_ARGV[1], TG_ARGV[1])
+        USING TG_ARGV[2]::timestamp, TG_ARGV[3]::timestamp;
+    RETURN NULL;
+END
+$$
+"""
+
+# id の一意性とパーティションの特定のための対応表を維持するトリガー
+# （テストの create_all 後にも tests/conftest.py がここから作成する）
+EXAMPLE_KEYS_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION examples_insert_keys() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO example_keys (id, created_at) SELECT id, created_at FROM new_rows;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER examples_insert_keys AFTER INSERT ON examples
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION examples_insert_keys()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION examples_delete_keys() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        DELETE FROM example_keys AS k USING old_rows AS o WHERE k.id = o.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER examples_delete_keys AFTER DELETE ON examples
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION examples_delete_keys()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION examples_truncate_keys() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        TRUNCATE example_keys;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER examples_truncate_keys AFTER TRUNCATE ON examples
+    FOR EACH STATEMENT EXECUTE FUNCTION examples_truncate_keys()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION examples_reject_key_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        RAISE EXCEPTION 'examples.id and examples.created_at cannot be updated'
+            USING ERRCODE = 'feature_not_supported';
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER examples_reject_key_update
+    BEFORE UPDATE OF id, created_at ON examples FOR EACH ROW
+    WHEN (OLD.id IS DISTINCT FROM NEW.id
+          OR OLD.created_at IS DISTINCT FROM NEW.created_at)
+    EXECUTE FUNCTION examples_reject_key_update()
+    """,
+)
+
+
+def _create_examples_table(primary_key: sa.PrimaryKeyConstraint, **kw) -> None:
+    op.create_table('examples',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('examples_id_seq'::regclass)"), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True),
+    primary_key,
+    **kw
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index('idx_examples_created_at_desc', 'examples', ['created_at'], unique=False)
+    op.create_index('idx_examples_created_at_id', 'examples', ['created_at', 'id'], unique=False)
+    op.create_index('idx_examples_name_active', 'examples', ['name', 'is_active'], unique=False)
+    op.create_index(op.f('ix_examples_id'), 'examples', ['id'], unique=False)
+    op.create_index(op.f('ix_examples_name'), 'examples', ['name'], unique=False)
+    op.create_index('ix_examples_name_trgm', 'examples', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_examples_search_vector', 'examples', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def _replace_examples_table(primary_key: sa.PrimaryKeyConstraint, **kw) -> None:
+    """examples を新しい定義で作り直し、既存の行とシーケンスを引き継ぐ"""
+    # インデックス名・制約名が重複しないよう、旧テーブルは名前を変えて残しておく
+    # （主キーは id の順にコピーするために残す）
+    op.execute("ALTER TABLE examples RENAME TO examples_old")
+    op.execute("ALTER TABLE examples_old RENAME CONSTRAINT examples_pkey TO examples_old_pkey")
+    for index in ('idx_examples_created_at_desc', 'idx_examples_created_at_id', 'idx_examples_name_active', 'ix_examples_id', 'ix_examples_name', 'ix_examples_name_trgm', 'ix_examples_search_vector'):
+        op.drop_index(index, table_name='examples_old')
+
+    _create_examples_table(primary_key, **kw)
+    if kw:
+        op.execute(PARTITION_KEYS_FUNCTION)
+        _create_partitions_for_existing_rows()
+        _create_example_keys()
+    _copy_rows()
+    op.execute("ALTER SEQUENCE examples_id_seq OWNED BY examples.id")
+    op.drop_table('examples_old')
+    _create_indexes()
+
+
+def _copy_rows() -> None:
+    """examples_old の行を id の順に COPY_BATCH_SIZE 行ずつ examples へコピー
+
+    1文でコピーすると全行分のトリガーの遷移表などを一度に抱えるため分割する。
+    """
+    bind = op.get_bind()
+    after = 0
+    while True:
+        last = bind.execute(
+            sa.text(
+                "SELECT max(id) FROM (SELECT id FROM examples_old WHERE id > :after "
+                "ORDER BY id LIMIT :limit) AS batch"
+            ),
+            {"after": after, "limit": COPY_BATCH_SIZE},
+        ).scalar()
+        if last is None:
+            break
+        bind.execute(
+            sa.text(
+                f"INSERT INTO examples ({COLUMNS}) SELECT {COLUMNS} FROM examples_old "
+                "WHERE id > :after AND id <= :last"
+            ),
+            {"after": after, "last": last},
+        )
+        after = last
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _create_partitions_for_existing_rows() -> None:
+    """既存の行の最も古い月から、現在の月の MONTHS_AHEAD か月先まで作成"""
+    bind = op.get_bind()
+    oldest, newest = bind.execute(sa.text("SELECT min(created_at), max(created_at) FROM examples_old")).one()
+    current = _month_start(datetime.now(UTC).replace(tzinfo=None))
+    month = _month_start(min(oldest or current, _add_months(current, -1)))
+    end = _month_start(max(newest or current, _add_months(current, MONTHS_AHEAD)))
+    while month <= end:
+        upper = _add_months(month, 1)
+        name = f"examples_p{month:%Y_%m}"
+        lower, upper_bound = month.isoformat(' '), upper.isoformat(' ')
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF examples "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper_bound}')"
+        )
+        op.execute(
+            f"CREATE TRIGGER delete_partition_keys AFTER TRUNCATE ON {name} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION delete_partition_keys("
+            f"'example_keys', 'created_at', '{lower}', '{upper_bound}')"
+        )
+        month = upper
+
+
+def _create_example_keys() -> None:
+    """パーティションをまたいで id の一意性を保証する対応表（トリガーで維持）"""
+    op.create_table('example_keys',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_example_keys_created_at'), 'example_keys', ['created_at'], unique=False)
+    for statement in EXAMPLE_KEYS_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 主キーにパーティションキー（created_at）を含める必要がある
+    _replace_examples_table(
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # トリガーは関数と一緒に削除される
+    op.execute(
+        "DROP FUNCTION examples_insert_keys(), examples_delete_keys(), "
+        "examples_truncate_keys(), examples_reject_key_update(), "
+        "delete_partition_keys() CASCADE"
+    )
+    op.drop_index(op.f('ix_example_keys_created_at'), table_name='example_keys')
+    op.drop_table('example_keys')
+    # パーティションは親テーブルの名前変更後も examples_old に付いたまま削除される
+    _replace_examples_table(sa.PrimaryKeyConstraint('id'))
@@ -0,0 +1,28 @@
+"""Add updated_at index to examples
+
+Revision ID: 4e8b2f6a9d13
+Revises: 7c3d9a1e5b42
+Create Date: 2026-10-16 18:21:07.640512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8b2f6a9d13'
+down_revision: Union[str, Sequence[str], None] = '7c3d9a1e5b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_examples_updated_at', 'examples', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_examples_updated_at', table_name='examples')
@@ -1,3 +1,3 @@
-from src.db.models.example import Example
+from src.db.models.example import Example, ExampleKey
 
-__all__ = ["Example"]
+__all__ = ["Example", "ExampleKey"]
@@ -1,26 +1,90 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 
 from src.db.database import Base
 
+# 全文検索のテキスト検索設定（言語非依存の分かち書きのみ）
+SEARCH_CONFIG = "simple"
+
 
 class Example(Base):
     """Example SQLAlchemy モデル"""
 
     __tablename__ = "examples"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # created_at の月次の範囲パーティションのため、主キーにはパーティションキーを含める
+    # （id の一意性は example_keys の主キーで保証する）
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime, default=datetime.utcnow, primary_key=True, nullable=False
+    )
     updated_at = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
+    # name と description の全文検索用ベクトル（DB側で生成、通常のSELECTでは読まない）
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+                "coalesce(name, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        )
+    )
 
     # 複合インデックスの追加
     __table_args__ = (
         Index("idx_examples_name_active", "name", "is_active"),
         Index("idx_examples_created_at_desc", "created_at"),
+        # カーソルページネーション用（created_at, id の行比較とソートに対応）
+        Index("idx_examples_created_at_id", "created_at", "id"),
+        # 一覧の ETag（max(updated_at)）用
+        Index("idx_examples_updated_at", "updated_at"),
+        # 部分一致検索（ILIKE '%...%'）と類似度ソート用のトライグラムインデックス
+        Index(
+            "ix_examples_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_examples_search_vector", "search_vector", postgresql_using="gin"),
+        # パーティションは create_all 後と python -m src.script.partition_maintenance
+        # で作成される
+        {
+            "postgresql_partition_by": "RANGE (created_at)",
+            "info": {"key_table": "example_keys"},
+        },
     )
+
+
+class ExampleKey(Base):
+    """examples の id と created_at の対応（id の一意性とパーティションの特定）
+
+    パーティションをまたいで id の一意性を保証するための表。id だけで引く
+    取得・更新・削除は、ここで created_at を引いてからパーティションを刈り込む。
+    examples のトリガーで自動的に維持される（トリガーの定義はマイグレーション
+    0005 のみにあり、create_all では作成されない）。
+    """
+
+    __tablename__ = "example_keys"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    # 切り離すパーティションの行のキーを消すため（maintain_partitions）
+    created_at = Column(DateTime, nullable=False, index=True)
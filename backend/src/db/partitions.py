@@ -0,0 +1,314 @@
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 月次パーティションの名前の末尾（examples_p2026_10 など）
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+# RANGE (created_at) のパーティションキー
+_PARTITION_KEY = re.compile(r"\((\w+)\)")
+
+# 複数のワーカーが同時に保守してもパーティションを二重に作成しないためのロック
+PARTITION_LOCK = "partition_maintenance"
+
+# 現在の月より何か月先までのパーティションがあれば正常とするか（これ未満では
+# 月が変わると INSERT がパーティションなしの 23514 で失敗する）
+MIN_MONTHS_AHEAD = 1
+
+# パーティション単位の TRUNCATE で対応表のキーを削除するトリガー関数
+# （マイグレーション 0005 で作成）
+PARTITION_KEYS_FUNCTION = "delete_partition_keys"
+
+LIST_PARTITIONS_SQL = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = CAST(:table AS regclass)"
+)
+
+
+@dataclass(frozen=True)
+class Partition:
+    """月次の範囲パーティション（month 以上、翌月未満）"""
+
+    name: str
+    month: datetime
+
+    @property
+    def end(self) -> datetime:
+        return add_months(self.month, 1)
+
+
+def utcnow() -> datetime:
+    """created_at と同じくタイムゾーンなしのUTC現在時刻"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def month_start(value: datetime) -> datetime:
+    """value を含む月の初日 0時"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """月の初日 month から months か月後の初日"""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def months_between(start: datetime, end: datetime) -> int:
+    """start の月から end の月までの月数"""
+    return (end.year - start.year) * 12 + end.month - start.month
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partition_name(name: str) -> bool:
+    """月次パーティションの名前かどうか"""
+    return _PARTITION_SUFFIX.search(name) is not None
+
+
+def is_range_partitioned(table: Table) -> bool:
+    """postgresql_partition_by="RANGE (...)" を指定したテーブルかどうか"""
+    partition_by = table.dialect_options["postgresql"].get("partition_by") or ""
+    return partition_by.upper().startswith("RANGE")
+
+
+def partition_key(table: Table) -> str:
+    """範囲パーティションのキーの列名"""
+    partition_by = table.dialect_options["postgresql"]["partition_by"]
+    match = _PARTITION_KEY.search(partition_by)
+    assert match is not None, partition_by
+    return match.group(1)
+
+
+def partition_keys(table: Table) -> tuple[str, str] | None:
+    """id とパーティションキーの対応表（info["key_table"]）とパーティションキー"""
+    key_table = table.info.get("key_table")
+    if key_table is None:
+        return None
+    return key_table, partition_key(table)
+
+
+def list_partitions(conn: Connection, table: str) -> list[Partition]:
+    """table の月次パーティションを古い順に取得"""
+    partitions = []
+    for (name,) in conn.execute(LIST_PARTITIONS_SQL, {"table": table}):
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            month = datetime(int(match.group(1)), int(match.group(2)), 1)
+            partitions.append(Partition(name, month))
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+def create_partitions(
+    conn: Connection,
+    table: str,
+    start: datetime,
+    end: datetime,
+    keys: tuple[str, str] | None = None,
+) -> list[str]:
+    """start の月から end の月まで（両端を含む）の月次パーティションを作成
+
+    既にある月は作成しない。作成したパーティションの名前を返す。
+    keys（対応表、パーティションキー）を指定した場合は、パーティションを直接
+    TRUNCATE したときにその月のキーを対応表から削除するトリガーも作成する。
+    """
+    existing = {partition.month for partition in list_partitions(conn, table)}
+    quote = conn.dialect.identifier_preparer.quote
+    created = []
+    month = month_start(start)
+    while month <= month_start(end):
+        if month not in existing:
+            name = partition_name(table, month)
+            lower = month.isoformat(" ")
+            upper = add_months(month, 1).isoformat(" ")
+            conn.execute(
+                text(
+                    f"CREATE TABLE {quote(name)} PARTITION OF {quote(table)} "
+                    f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                )
+            )
+            if keys is not None:
+                key_table, column = keys
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER {PARTITION_KEYS_FUNCTION} "
+                        f"AFTER TRUNCATE ON {quote(name)} FOR EACH STATEMENT "
+                        f"EXECUTE FUNCTION {PARTITION_KEYS_FUNCTION}("
+                        f"'{key_table}', '{column}', '{lower}', '{upper}')"
+                    )
+                )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(
+    conn: Connection,
+    table: str,
+    before: datetime,
+    drop: bool = False,
+    keys: tuple[str, str] | None = None,
+) -> list[str]:
+    """before の月より前の月次パーティションを切り離す（drop の場合は削除も行う）
+
+    切り離したパーティションは通常のテーブルとして残るため、アーカイブ後に削除
+    できる。DELETE と違い行数に関係なくメタデータの変更だけで終わり、不要行の
+    VACUUM も発生しない。切り離したパーティションの名前を返す。
+
+    keys（対応表、パーティションキー）を指定した場合は、切り離す月のキーを
+    先に対応表から削除する（親テーブルのロックは最初の切り離しから保持するため、
+    行単位の削除はその前に済ませる）。再び ATTACH する場合はキーを入れ直すこと。
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    cutoff = month_start(before)
+    expired = [
+        partition
+        for partition in list_partitions(conn, table)
+        if partition.end <= cutoff
+    ]
+    if expired and keys is not None:
+        key_table, column = keys
+        delete_keys_before(conn, key_table, column, expired[-1].end)
+    for partition in expired:
+        conn.execute(
+            text(f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(partition.name)}")
+        )
+        if drop:
+            conn.execute(text(f"DROP TABLE {quote(partition.name)}"))
+    return [partition.name for partition in expired]
+
+
+def create_initial_partitions(
+    target: MetaData, connection: Connection, **kw: Any
+) -> None:
+    """create_all の直後に範囲パーティションのテーブルへパーティションを作成"""
+    current = month_start(utcnow())
+    for table in target.sorted_tables:
+        if is_range_partitioned(table):
+            create_partitions(
+                connection,
+                table.name,
+                # DBのタイムゾーンの現在時刻（now()）が前月になる場合も受け付ける
+                add_months(current, -1),
+                add_months(current, settings.database_partition_months_ahead),
+                keys=partition_keys(table),
+            )
+
+
+def maintain_partitions(
+    conn: Connection, metadata: MetaData, now: datetime | None = None
+) -> bool:
+    """先の月のパーティションを作成し、保持期間を過ぎたパーティションを切り離す
+
+    別の接続（他のワーカーや保守スクリプト）が保守中の場合は何もせず False を返す。
+    """
+    locked = conn.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext(:lock))"),
+        {"lock": PARTITION_LOCK},
+    ).scalar()
+    if not locked:
+        return False
+    current = month_start(now or utcnow())
+    retention = settings.database_partition_retention_months
+    for table in metadata.sorted_tables:
+        if not is_range_partitioned(table):
+            continue
+        keys = partition_keys(table)
+        created = create_partitions(
+            conn,
+            table.name,
+            current,
+            add_months(current, settings.database_partition_months_ahead),
+            keys=keys,
+        )
+        if created:
+            logger.info(f"Created partitions: {', '.join(created)}")
+        if retention > 0:
+            detached = detach_partitions_before(
+                conn,
+                table.name,
+                add_months(current, -retention),
+                drop=settings.database_partition_drop_expired,
+                keys=keys,
+            )
+            if detached:
+                logger.info(f"Detached partitions: {', '.join(detached)}")
+    return True
+
+
+def partition_coverage(
+    conn: Connection, metadata: MetaData, now: datetime | None = None
+) -> dict[str, int | None]:
+    """範囲パーティションのテーブルごとに、最も新しいパーティションが現在の月の
+    何か月先か（パーティションがない場合は None）"""
+    current = month_start(now or utcnow())
+    coverage: dict[str, int | None] = {}
+    for table in metadata.sorted_tables:
+        if not is_range_partitioned(table):
+            continue
+        partitions = list_partitions(conn, table.name)
+        coverage[table.name] = (
+            months_between(current, partitions[-1].month) if partitions else None
+        )
+    return coverage
+
+
+def uncovered_tables(coverage: dict[str, int | None]) -> list[str]:
+    """先の月のパーティションが MIN_MONTHS_AHEAD か月分に満たないテーブル"""
+    return [
+        table
+        for table, months in coverage.items()
+        if months is None or months < MIN_MONTHS_AHEAD
+    ]
+
+
+async def run_partition_maintenance(
+    engine: AsyncEngine, metadata: MetaData, interval: float
+) -> None:
+    """interval 秒ごとにパーティションを保守する（lifespan のバックグラウンドタスク）
+
+    全てのワーカーで実行するが、アドバイザリロックを取れた1つの接続だけが
+    保守する。保守の後に先の月のパーティションが足りない場合はエラーを記録する
+    （GET /api/health/partitions も 503 を返す）。
+    """
+    while True:
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(maintain_partitions, metadata)
+            async with engine.connect() as conn:
+                coverage = await conn.run_sync(partition_coverage, metadata)
+            for table in uncovered_tables(coverage):
+                logger.error(
+                    f"Partitions of {table} cover less than {MIN_MONTHS_AHEAD} "
+                    f"month(s) ahead ({coverage[table]}); inserts will fail"
+                )
+        except Exception as exc:
+            # DBが一時的に使えなくても次の周期で再試行する
+            logger.warning(f"Partition maintenance failed: {exc}")
+        await asyncio.sleep(interval)
+
+
+def delete_keys_before(
+    conn: Connection, key_table: str, column: str, before: datetime
+) -> None:
+    """対応表から before の月より前のキーを削除"""
+    quote = conn.dialect.identifier_preparer.quote
+    result = conn.execute(
+        text(f"DELETE FROM {quote(key_table)} WHERE {quote(column)} < :before"),
+        {"before": month_start(before)},
+    )
+    if result.rowcount:
+        logger.info(f"Deleted {result.rowcount} keys from {key_table}")
@@ -0,0 +1,71 @@
+import time
+from enum import Enum
+from typing import Any, cast
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+class PoolerMode(str, Enum):
+    """アプリケーションとDBの間にある接続プーラーの動作モード"""
+
+    # 直接接続、または PgBouncer の session モード
+    SESSION = "session"
+    # PgBouncer などの transaction モード
+    TRANSACTION = "transaction"
+
+
+class PoolTelemetry:
+    """接続プールからの接続取得の待ち時間とタイムアウトの集計"""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def record_checkout(self, wait_time: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        if timed_out:
+            self.timeouts += 1
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """接続取得の待ち時間を telemetry に記録する AsyncAdaptedQueuePool
+
+    集計はプール（エンジン）ごとに持つため、プライマリとレプリカは混ざらない。
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # dispose で作り直したプールにも集計を引き継ぐ
+        pool = cast(InstrumentedAsyncQueuePool, super().recreate())
+        pool.telemetry = self.telemetry
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start_time = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.telemetry.record_checkout(
+                time.perf_counter() - start_time, timed_out=True
+            )
+            raise
+        self.telemetry.record_checkout(time.perf_counter() - start_time)
+        return connection
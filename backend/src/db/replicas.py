@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from src.core.cache import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# レプリカの遅延（秒）。WALを受信済み分まで適用し終えていれば遅延0とみなす
+REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+# レプリカから読むセッションの info に、選択時のレプリカの遅延（秒）を保存するキー
+REPLICA_LAG = "replica_lag"
+
+
+def is_lagging(session: AsyncSession) -> bool:
+    """遅延のあるレプリカから読むセッションか（古い値をキャッシュに入れないため）"""
+    lag: float = session.info.get(REPLICA_LAG, 0.0)
+    return lag > 0
+
+
+class ReplicaStrategy(str, Enum):
+    """読み取りレプリカの選択方法"""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
+
+
+@dataclass
+class Replica:
+    """読み取りレプリカとその直近の状態"""
+
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+    lag: float = 0.0
+    checked_at: float = field(default=float("-inf"))
+
+    @property
+    def load(self) -> int:
+        """使用中の接続数（プールが数えられない場合は0）"""
+        checkedout = getattr(self.engine.pool, "checkedout", None)
+        return checkedout() if callable(checkedout) else 0
+
+
+class ReplicaRouter:
+    """読み取り専用セッションの接続先をレプリカとプライマリから選択
+
+    各レプリカの死活と遅延は check_interval 秒ごとに確認し、停止中または
+    max_lag 秒を超えて遅延しているレプリカは選択しない。利用できるレプリカが
+    ない場合はプライマリを使う。確認は同時に選択したリクエストの間でまとめ、
+    レプリカごとに1回だけ実行する。
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: Sequence[AsyncEngine] = (),
+        strategy: ReplicaStrategy = ReplicaStrategy.ROUND_ROBIN,
+        max_lag: float = 10.0,
+        check_interval: float = 5.0,
+        check_timeout: float = 1.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = [
+            Replica(
+                engine=engine,
+                session_maker=async_sessionmaker(
+                    engine, class_=AsyncSession, expire_on_commit=False
+                ),
+            )
+            for engine in replicas
+        ]
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._counter = itertools.count()
+        self._checks: SingleFlight[int, None] = SingleFlight()
+
+    async def get_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        """読み取りに使うセッションファクトリーを選択"""
+        replica = await self.select()
+        return self.primary if replica is None else replica.session_maker
+
+    async def select(self) -> Replica | None:
+        """読み取りに使うレプリカを選択（利用できない場合はプライマリを表す None）"""
+        for replica in self._candidates():
+            if await self._is_available(replica):
+                return replica
+        return None
+
+    async def check(self, replica: Replica) -> None:
+        """レプリカの死活と遅延を確認"""
+        try:
+            async with asyncio.timeout(self.check_timeout):
+                async with replica.engine.connect() as conn:
+                    replica.lag = await self._measure_lag(conn)
+            replica.healthy = True
+        except (SQLAlchemyError, OSError, TimeoutError) as exc:
+            if replica.healthy:
+                logger.warning(
+                    f"Read replica {replica.engine.url!r} is unavailable: {exc}"
+                )
+            replica.healthy = False
+        replica.checked_at = time.monotonic()
+
+    def _candidates(self) -> list[Replica]:
+        if not self.replicas:
+            return []
+        if self.strategy == ReplicaStrategy.LEAST_LOADED:
+            return sorted(self.replicas, key=lambda replica: replica.load)
+        start = next(self._counter) % len(self.replicas)
+        return self.replicas[start:] + self.replicas[:start]
+
+    async def _is_available(self, replica: Replica) -> bool:
+        if time.monotonic() - replica.checked_at >= self.check_interval:
+            await self._checks.do(id(replica), lambda: self.check(replica))
+        return replica.healthy and replica.lag <= self.max_lag
+
+    @staticmethod
+    async def _measure_lag(conn: AsyncConnection) -> float:
+        # PostgreSQL 以外（ローカル検証用の SQLite など）は疎通確認のみ
+        if conn.dialect.name != "postgresql":
+            await conn.execute(text("SELECT 1"))
+            return 0.0
+        return float((await conn.execute(REPLICA_LAG_SQL)).scalar_one())
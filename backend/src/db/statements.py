@@ -0,0 +1,101 @@
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import Executable
+
+StatementType = TypeVar("StatementType", bound=Executable)
+
+
+class StatementRegistry:
+    """名前付きの構築済みステートメント
+
+    ステートメントは起動時に一度だけ構築し、値は bindparam で実行時に渡す。
+    同じオブジェクトを使い回すため、呼び出しごとの構築とキャッシュキー計算が
+    不要になり、コンパイル結果もエンジンのキャッシュから再利用される。
+    """
+
+    def __init__(self) -> None:
+        self._statements: dict[str, Executable] = {}
+        self._warmup_params: dict[str, dict[str, Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        stmt: StatementType,
+        warmup_params: dict[str, Any] | None = None,
+    ) -> StatementType:
+        """ステートメントを登録
+
+        warmup_params を指定した場合、起動時のウォームアップでその値で一度実行する。
+        """
+        if name in self._statements:
+            raise ValueError(f"Statement already registered: {name}")
+        self._statements[name] = stmt
+        if warmup_params is not None:
+            self._warmup_params[name] = warmup_params
+        return stmt
+
+    def get(self, name: str) -> Executable:
+        """登録済みのステートメントを取得"""
+        return self._statements[name]
+
+    def names(self) -> list[str]:
+        return sorted(self._statements)
+
+    def warmup_statements(self) -> list[tuple[Executable, dict[str, Any]]]:
+        """ウォームアップで実行するステートメントと値"""
+        return [
+            (self._statements[name], params)
+            for name, params in sorted(self._warmup_params.items())
+        ]
+
+
+class CompileCacheStats:
+    """エンジンのコンパイルキャッシュのヒット・ミス数"""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def record(self, context: ExecutionContext) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CACHE_MISS:
+            self.misses += 1
+        else:
+            # exec_driver_sql による生SQLやキャッシュ無効のステートメント
+            self.uncached += 1
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+statements = StatementRegistry()
+compile_cache_stats = CompileCacheStats()
+
+
+def track_compile_cache(engine: AsyncEngine) -> None:
+    """エンジンで実行されたステートメントのコンパイルキャッシュ利用状況を記録"""
+
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            compile_cache_stats.record(context)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,72 @@
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.config import settings
+from src.db.pool import PoolerMode
+
+# クエリのキャンセルを示す SQLSTATE（query_canceled）
+QUERY_CANCELED = "57014"
+
+# 現在のリクエストのDB時間予算（秒、0で無制限）。未設定の場合は Settings の既定値
+_time_budget: ContextVar[float | None] = ContextVar("db_time_budget", default=None)
+
+
+class QueryTimeoutError(Exception):
+    """DB時間予算を超えたためクエリを中断した"""
+
+
+class ClientDisconnectedError(Exception):
+    """クライアントが切断したためクエリを中断した"""
+
+
+def current_time_budget() -> float:
+    """現在のDB時間予算（秒）を取得"""
+    budget = _time_budget.get()
+    return settings.database_statement_timeout if budget is None else budget
+
+
+def set_time_budget(seconds: float) -> None:
+    """以降に開始するトランザクションのDB時間予算を設定"""
+    _time_budget.set(seconds)
+
+
+def is_query_timeout(exc: BaseException) -> bool:
+    """statement_timeout によるクエリのキャンセルかどうか"""
+    if isinstance(exc, QueryTimeoutError):
+        return True
+    orig = getattr(exc, "orig", None)
+    return getattr(orig, "sqlstate", None) == QUERY_CANCELED
+
+
+def connect_statement_timeout() -> dict[str, Any]:
+    """接続時に設定する既定の statement_timeout（asyncpg の server_settings）
+
+    既定値は接続単位で設定し、既定値と異なる予算のトランザクションだけ
+    SET LOCAL を発行して往復を減らす。transaction モードのプーラーでは
+    接続単位の設定が他のクライアントに漏れるため使わない。
+    """
+    if (
+        PoolerMode(settings.database_pooler_mode) == PoolerMode.TRANSACTION
+        or settings.database_statement_timeout <= 0
+    ):
+        return {}
+    return {"statement_timeout": str(int(settings.database_statement_timeout * 1000))}
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    budget = current_time_budget()
+    if connect_statement_timeout():
+        # 既定値は接続時に設定済み
+        if budget == settings.database_statement_timeout:
+            return
+    elif budget <= 0:
+        return
+    # SET LOCAL はトランザクション終了時に元に戻る
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(budget * 1000)}")
@@ -0,0 +1,74 @@
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# session.info のキー
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT = "after_commit"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """セッションが作業単位（まとめてコミットするトランザクション）の中かどうか"""
+    return bool(session.info.get(UNIT_OF_WORK))
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """単独で使われている場合はコミット、作業単位の中ではフラッシュのみ行う
+
+    サービスは db.commit() の代わりにこれを呼ぶ。作業単位の中ではコミットは
+    unit_of_work の終了時に一度だけ行われる。
+    """
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """コミット後に実行する処理（キャッシュの無効化など）を登録
+
+    作業単位の外では既にコミット済みのため即座に実行する。作業単位の中では
+    コミット成功後に実行し、ロールバックした場合は実行しない。
+    """
+    if in_unit_of_work(session):
+        session.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        callback()
+
+
+async def after_commit_async(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """コミット後に実行する非同期の処理（共有キャッシュの無効化など）を登録
+
+    after_commit と同じく、作業単位の外では即座に実行する。
+    """
+    if in_unit_of_work(session):
+        session.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        await callback()
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """ブロック内の書き込みを1つのトランザクションにまとめ、終了時に一度だけコミット
+
+    例外が発生した場合は全体をロールバックする。
+    """
+    session.info[UNIT_OF_WORK] = True
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        session.info.pop(AFTER_COMMIT, None)
+        raise
+    finally:
+        session.info.pop(UNIT_OF_WORK, None)
+
+    for callback in session.info.pop(AFTER_COMMIT, []):
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
@@ -1,9 +1,23 @@
-from typing import TypeVar
+from collections.abc import Iterable, Sequence
+from typing import Any, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Integer,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.db.database import Base
+from src.db.unit_of_work import commit_or_flush
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -19,17 +33,151 @@ async def get_by_id(
 async def create_model(
     session: AsyncSession, model: type[ModelType], **kwargs: object
 ) -> ModelType:
-    db_obj = model(**kwargs)
-    session.add(db_obj)
-    await session.commit()
-    await session.refresh(db_obj)
+    # INSERT ... RETURNING で作成後の値（採番ID・デフォルト値）を1往復で取得
+    result = await session.execute(insert(model).values(**kwargs).returning(model))
+    db_obj = result.scalar_one()
+    await commit_or_flush(session)
+    return db_obj
+
+
+async def update_model(
+    session: AsyncSession, model: type[ModelType], id: int, **kwargs: object
+) -> ModelType | None:
+    # UPDATE ... RETURNING で存在確認と更新後の値の取得を1文で行う
+    stmt = (
+        update(model)
+        .where(model.__table__.c.id == id)
+        .values(**kwargs)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    db_obj = result.scalar_one_or_none()
+    if db_obj is None:
+        return None
+    await commit_or_flush(session)
     return db_obj
 
 
 async def delete_model(session: AsyncSession, model: type[ModelType], id: int) -> bool:
-    db_obj = await get_by_id(session, model, id)
-    if db_obj:
-        await session.delete(db_obj)
-        await session.commit()
-        return True
-    return False
+    # DELETE ... RETURNING で存在確認と削除を1文で行う
+    id_column = model.__table__.c.id
+    stmt = (
+        delete(model)
+        .where(id_column == id)
+        .returning(id_column)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    if result.scalar_one_or_none() is None:
+        return False
+    await commit_or_flush(session)
+    return True
+
+
+async def allocate_ids(
+    session: AsyncSession, model: type[ModelType], count: int
+) -> list[int]:
+    """シリアル列 id のシーケンスから count 件の値を1往復で払い出す"""
+    sequence = func.pg_get_serial_sequence(model.__tablename__, "id")
+    result = await session.execute(
+        select(func.nextval(sequence)).select_from(func.generate_series(1, count))
+    )
+    return list(result.scalars().all())
+
+
+async def copy_records(
+    session: AsyncSession,
+    model: type[ModelType],
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> None:
+    """asyncpg の COPY でレコードを一括書き込み
+
+    セッションと同じ接続上で実行する。asyncpg ドライバはトランザクションを
+    最初のSQL実行時に開始するため、同じトランザクションに含めるには事前に
+    このセッションでSQLを実行しておく必要がある（allocate_ids など）。
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+    await driver_connection.copy_records_to_table(
+        model.__tablename__, records=records, columns=list(columns)
+    )
+
+
+def _ids_param(ids: Sequence[int]) -> Any:
+    """ID集合を1つの配列パラメータとしてバインド（id = ANY($1)）
+
+    件数に関係なく同じSQLになるため、ステートメントキャッシュが効く。
+    """
+    return any_(bindparam("ids", list(ids), type_=ARRAY(Integer)))
+
+
+def _ids_filter(
+    model: type[ModelType], ids: Sequence[int], keys: type[Base] | None
+) -> ColumnElement[bool]:
+    """ID集合の行の条件
+
+    keys（id とパーティションキーの対応表）を指定した場合は、対応表の行と
+    (id, パーティションキー) で突き合わせ、実行時にパーティションを刈り込む。
+    """
+    if keys is None:
+        condition: ColumnElement[bool] = model.__table__.c.id == _ids_param(ids)
+        return condition
+    key_columns = keys.__table__.c
+    return tuple_(*(model.__table__.c[column.name] for column in key_columns)).in_(
+        select(*key_columns).where(key_columns.id == _ids_param(ids))
+    )
+
+
+def _missing_ids(ids: Sequence[int], found: Iterable[int]) -> list[int]:
+    """リクエストされたIDのうち、RETURNING に含まれなかったものを順序を保って返す"""
+    found_ids = set(found)
+    return [id_ for id_ in dict.fromkeys(ids) if id_ not in found_ids]
+
+
+async def bulk_update_by_ids(
+    session: AsyncSession,
+    model: type[ModelType],
+    ids: Sequence[int],
+    values: dict[str, Any],
+    keys: type[Base] | None = None,
+) -> tuple[list[ModelType], list[int]]:
+    """ids のレコードを1文の UPDATE ... RETURNING で更新
+
+    (更新後のレコード, 存在しなかったID) を返す。コミットは呼び出し側で行う。
+    """
+    id_column = model.__table__.c.id
+    stmt = (
+        update(model)
+        .where(_ids_filter(model, ids, keys))
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    updated = list(result.scalars().all())
+    return updated, _missing_ids(ids, (getattr(obj, id_column.key) for obj in updated))
+
+
+async def bulk_delete_by_ids(
+    session: AsyncSession,
+    model: type[ModelType],
+    ids: Sequence[int],
+    keys: type[Base] | None = None,
+) -> tuple[list[int], list[int]]:
+    """ids のレコードを1文の DELETE ... RETURNING id で削除
+
+    (削除したID, 存在しなかったID) を返す。コミットは呼び出し側で行う。
+    """
+    id_column = model.__table__.c.id
+    stmt = (
+        delete(model)
+        .where(_ids_filter(model, ids, keys))
+        .returning(id_column)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    deleted = list(result.scalars().all())
+    return deleted, _missing_ids(ids, deleted)
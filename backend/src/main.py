@@ -1,26 +1,70 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.debug.routes import router as debug_router
 from src.api.examples.routes import router as examples_router
 
 # APIルート
+from src.api.health.routes import internal_router as health_internal_router
 from src.api.health.routes import router as health_router
 
 # 設定とミドルウェア
+from src.core.compression import CompressionMiddleware
 from src.core.config import settings
 from src.core.logging import setup_logging
-from src.core.middleware import ErrorHandlerMiddleware, LoggingMiddleware
+from src.core.middleware import (
+    ErrorHandlerMiddleware,
+    LoggingMiddleware,
+    QueryCounterMiddleware,
+)
+from src.core.response_cache import response_cache
+from src.db.database import (
+    dispose_engines,
+    start_partition_maintenance,
+    warm_up_database,
+)
 
 # ログ設定初期化
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """起動時にDB接続を準備し、終了時に接続を閉じる
+
+    エンジンはインポート時には接続しないため、ワーカーのフォーク後に
+    各ワーカーがここで自分の接続を開く。パーティションの保守も各ワーカーで
+    開始するが、アドバイザリロックにより同時には1つだけが実行する。
+    """
+    await warm_up_database()
+    maintenance = start_partition_maintenance()
+    yield
+    if maintenance is not None:
+        maintenance.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance
+    await response_cache.close()
+    await dispose_engines()
+
+
 app = FastAPI(
-    title=settings.app_name, version=settings.app_version, debug=settings.debug
+    title=settings.app_name,
+    version=settings.app_version,
+    debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # ミドルウェア設定
 app.add_middleware(ErrorHandlerMiddleware)
+# ErrorHandlerMiddleware の外側に置き、strict の場合の例外を 500 に変換させない
+app.add_middleware(QueryCounterMiddleware)
 app.add_middleware(LoggingMiddleware)
+# LoggingMiddleware の外側に置き、ログの処理時間に圧縮を含めない
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -32,6 +76,10 @@ app.add_middleware(
 # APIルート登録
 app.include_router(health_router)
 app.include_router(examples_router)
+# 内部向けの診断エンドポイント（認証がないため、設定で有効にした場合のみ）
+if settings.debug_endpoints:
+    app.include_router(health_internal_router)
+    app.include_router(debug_router)
 
 
 @app.get("/")
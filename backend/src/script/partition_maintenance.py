@@ -0,0 +1,37 @@
+# src/script/partition_maintenance.py
+"""範囲パーティションの保守スクリプト
+
+先の月のパーティションを作成し、保持期間を過ぎた月を切り離す。
+通常はアプリケーションのワーカーのバックグラウンドタスクが
+DATABASE_PARTITION_MAINTENANCE_INTERVAL ごとに実行するため、ワーカーを
+起動していない環境や、保持期間を変更した直後に手動で実行する場合に使う。
+"""
+
+import asyncio
+import logging
+
+from src.core.logging import setup_logging
+from src.db.database import Base, engine
+from src.db.models import Example  # noqa: F401
+from src.db.partitions import maintain_partitions
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    try:
+        async with engine.begin() as conn:
+            if not await conn.run_sync(maintain_partitions, Base.metadata):
+                logger.warning("Partition maintenance is already running; skipped")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """メイン実行関数"""
+    setup_logging()
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+import pytest
+
+from src.api.common.pagination import count_cache
+from src.db.database import get_read_session
+from src.db.replicas import REPLICA_LAG
+from src.main import app
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def created_examples(client, multiple_example_data):
+    """Example を作成しておく"""
+    return [
+        client.post("/api/examples/", json=data).json()
+        for data in multiple_example_data
+    ]
+
+
+class TestResponseCacheAPI:
+    """一覧・検索のレスポンスキャッシュのテスト"""
+
+    def test_list_is_cached(self, client, created_examples):
+        """同じクエリの2回目はキャッシュから同じ内容を返すことを確認"""
+        first = client.get("/api/examples/", params={"page": 1, "per_page": 2})
+        second = client.get("/api/examples/?per_page=2&page=1")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["content-type"] == "application/json"
+        assert second.json() == first.json()
+
+        # クエリが異なる場合は別のエントリになる
+        other = client.get("/api/examples/", params={"page": 2, "per_page": 2})
+        assert other.headers["X-Cache"] == "MISS"
+
+    def test_search_is_cached(self, client, created_examples):
+        """全文検索のレスポンスもキャッシュすることを確認"""
+        client.get("/api/examples/search", params={"q": "Example"})
+        response = client.get("/api/examples/search", params={"q": "Example"})
+
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.json()["items"]
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda client, ids: client.post("/api/examples/", json={"name": "New"}),
+            lambda client, ids: client.post(
+                "/api/examples/bulk", json={"items": [{"name": "New"}]}
+            ),
+            lambda client, ids: client.put(
+                f"/api/examples/{ids[0]}", json={"name": "New"}
+            ),
+            lambda client, ids: client.patch(
+                "/api/examples/bulk", json={"ids": ids[:1], "name": "New"}
+            ),
+            lambda client, ids: client.delete(f"/api/examples/{ids[0]}"),
+            lambda client, ids: client.request(
+                "DELETE", "/api/examples/bulk", json={"ids": ids[:1]}
+            ),
+        ],
+        ids=["create", "bulk_create", "update", "bulk_update", "delete", "bulk_delete"],
+    )
+    def test_writes_invalidate(self, client, created_examples, write):
+        """書き込み後は古いレスポンスを返さないことを確認"""
+        before = client.get("/api/examples/").json()
+
+        response = write(client, [example["id"] for example in created_examples])
+        assert response.status_code < 300
+
+        after = client.get("/api/examples/")
+        assert after.headers["X-Cache"] == "MISS"
+        assert after.json() != before
+
+    def test_errors_are_not_cached(self, client):
+        """エラーのレスポンスはキャッシュしないことを確認"""
+        response = client.get("/api/examples/", params={"count": "approximate"})
+
+        assert response.status_code == 422
+        assert "X-Cache" not in response.headers
+
+    def test_lagging_replica_is_not_cached(self, client, created_examples):
+        """遅延のあるレプリカから読んだレスポンスと件数はキャッシュしないことを確認"""
+
+        async def lagging_read_session():
+            async with TestingSessionLocal() as session:
+                session.info[REPLICA_LAG] = 2.0
+                yield session
+
+        app.dependency_overrides[get_read_session] = lagging_read_session
+        first = client.get("/api/examples/")
+        second = client.get("/api/examples/")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "MISS"
+        assert second.json() == first.json()
+        assert count_cache.stats().entries == 0
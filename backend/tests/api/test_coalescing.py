@@ -0,0 +1,148 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+from fastapi import FastAPI, Header, HTTPException, Response
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.api.common.coalescing import coalesce_requests, request_flights
+from src.core.config import settings
+
+
+@pytest.fixture
+def coalesced_app():
+    """呼び出し回数を記録する、まとめる対象のルートを持つアプリ"""
+    app = FastAPI()
+    calls: list[str] = []
+
+    @app.get("/items")
+    @coalesce_requests(name="test_items")
+    async def list_items(
+        page: int = 1, if_none_match: str | None = Header(None)
+    ) -> dict[str, object]:
+        calls.append(f"page={page} etag={if_none_match}")
+        await asyncio.sleep(0.05)
+        return {"page": page, "call": len(calls)}
+
+    @app.get("/raw")
+    @coalesce_requests(name="test_raw")
+    async def raw() -> Response:
+        calls.append("raw")
+        await asyncio.sleep(0.05)
+        return Response(b"raw body", media_type="text/plain", headers={"X-Test": "1"})
+
+    @app.get("/fail")
+    @coalesce_requests(name="test_fail")
+    async def fail() -> None:
+        calls.append("fail")
+        await asyncio.sleep(0.05)
+        raise HTTPException(status_code=404, detail="missing")
+
+    yield app, calls
+    for name in ["test_items", "test_raw", "test_fail"]:
+        request_flights.pop(name, None)
+
+
+def get_concurrently(app: FastAPI, *requests: tuple[str, dict[str, str]]):
+    """複数のリクエストを同時に送信"""
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+            return await asyncio.gather(
+                *(ac.get(url, headers=headers) for url, headers in requests)
+            )
+
+    return asyncio.run(run())
+
+
+class TestRequestCoalescing:
+    """同一の同時リクエストをまとめる処理のテスト"""
+
+    def test_identical_requests_share_one_execution(self, coalesced_app):
+        """同じクエリ（順序違いを含む）の同時リクエストは1回だけ実行することを確認"""
+        app, calls = coalesced_app
+
+        responses = get_concurrently(
+            app,
+            ("/items?page=1&x=1&y=2", {}),
+            ("/items?page=1&y=2&x=1", {}),
+            ("/items?page=1&x=1&y=2", {}),
+            ("/items?page=2", {}),
+        )
+
+        bodies = [response.json() for response in responses]
+        assert bodies[0]["page"] == 1
+        assert bodies[1] == bodies[0]
+        assert bodies[2] == bodies[0]
+        assert bodies[3]["page"] == 2
+        assert sorted(calls) == ["page=1 etag=None", "page=2 etag=None"]
+        flights = request_flights["test_items"]
+        assert (flights.executions, flights.coalesced) == (2, 2)
+        assert not flights.keys()
+
+    def test_vary_headers_are_part_of_key(self, coalesced_app):
+        """If-None-Match が異なるリクエストはまとめないことを確認"""
+        app, calls = coalesced_app
+
+        get_concurrently(
+            app,
+            ("/items", {"If-None-Match": '"a"'}),
+            ("/items", {"If-None-Match": '"b"'}),
+            ("/items", {"If-None-Match": '"a"'}),
+        )
+
+        assert sorted(calls) == ['page=1 etag="a"', 'page=1 etag="b"']
+
+    def test_response_is_shared(self, coalesced_app):
+        """Response の状態・ヘッダー・本文をそのまま共有することを確認"""
+        app, calls = coalesced_app
+
+        responses = get_concurrently(app, ("/raw", {}), ("/raw", {}))
+
+        assert calls == ["raw"]
+        for response in responses:
+            assert response.status_code == 200
+            assert response.content == b"raw body"
+            assert response.headers["X-Test"] == "1"
+            assert response.headers["content-length"] == "8"
+
+    def test_exception_is_shared(self, coalesced_app):
+        """実行中の例外は待機していたリクエストにも返すことを確認"""
+        app, calls = coalesced_app
+
+        responses = get_concurrently(app, ("/fail", {}), ("/fail", {}))
+
+        assert calls == ["fail"]
+        assert [response.status_code for response in responses] == [404, 404]
+
+    def test_disabled(self, coalesced_app, monkeypatch):
+        """request_coalescing が無効の場合はまとめないことを確認"""
+        monkeypatch.setattr(settings, "request_coalescing", False)
+        app, calls = coalesced_app
+
+        get_concurrently(app, ("/items", {}), ("/items", {}))
+
+        assert len(calls) == 2
+
+
+class TestCoalescingStatsAPI:
+    """リクエストをまとめた回数の API のテスト"""
+
+    def test_get_coalescing_stats(self, client):
+        """GET /api/debug/coalescing がまとめる対象のルートを返すことを確認"""
+        client.get("/api/examples/")
+
+        response = client.get("/api/debug/coalescing")
+
+        assert response.status_code == 200
+        stats = {item["name"]: item for item in response.json()["items"]}
+        assert {"list_examples", "search_examples"} <= set(stats)
+        assert stats["list_examples"]["executions"] >= 1
+        assert stats["list_examples"]["in_flight"] == 0
@@ -0,0 +1,139 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from datetime import datetime
+
+import pytest
+
+from src.api.common.conditional import is_not_modified, make_etag
+
+
+@pytest.fixture
+def created_examples(client, multiple_example_data):
+    """Example を作成しておく"""
+    return [
+        client.post("/api/examples/", json=data).json()
+        for data in multiple_example_data
+    ]
+
+
+class TestConditionalHelpers:
+    """条件付きリクエストの判定のテスト"""
+
+    def test_etag_is_stable(self):
+        assert make_etag(1, "a") == make_etag(1, "a")
+        assert make_etag(1, "a") != make_etag(1, "b")
+        assert make_etag(1).startswith('"')
+
+    def test_if_none_match(self):
+        """複数の ETag・弱い ETag・* に一致することを確認"""
+        etag = make_etag(1)
+
+        assert is_not_modified(etag, f'"other", W/{etag}')
+        assert is_not_modified(etag, "*")
+        assert not is_not_modified(etag, '"other"')
+        assert not is_not_modified(etag, None)
+
+    def test_if_modified_since(self):
+        """秒単位で比較し、If-None-Match がある場合は無視することを確認"""
+        etag = make_etag(1)
+        last_modified = datetime(2026, 10, 16, 12, 0, 0, 500000)
+        since = "Fri, 16 Oct 2026 12:00:00 GMT"
+
+        assert is_not_modified(etag, None, last_modified, since)
+        assert not is_not_modified(
+            etag, None, last_modified, "Fri, 16 Oct 2026 11:59:59 GMT"
+        )
+        assert not is_not_modified(etag, '"other"', last_modified, since)
+        assert not is_not_modified(etag, None, last_modified, "invalid")
+
+
+class TestConditionalGetAPI:
+    """ETag / Last-Modified による条件付きGETのテスト"""
+
+    def test_get_example_not_modified(self, client, created_examples):
+        """同じ ETag / 更新日時なら本文なしの 304 を返すことを確認"""
+        url = f"/api/examples/{created_examples[0]['id']}"
+        response = client.get(url)
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+
+        assert response.status_code == 200
+        assert response.json() == created_examples[0]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        response = client.get(url, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+    def test_get_example_modified(self, client, created_examples):
+        """更新後は古い ETag に対して 200 と新しい ETag を返すことを確認"""
+        url = f"/api/examples/{created_examples[0]['id']}"
+        etag = client.get(url).headers["ETag"]
+
+        client.put(url, json={"name": "Updated"})
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Updated"
+        assert response.headers["ETag"] != etag
+
+    def test_list_not_modified(self, client, created_examples):
+        """一覧は同じ ETag なら 304 を返し、キャッシュから返す場合も同じことを確認"""
+        response = client.get("/api/examples/", params={"per_page": 2})
+        etag = response.headers["ETag"]
+
+        assert response.status_code == 200
+        assert "Last-Modified" not in response.headers
+
+        response = client.get(
+            "/api/examples/", params={"per_page": 2}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.headers["ETag"] == etag
+
+    def test_list_revalidated_without_response_cache(
+        self, client, created_examples, monkeypatch
+    ):
+        """レスポンスキャッシュを使わない場合も、削除・更新で ETag が変わることを確認"""
+        from src.core.response_cache import response_cache
+
+        monkeypatch.setattr(response_cache, "ttl", 0)
+        etag = client.get("/api/examples/").headers["ETag"]
+
+        response = client.get("/api/examples/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        client.delete(f"/api/examples/{created_examples[0]['id']}")
+        response = client.get("/api/examples/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        client.put(
+            f"/api/examples/{created_examples[1]['id']}", json={"name": "Updated"}
+        )
+        response = client.get("/api/examples/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_list_without_exact_count(self, client, created_examples):
+        """件数が正確でない取得方法では ETag を付けないことを確認"""
+        response = client.get("/api/examples/", params={"count": "none"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+    def test_list_with_search(self, client, created_examples):
+        """検索条件がある場合は ETag を付けないことを確認"""
+        response = client.get("/api/examples/", params={"search": "Example"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
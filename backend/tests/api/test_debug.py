@@ -0,0 +1,118 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+import pytest
+
+from src.db.instrumentation import query_stats
+
+
+@pytest.fixture
+def recorded_queries():
+    """集計済みのSQL実行統計を用意"""
+    query_stats.reset()
+    query_stats.record("SELECT * FROM examples WHERE id = $1", 0.01, 1)
+    query_stats.record("SELECT * FROM examples WHERE id = $1", 0.03, 1)
+    query_stats.record("SELECT * FROM examples LIMIT $1", 0.02, 20)
+    yield
+    query_stats.reset()
+
+
+class TestQueryStatsAPI:
+    """SQL実行統計 API テストクラス"""
+
+    def test_get_query_stats(self, client, recorded_queries):
+        """GET /api/debug/queries が合計時間の降順で統計を返すことを確認"""
+        response = client.get("/api/debug/queries")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["statements"] == 2
+        assert data["dropped"] == 0
+        first, second = data["items"]
+        assert first["statement"] == "SELECT * FROM examples WHERE id = ?"
+        assert first["calls"] == 2
+        assert first["total_time"] == pytest.approx(0.04)
+        assert first["mean_time"] == pytest.approx(0.02)
+        assert first["max_time"] == pytest.approx(0.03)
+        assert second["statement"] == "SELECT * FROM examples LIMIT ?"
+        assert second["rows"] == 20
+
+    def test_get_query_stats_sort_and_limit(self, client, recorded_queries):
+        """sort と limit で並び順と件数を指定できることを確認"""
+        response = client.get("/api/debug/queries", params={"sort": "rows", "limit": 1})
+
+        assert response.status_code == 200
+        [item] = response.json()["items"]
+        assert item["statement"] == "SELECT * FROM examples LIMIT ?"
+
+    def test_get_query_stats_invalid_sort(self, client):
+        """未知の並び順は 422 になることを確認"""
+        response = client.get("/api/debug/queries", params={"sort": "unknown"})
+
+        assert response.status_code == 422
+
+    def test_reset_query_stats(self, client, recorded_queries):
+        """DELETE /api/debug/queries で統計がリセットされることを確認"""
+        response = client.delete("/api/debug/queries")
+
+        assert response.status_code == 204
+        assert client.get("/api/debug/queries").json()["items"] == []
+
+    def test_not_in_openapi_schema(self, client):
+        """内部向けのためOpenAPIスキーマに含まれないことを確認"""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        assert "/api/debug/queries" not in paths
+
+
+class TestCacheStatsAPI:
+    """キャッシュ統計 API テストクラス"""
+
+    def test_get_cache_stats(self, client):
+        """GET /api/debug/caches がエンティティキャッシュのヒット率を返すことを確認"""
+        created = client.post("/api/examples/", json={"name": "Cache Stats"}).json()
+        for _ in range(3):
+            client.get(f"/api/examples/{created['id']}")
+
+        response = client.get("/api/debug/caches")
+
+        assert response.status_code == 200
+        stats = {item["name"]: item for item in response.json()["items"]}
+        assert set(stats) == {"example", "count"}
+        assert stats["example"]["entries"] == 1
+        assert stats["example"]["hits"] == 2
+        assert stats["example"]["misses"] == 1
+        assert stats["example"]["hit_ratio"] == pytest.approx(2 / 3)
+
+
+class TestCompressionStatsAPI:
+    """レスポンス圧縮の統計 API テストクラス"""
+
+    def test_get_compression_stats(self, client):
+        """GET /api/debug/compression が削減したバイト数を返すことを確認"""
+        client.delete("/api/debug/compression")
+        openapi = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert openapi.headers["content-encoding"] == "gzip"
+
+        response = client.get("/api/debug/compression")
+
+        assert response.status_code == 200
+        stats = {item["encoding"]: item for item in response.json()["items"]}
+        assert stats["gzip"]["responses"] == 1
+        assert stats["gzip"]["bytes_in"] == len(openapi.content)
+        assert stats["gzip"]["bytes_saved"] > 0
+        assert stats["gzip"]["cpu_time"] >= 0
+
+    def test_reset_compression_stats(self, client):
+        """DELETE /api/debug/compression で統計がリセットされることを確認"""
+        client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        response = client.delete("/api/debug/compression")
+
+        assert response.status_code == 204
+        assert client.get("/api/debug/compression").json()["items"] == []
@@ -1,4 +1,7 @@
+import csv
 import datetime
+import io
+import json
 import os
 import sys
 import time
@@ -10,6 +13,7 @@ sys.path.insert(
 
 from datetime import datetime as dt
 
+import asyncpg
 import pytest
 
 from src.api.examples.schemas import ExampleCreate, ExampleUpdate
@@ -523,3 +527,596 @@ class TestExampleCRUDAPI:
         updated_dt = dt.fromisoformat(updated_at.replace("Z", "+00:00"))
         time_diff = abs((created_dt - updated_dt).total_seconds())
         assert time_diff < 1.0, f"時刻差が1秒を超えています: {time_diff}秒"
+
+    def test_get_examples_cursor_pagination(self, client):
+        """GET /api/examples/ - カーソルページネーションテスト"""
+        for i in range(12):
+            response = client.post(
+                "/api/examples/",
+                json={"name": f"Cursor Example {i + 1}", "description": f"Test {i}"},
+            )
+            assert response.status_code == 201
+
+        # ページ番号方式の1ページ目からカーソルを取得
+        response = client.get("/api/examples/?per_page=5")
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["prev_cursor"] is None
+        assert first_page["next_cursor"] is not None
+
+        # カーソルで2ページ目・3ページ目を取得
+        response = client.get(
+            f"/api/examples/?per_page=5&after={first_page['next_cursor']}"
+        )
+        assert response.status_code == 200
+        second_page = response.json()
+        assert len(second_page["items"]) == 5
+        assert second_page["prev_cursor"] is not None
+
+        response = client.get(
+            f"/api/examples/?per_page=5&after={second_page['next_cursor']}"
+        )
+        assert response.status_code == 200
+        third_page = response.json()
+        assert len(third_page["items"]) == 2
+        assert third_page["next_cursor"] is None
+
+        # 重複・欠落なく作成日時の降順で全件を辿れることを確認
+        all_items = first_page["items"] + second_page["items"] + third_page["items"]
+        ids = [item["id"] for item in all_items]
+        assert len(set(ids)) == 12
+        assert ids == sorted(ids, reverse=True)
+
+        # beforeで前のページに戻れることを確認
+        response = client.get(
+            f"/api/examples/?per_page=5&before={third_page['prev_cursor']}"
+        )
+        assert response.status_code == 200
+        back_page = response.json()
+        assert [item["id"] for item in back_page["items"]] == [
+            item["id"] for item in second_page["items"]
+        ]
+
+    def test_get_examples_cursor_with_search(self, client):
+        """GET /api/examples/ - 検索条件付きカーソルページネーションテスト"""
+        for i in range(6):
+            name = f"Apple {i}" if i % 2 == 0 else f"Banana {i}"
+            response = client.post("/api/examples/", json={"name": name})
+            assert response.status_code == 201
+
+        response = client.get("/api/examples/?search=Apple&per_page=2")
+        data = response.json()
+        assert data["total"] == 3
+
+        response = client.get(
+            f"/api/examples/?search=Apple&per_page=2&after={data['next_cursor']}"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Apple 0"]
+        assert data["next_cursor"] is None
+
+    def test_get_examples_invalid_cursor(self, client):
+        """GET /api/examples/ - 不正なカーソルのバリデーションテスト"""
+        response = client.get("/api/examples/?after=invalid-cursor")
+        assert response.status_code == 422
+
+        response = client.get("/api/examples/?after=abc&before=abc")
+        assert response.status_code == 422
+
+    def test_get_examples_count_none(self, client):
+        """GET /api/examples/ - count=none で総件数を取得しないテスト"""
+        for i in range(3):
+            response = client.post("/api/examples/", json={"name": f"No Count {i}"})
+            assert response.status_code == 201
+
+        response = client.get("/api/examples/?count=none&per_page=2")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["total_exact"] is False
+        assert len(data["items"]) == 2
+        assert data["next_cursor"] is not None
+
+        response = client.get("/api/examples/?count=none&per_page=2&page=2")
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["next_cursor"] is None
+
+    def test_get_examples_count_estimated(self, client, monkeypatch):
+        """GET /api/examples/ - count=estimated で推定件数を返すテスト"""
+        from src.core.config import settings
+        from src.core.response_cache import response_cache
+
+        for i in range(3):
+            response = client.post("/api/examples/", json={"name": f"Estimated {i}"})
+            assert response.status_code == 201
+
+        # 閾値未満の推定件数は正確な件数にフォールバックする
+        response = client.get("/api/examples/?count=estimated")
+        data = response.json()
+        assert data["total"] == 3
+        assert data["total_exact"] is True
+
+        monkeypatch.setattr(settings, "pagination_exact_count_threshold", 0)
+        # 設定を変更する前のレスポンスをキャッシュから返さないようにする
+        monkeypatch.setattr(response_cache, "ttl", 0)
+        for query in ["count=estimated", "count=estimated&search=Estimated"]:
+            response = client.get(f"/api/examples/?{query}")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total_exact"] is False
+            assert isinstance(data["total"], int)
+            assert data["total"] >= 0
+            assert len(data["items"]) == 3
+
+    def test_get_examples_exact_count_cache_invalidation(self, client):
+        """GET /api/examples/ - 件数キャッシュが書き込みで無効化されるテスト"""
+        response = client.post("/api/examples/", json={"name": "Cached Count"})
+        created_id = response.json()["id"]
+
+        assert client.get("/api/examples/").json()["total"] == 1
+        assert client.get("/api/examples/?search=Cached").json()["total"] == 1
+
+        client.post("/api/examples/", json={"name": "Cached Count 2"})
+        assert client.get("/api/examples/").json()["total"] == 2
+        assert client.get("/api/examples/?search=Cached").json()["total"] == 2
+
+        client.put(f"/api/examples/{created_id}", json={"name": "Renamed"})
+        assert client.get("/api/examples/?search=Cached").json()["total"] == 1
+
+        client.delete(f"/api/examples/{created_id}")
+        assert client.get("/api/examples/").json()["total"] == 1
+
+    def test_get_example_entity_cache_invalidation(self, client):
+        """GET /api/examples/{id} - キャッシュが書き込みで破棄されるテスト"""
+        ids = [
+            client.post("/api/examples/", json={"name": f"Cached {i}"}).json()["id"]
+            for i in range(2)
+        ]
+        assert client.get(f"/api/examples/{ids[0]}").json()["name"] == "Cached 0"
+
+        client.put(f"/api/examples/{ids[0]}", json={"name": "Renamed"})
+        assert client.get(f"/api/examples/{ids[0]}").json()["name"] == "Renamed"
+
+        assert client.get(f"/api/examples/{ids[1]}").json()["is_active"] is True
+        client.patch("/api/examples/bulk", json={"ids": ids, "is_active": False})
+        assert client.get(f"/api/examples/{ids[1]}").json()["is_active"] is False
+
+        client.request("DELETE", "/api/examples/bulk", json={"ids": [ids[1]]})
+        assert client.get(f"/api/examples/{ids[1]}").status_code == 404
+
+        client.delete(f"/api/examples/{ids[0]}")
+        assert client.get(f"/api/examples/{ids[0]}").status_code == 404
+
+    def test_get_examples_invalid_count_mode(self, client):
+        """GET /api/examples/ - 不正なcountモードのバリデーションテスト"""
+        response = client.get("/api/examples/?count=approximate")
+        assert response.status_code == 422
+
+    def test_get_examples_search_relevance_order(self, client):
+        """GET /api/examples/ - order=relevance で類似度順に並ぶテスト"""
+        for name in ["Apple", "Apple Pie Example", "Pineapple Juice"]:
+            response = client.post("/api/examples/", json={"name": name})
+            assert response.status_code == 201
+
+        # 作成日時順（デフォルト）
+        response = client.get("/api/examples/?search=apple")
+        names = [item["name"] for item in response.json()["items"]]
+        assert names == ["Pineapple Juice", "Apple Pie Example", "Apple"]
+
+        # 類似度順
+        response = client.get("/api/examples/?search=apple&order=relevance")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["items"][0]["name"] == "Apple"
+        assert data["next_cursor"] is None
+
+        # 類似度順ではカーソルページネーションは利用できない
+        cursor = client.get("/api/examples/?per_page=1").json()["next_cursor"]
+        response = client.get(
+            f"/api/examples/?search=apple&order=relevance&after={cursor}"
+        )
+        assert response.status_code == 422
+
+    def test_search_examples_full_text(self, client):
+        """GET /api/examples/search - name と description の全文検索テスト"""
+        examples = [
+            {"name": "Orange", "description": "citrus fruit with vitamin"},
+            {"name": "Vitamin Guide", "description": "all about vitamin intake"},
+            {"name": "Banana", "description": "yellow fruit"},
+        ]
+        for example in examples:
+            response = client.post("/api/examples/", json=example)
+            assert response.status_code == 201
+
+        response = client.get("/api/examples/search?q=vitamin")
+        assert response.status_code == 200
+        data = response.json()
+
+        # name と description の両方に一致する方が上位になる
+        names = [item["name"] for item in data["items"]]
+        assert names == ["Vitamin Guide", "Orange"]
+        assert data["items"][0]["rank"] >= data["items"][1]["rank"]
+        assert data["items"][0]["headline"] is None
+        assert data["next_cursor"] is None
+
+        # description のみに含まれる語でも検索できる
+        response = client.get("/api/examples/search?q=yellow")
+        assert [item["name"] for item in response.json()["items"]] == ["Banana"]
+
+        # 一致しない場合は空
+        response = client.get("/api/examples/search?q=nonexistent")
+        assert response.json()["items"] == []
+
+    def test_search_examples_keyset_pagination(self, client):
+        """GET /api/examples/search - スコア順のカーソルページネーションテスト"""
+        for i in range(5):
+            response = client.post(
+                "/api/examples/",
+                json={"name": f"Keyword {i}", "description": "keyword " * (i + 1)},
+            )
+            assert response.status_code == 201
+
+        seen = []
+        response = client.get("/api/examples/search?q=keyword&per_page=2")
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        while data["next_cursor"]:
+            response = client.get(
+                f"/api/examples/search?q=keyword&per_page=2&after={data['next_cursor']}"
+            )
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(item["id"] for item in data["items"])
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+        # スコアの降順に並んでいることを確認
+        response = client.get("/api/examples/search?q=keyword&per_page=5")
+        ranks = [item["rank"] for item in response.json()["items"]]
+        assert ranks == sorted(ranks, reverse=True)
+
+    def test_search_examples_highlight(self, client):
+        """GET /api/examples/search - highlight=true でスニペットを返すテスト"""
+        response = client.post(
+            "/api/examples/",
+            json={"name": "Highlight", "description": "text with a special word"},
+        )
+        assert response.status_code == 201
+
+        response = client.get("/api/examples/search?q=special&highlight=true")
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert "<mark>special</mark>" in item["headline"]
+
+    def test_search_examples_validation(self, client):
+        """GET /api/examples/search - クエリ未指定のバリデーションテスト"""
+        assert client.get("/api/examples/search").status_code == 422
+        assert client.get("/api/examples/search?q=").status_code == 422
+
+
+class TestExampleBulkAPI:
+    """Example 一括操作 API テストクラス"""
+
+    def test_bulk_create_examples(self, client):
+        """POST /api/examples/bulk - 複数行INSERTでの一括作成テスト"""
+        items = [{"name": f"Bulk {i}", "description": f"item {i}"} for i in range(5)]
+
+        response = client.post("/api/examples/bulk", json={"items": items})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 5
+        assert data["errors"] == []
+        assert [item["name"] for item in data["items"]] == [i["name"] for i in items]
+        assert all(item["is_active"] is True for item in data["items"])
+
+        # 作成されたデータが取得できることを確認
+        response = client.get(f"/api/examples/{data['items'][0]['id']}")
+        assert response.status_code == 200
+        assert client.get("/api/examples/").json()["total"] == 5
+
+    def test_bulk_create_examples_copy(self, client, monkeypatch):
+        """POST /api/examples/bulk - 閾値以上の件数は COPY で作成するテスト"""
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "bulk_copy_threshold", 3)
+        items = [{"name": f"Copy {i}", "is_active": i % 2 == 0} for i in range(10)]
+
+        response = client.post("/api/examples/bulk", json={"items": items})
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 10
+        ids = [item["id"] for item in data["items"]]
+        assert len(set(ids)) == 10
+
+        # 返却されたIDで実際に取得できることを確認
+        response = client.get(f"/api/examples/{ids[3]}")
+        assert response.status_code == 200
+        assert response.json()["name"] == "Copy 3"
+        assert response.json()["is_active"] is False
+
+        # 全文検索用の生成列も COPY で作成した行に反映される
+        response = client.get("/api/examples/search?q=copy&per_page=100")
+        assert len(response.json()["items"]) == 10
+
+    def test_bulk_create_examples_atomic_validation_error(self, client):
+        """POST /api/examples/bulk - atomic モードで不正なアイテムがある場合のテスト"""
+        items = [{"name": "Valid"}, {"name": ""}, {"description": "no name"}]
+
+        response = client.post("/api/examples/bulk", json={"items": items})
+
+        assert response.status_code == 422
+        # 1件も作成されない
+        assert client.get("/api/examples/").json()["total"] == 0
+
+    def test_bulk_create_examples_partial_validation_error(self, client):
+        """POST /api/examples/bulk - partial モードでアイテム単位のエラーを返すテスト"""
+        items = [{"name": "Valid 1"}, {"name": ""}, {"name": "Valid 2"}, {}]
+
+        response = client.post(
+            "/api/examples/bulk", json={"items": items, "mode": "partial"}
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 2
+        assert [item["name"] for item in data["items"]] == ["Valid 1", "Valid 2"]
+        assert [error["index"] for error in data["errors"]] == [1, 3]
+        assert data["errors"][0]["errors"][0]["loc"] == ["name"]
+
+    @pytest.mark.parametrize("copy_threshold", [1000, 1])
+    def test_bulk_create_examples_partial_database_error(
+        self, client, monkeypatch, copy_threshold
+    ):
+        """POST /api/examples/bulk - partial モードでDBエラーの行のみ失敗するテスト"""
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "bulk_copy_threshold", copy_threshold)
+        # NUL文字はバリデーションを通過するが PostgreSQL のテキストに格納できない
+        items = [{"name": "Before"}, {"name": "Broken\x00"}, {"name": "After"}]
+
+        response = client.post(
+            "/api/examples/bulk", json={"items": items, "mode": "partial"}
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Before", "After"]
+        assert [error["index"] for error in data["errors"]] == [1]
+        error = data["errors"][0]["errors"][0]
+        assert error["type"] == "database_error"
+        # ドライバーのメッセージはそのまま返さない
+        assert "0x00" not in error["msg"]
+        assert client.get("/api/examples/").json()["total"] == 2
+
+    def test_bulk_create_examples_partial_bisects_failures(self, client, monkeypatch):
+        """POST /api/examples/bulk - partial モードは失敗した行を二分で特定"""
+        from src.api.examples.services import ExampleService
+
+        write_examples = ExampleService._write_examples
+        writes = []
+
+        async def count_writes(db, rows):
+            writes.append(len(rows))
+            return await write_examples(db, rows)
+
+        monkeypatch.setattr(
+            ExampleService, "_write_examples", staticmethod(count_writes)
+        )
+        items = [{"name": f"Item {i}"} for i in range(16)]
+        items[5] = {"name": "Broken\x00"}
+
+        response = client.post(
+            "/api/examples/bulk", json={"items": items, "mode": "partial"}
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 15
+        assert [item["name"] for item in data["items"]] == [
+            item["name"] for index, item in enumerate(items) if index != 5
+        ]
+        assert [error["index"] for error in data["errors"]] == [5]
+        # 1件ずつの書き込み（16回）ではなく、失敗した側だけを半分に分けて書き込む
+        assert writes == [16, 8, 4, 4, 2, 1, 1, 2, 8]
+
+    def test_bulk_create_examples_atomic_database_error(self, client):
+        """POST /api/examples/bulk - atomic モードのDBエラー時のロールバックテスト"""
+        items = [{"name": "Before"}, {"name": "Broken\x00"}]
+
+        response = client.post("/api/examples/bulk", json={"items": items})
+
+        assert response.status_code == 422
+        assert client.get("/api/examples/").json()["total"] == 0
+
+    @pytest.mark.parametrize("mode", ["atomic", "partial"])
+    @pytest.mark.parametrize(
+        "error",
+        [
+            asyncpg.exceptions.QueryCanceledError("canceling statement"),
+            asyncpg.exceptions.CheckViolationError("no partition of relation"),
+        ],
+    )
+    def test_bulk_create_examples_server_error(self, client, monkeypatch, mode, error):
+        """POST /api/examples/bulk - 行の値によらないDBエラーは422にしないテスト"""
+        from src.api.examples.services import ExampleService
+
+        async def fail(db, rows):
+            raise error
+
+        monkeypatch.setattr(ExampleService, "_write_examples", staticmethod(fail))
+
+        response = client.post(
+            "/api/examples/bulk", json={"items": [{"name": "Item"}], "mode": mode}
+        )
+
+        assert response.status_code == 500
+        assert client.get("/api/examples/").json()["total"] == 0
+
+    def test_bulk_create_examples_limits(self, client, monkeypatch):
+        """POST /api/examples/bulk - 件数制限のテスト"""
+        from src.core.config import settings
+
+        assert client.post("/api/examples/bulk", json={"items": []}).status_code == 422
+
+        monkeypatch.setattr(settings, "bulk_max_items", 2)
+        items = [{"name": f"Item {i}"} for i in range(3)]
+        response = client.post("/api/examples/bulk", json={"items": items})
+        assert response.status_code == 422
+
+    def _create_bulk(self, client, count):
+        items = [{"name": f"Item {i}"} for i in range(count)]
+        response = client.post("/api/examples/bulk", json={"items": items})
+        assert response.status_code == 201
+        return [item["id"] for item in response.json()["items"]]
+
+    def test_bulk_update_examples(self, client):
+        """PATCH /api/examples/bulk - 複数IDの一括更新テスト"""
+        ids = self._create_bulk(client, 3)
+        missing_id = max(ids) + 1000
+
+        response = client.patch(
+            "/api/examples/bulk",
+            json={"ids": [ids[0], missing_id, ids[2]], "is_active": False},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == 2
+        assert data["missing_ids"] == [missing_id]
+        assert sorted(item["id"] for item in data["items"]) == [ids[0], ids[2]]
+        assert all(item["is_active"] is False for item in data["items"])
+        # 指定していないフィールドは変更されない
+        assert {item["name"] for item in data["items"]} == {"Item 0", "Item 2"}
+
+        # 対象外のレコードは更新されない
+        assert client.get(f"/api/examples/{ids[1]}").json()["is_active"] is True
+        assert client.get(f"/api/examples/{ids[0]}").json()["is_active"] is False
+
+    def test_bulk_update_examples_validation(self, client):
+        """PATCH /api/examples/bulk - バリデーションテスト"""
+        ids = self._create_bulk(client, 1)
+
+        # 更新フィールドなし
+        response = client.patch("/api/examples/bulk", json={"ids": ids})
+        assert response.status_code == 422
+
+        # ID未指定・不正な値
+        response = client.patch("/api/examples/bulk", json={"ids": [], "name": "x"})
+        assert response.status_code == 422
+        response = client.patch("/api/examples/bulk", json={"ids": ids, "name": ""})
+        assert response.status_code == 422
+
+    def test_bulk_delete_examples(self, client):
+        """DELETE /api/examples/bulk - 複数IDの一括削除テスト"""
+        ids = self._create_bulk(client, 3)
+        missing_id = max(ids) + 1000
+
+        response = client.request(
+            "DELETE", "/api/examples/bulk", json={"ids": [ids[0], ids[1], missing_id]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["deleted"] == 2
+        assert sorted(data["deleted_ids"]) == [ids[0], ids[1]]
+        assert data["missing_ids"] == [missing_id]
+
+        assert client.get(f"/api/examples/{ids[0]}").status_code == 404
+        assert client.get(f"/api/examples/{ids[2]}").status_code == 200
+        assert client.get("/api/examples/").json()["total"] == 1
+
+        # 同じIDを再度削除すると全て missing になる
+        response = client.request("DELETE", "/api/examples/bulk", json={"ids": ids[:2]})
+        assert response.json()["deleted"] == 0
+        assert response.json()["missing_ids"] == ids[:2]
+
+
+class TestExampleExportAPI:
+    """Example エクスポート API テストクラス"""
+
+    def _create_examples(self, client, count):
+        items = [
+            {"name": f"Export {i}", "description": f'row, "{i}"\n'}
+            for i in range(count)
+        ]
+        response = client.post("/api/examples/bulk", json={"items": items})
+        assert response.status_code == 201
+        return response.json()["items"]
+
+    def test_export_examples_ndjson(self, client, monkeypatch):
+        """GET /api/examples/export - NDJSON形式のエクスポートテスト"""
+        from src.core.config import settings
+
+        # バッチ境界をまたぐように取得件数を小さくする
+        monkeypatch.setattr(settings, "export_batch_size", 2)
+        created = self._create_examples(client, 5)
+
+        response = client.get("/api/examples/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "examples.ndjson" in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 5
+        # 一覧APIと同じ作成日時の降順
+        assert [row["id"] for row in rows] == [item["id"] for item in created][::-1]
+        assert set(rows[0]) == {
+            "id",
+            "name",
+            "description",
+            "is_active",
+            "created_at",
+            "updated_at",
+        }
+        assert rows[-1]["description"] == 'row, "0"\n'
+
+    def test_export_examples_csv(self, client):
+        """GET /api/examples/export - CSV形式のエクスポートテスト"""
+        self._create_examples(client, 3)
+
+        response = client.get("/api/examples/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == [
+            "id",
+            "name",
+            "description",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        assert len(rows) == 4
+        assert rows[-1][1] == "Export 0"
+        assert rows[-1][2] == 'row, "0"\n'
+
+    def test_export_examples_with_search(self, client):
+        """GET /api/examples/export - 一覧APIと同じ検索条件で絞り込むテスト"""
+        self._create_examples(client, 12)
+
+        response = client.get("/api/examples/export?search=Export 1")
+
+        names = [json.loads(line)["name"] for line in response.text.splitlines()]
+        assert sorted(names) == ["Export 1", "Export 10", "Export 11"]
+
+    def test_export_examples_empty_and_invalid_format(self, client):
+        """GET /api/examples/export - 空テーブルと不正な形式のテスト"""
+        response = client.get("/api/examples/export")
+        assert response.status_code == 200
+        assert response.text == ""
+
+        response = client.get("/api/examples/export?format=csv")
+        assert response.text.splitlines() == [
+            "id,name,description,is_active,created_at,updated_at"
+        ]
+
+        assert client.get("/api/examples/export?format=xml").status_code == 422
@@ -13,6 +13,7 @@ import pytest
 
 from src.api.health.schemas import HealthResponse, HealthStatus
 from src.api.health.services import HealthService
+from src.db.pool import InstrumentedAsyncQueuePool, PoolTelemetry
 
 
 class TestHealthAPI:
@@ -107,3 +108,120 @@ class TestHealthAPI:
 
         valid_statuses = [status.value for status in HealthStatus]
         assert "healthy" in valid_statuses
+
+
+class TestPartitionHealthAPI:
+    """パーティションのヘルスチェック API テストクラス"""
+
+    def test_partitions_healthy(self, client):
+        """GET /api/health/partitions - 先の月のパーティションがある場合は 200"""
+        response = client.get("/api/health/partitions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        tables = {table["table"]: table["months_ahead"] for table in data["tables"]}
+        assert tables["examples"] >= data["min_months_ahead"]
+
+    def test_partitions_unhealthy(self, client, monkeypatch):
+        """GET /api/health/partitions - 保守が止まり先の月がない場合は 503"""
+        monkeypatch.setattr(
+            "src.api.health.services.partition_coverage",
+            lambda conn, metadata: {"examples": 0},
+        )
+
+        response = client.get("/api/health/partitions")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "unhealthy"
+        assert response.json()["tables"] == [{"table": "examples", "months_ahead": 0}]
+
+
+class TestPoolStatusAPI:
+    """接続プール状況 API テストクラス"""
+
+    def test_get_pool_status_endpoint(self, client):
+        """GET /api/health/pool エンドポイントのテスト"""
+        from src.core.config import settings
+
+        response = client.get("/api/health/pool")
+
+        assert response.status_code == 200
+        [data] = response.json()["pools"]
+        assert data["name"] == "primary"
+        assert "***" in data["url"]
+        assert data["pool_class"] == "InstrumentedAsyncQueuePool"
+        assert data["size"] == settings.database_pool_size
+        assert data["timeout"] == settings.database_pool_timeout
+        assert data["checked_out"] >= 0
+        assert data["overflow"] >= 0
+        assert data["timeouts"] >= 0
+
+    def test_get_pool_status_includes_replicas(self, client, monkeypatch):
+        """GET /api/health/pool - 読み取りレプリカのプールも名前付きで返すことを確認"""
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from src.db.database import replica_router
+        from src.db.replicas import ReplicaRouter
+        from tests.conftest import TEST_DATABASE_URL, TestingSessionLocal
+
+        replica = create_async_engine(
+            TEST_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, pool_size=2
+        )
+        router = ReplicaRouter(TestingSessionLocal, [replica])
+        monkeypatch.setattr(replica_router, "replicas", router.replicas)
+
+        response = client.get("/api/health/pool")
+
+        assert response.status_code == 200
+        primary, replica_pool = response.json()["pools"]
+        assert primary["name"] == "primary"
+        assert replica_pool["name"] == "replica-1"
+        assert replica_pool["size"] == 2
+        assert replica_pool["pool_class"] == "InstrumentedAsyncQueuePool"
+
+    def test_pool_status_hidden_from_schema(self, client):
+        """内部向けエンドポイントがOpenAPIスキーマに含まれないことを確認"""
+        response = client.get("/openapi.json")
+
+        assert "/api/health/pool" not in response.json()["paths"]
+
+    def test_get_statement_cache_status_endpoint(self, client):
+        """GET /api/health/statements エンドポイントのテスト"""
+        response = client.get("/api/health/statements")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "example.get" in data["registered"]
+        assert "example.list_page" in data["registered"]
+        assert data["hits"] >= 0
+        assert data["misses"] >= 0
+        assert 0.0 <= data["hit_ratio"] <= 1.0
+
+    def test_pool_telemetry_records_wait_times(self):
+        """PoolTelemetry - 待ち時間とタイムアウトの集計テスト"""
+        telemetry = PoolTelemetry()
+        assert telemetry.average_wait_time == 0.0
+
+        telemetry.record_checkout(0.1)
+        telemetry.record_checkout(0.3, timed_out=True)
+
+        assert telemetry.checkouts == 2
+        assert telemetry.timeouts == 1
+        assert telemetry.average_wait_time == pytest.approx(0.2)
+        assert telemetry.max_wait_time == pytest.approx(0.3)
+
+        telemetry.reset()
+        assert telemetry.checkouts == 0
+        assert telemetry.max_wait_time == 0.0
+
+    def test_pool_telemetry_per_pool(self):
+        """PoolTelemetry - プールごとに集計し、作り直しても引き継ぐことを確認"""
+        primary = InstrumentedAsyncQueuePool(lambda: None)
+        replica = InstrumentedAsyncQueuePool(lambda: None)
+
+        primary.telemetry.record_checkout(0.1)
+
+        assert primary.telemetry is not replica.telemetry
+        assert replica.telemetry.checkouts == 0
+        assert primary.recreate().telemetry is primary.telemetry
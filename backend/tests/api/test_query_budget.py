@@ -0,0 +1,128 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+import pytest
+
+from src.core.config import settings
+from src.db.instrumentation import QueryBudgetExceededError
+
+
+@pytest.fixture
+def created_examples(client, multiple_example_data):
+    """Example を作成しておく"""
+    return [
+        client.post("/api/examples/", json=data).json()
+        for data in multiple_example_data
+    ]
+
+
+class TestEndpointQueryCounts:
+    """エンドポイントごとのSQL文の件数のテスト"""
+
+    def test_get_example(self, client, created_examples, count_queries):
+        """GET /api/examples/{id} は1文で取得し、2回目はキャッシュを使うことを確認"""
+        with count_queries() as counter:
+            response = client.get(f"/api/examples/{created_examples[0]['id']}")
+
+        assert response.status_code == 200
+        assert counter.statements == 1
+
+        with count_queries() as counter:
+            client.get(f"/api/examples/{created_examples[0]['id']}")
+
+        assert counter.statements == 0
+
+    def test_create_example(self, client, sample_example_data, count_queries):
+        """POST /api/examples/ は INSERT ... RETURNING の1文で作成することを確認"""
+        with count_queries() as counter:
+            response = client.post("/api/examples/", json=sample_example_data)
+
+        assert response.status_code == 201
+        assert counter.statements == 1
+
+    def test_list_examples(self, client, created_examples, count_queries):
+        """GET /api/examples/ は3文で取得し、以降は件数とレスポンスのキャッシュを使う"""
+        with count_queries() as counter:
+            response = client.get("/api/examples/")
+
+        # 件数・最終更新日時（ETag 用）・ページ
+        assert response.status_code == 200
+        assert counter.statements == 3
+
+        with count_queries() as counter:
+            client.get("/api/examples/", params={"per_page": 5})
+
+        assert counter.statements == 2
+
+        with count_queries() as counter:
+            response = client.get("/api/examples/")
+
+        assert response.headers["X-Cache"] == "HIT"
+        assert counter.statements == 0
+
+    def test_list_examples_with_search(self, client, created_examples, count_queries):
+        """検索条件がある一覧は ETag の材料を取得せず、件数とページの2文で取得する"""
+        with count_queries() as counter:
+            response = client.get("/api/examples/", params={"search": "Example"})
+
+        assert response.status_code == 200
+        assert counter.statements == 2
+
+    def test_list_examples_revalidation(
+        self, client, created_examples, count_queries, monkeypatch
+    ):
+        """If-None-Match の再検証はページを取得せず1文で 304 を返すことを確認"""
+        from src.core.response_cache import response_cache
+
+        monkeypatch.setattr(response_cache, "ttl", 0)
+        etag = client.get("/api/examples/").headers["ETag"]
+
+        with count_queries() as counter:
+            response = client.get("/api/examples/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert counter.statements == 1
+
+    def test_search_examples(self, client, created_examples, count_queries):
+        """GET /api/examples/search は1文で検索することを確認"""
+        with count_queries() as counter:
+            response = client.get("/api/examples/search", params={"q": "Example"})
+
+        assert response.status_code == 200
+        assert counter.statements == 1
+
+    def test_bulk_delete_examples(self, client, created_examples, count_queries):
+        """DELETE /api/examples/bulk は件数によらず1文で削除することを確認"""
+        ids = [example["id"] for example in created_examples]
+
+        with count_queries() as counter:
+            response = client.request("DELETE", "/api/examples/bulk", json={"ids": ids})
+
+        assert response.status_code == 200
+        assert counter.statements == 1
+
+
+class TestQueryBudget:
+    """リクエストごとのSQL文の予算のテスト"""
+
+    def test_strict_budget_raises(self, client, created_examples, monkeypatch):
+        """strict の場合は予算超過で例外になることを確認"""
+        monkeypatch.setattr(settings, "database_request_statement_budget", 1)
+
+        with pytest.raises(QueryBudgetExceededError, match="3 statements"):
+            client.get("/api/examples/")
+
+    def test_budget_warns(self, client, created_examples, monkeypatch, caplog):
+        """strict でない場合は予算超過を警告ログに出力して応答することを確認"""
+        monkeypatch.setattr(settings, "database_request_statement_budget", 1)
+        monkeypatch.setattr(settings, "database_query_budget_strict", False)
+
+        response = client.get("/api/examples/")
+
+        assert response.status_code == 200
+        assert "Query budget exceeded for GET /api/examples/" in caplog.text
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.requests import Request
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.api.common.routing import REQUEST_PARAM
+from src.api.common.timeouts import DBTimeBudgetRoute, db_time_budget
+from src.api.examples.services import ExampleService
+from src.core.config import settings
+from src.core.middleware import ErrorHandlerMiddleware
+from src.db.timeouts import (
+    ClientDisconnectedError,
+    is_query_timeout,
+    set_time_budget,
+)
+from tests.conftest import TestingSessionLocal
+
+
+async def _sleep_in_db(seconds: float) -> None:
+    async with TestingSessionLocal() as session:
+        await session.execute(text(f"SELECT pg_sleep({seconds})"))
+
+
+def _timeout_app() -> TestClient:
+    """DB時間予算を指定したルートを持つテスト用アプリ"""
+    app = FastAPI()
+    app.router.route_class = DBTimeBudgetRoute
+    app.add_middleware(ErrorHandlerMiddleware)
+
+    @app.get("/slow")
+    @db_time_budget(0.2)
+    async def slow() -> dict[str, str]:
+        await _sleep_in_db(5)
+        return {"status": "done"}
+
+    @app.get("/pool")
+    async def pool() -> dict[str, str]:
+        raise PoolTimeoutError("QueuePool limit reached")
+
+    return TestClient(app)
+
+
+class TestStatementTimeout:
+    """ルートごとのDB時間予算のテスト"""
+
+    def test_set_local_statement_timeout(self):
+        """既定値と異なる予算が SET LOCAL で適用されることを確認"""
+
+        async def run():
+            set_time_budget(0.25)
+            async with TestingSessionLocal() as session:
+                result = await session.execute(text("SHOW statement_timeout"))
+                return result.scalar_one()
+
+        assert asyncio.run(run()) == "250ms"
+
+    def test_query_cancelled_by_statement_timeout(self):
+        """予算を超えたクエリが DB 側でキャンセルされることを確認"""
+
+        async def run():
+            set_time_budget(0.1)
+            await _sleep_in_db(5)
+
+        start_time = time.perf_counter()
+        with pytest.raises(DBAPIError) as exc_info:
+            asyncio.run(run())
+
+        assert is_query_timeout(exc_info.value)
+        assert time.perf_counter() - start_time < 2
+
+    def test_route_budget_returns_504(self):
+        """ルートで指定した予算を超えた場合に 504 を返すことを確認"""
+        client = _timeout_app()
+
+        start_time = time.perf_counter()
+        response = client.get("/slow")
+
+        assert response.status_code == 504
+        assert response.json()["message"] == "Database query timed out"
+        assert time.perf_counter() - start_time < 2
+
+    def test_default_budget_enforced_on_asyncio_side(self, client, monkeypatch):
+        """既定の予算を asyncio 側でも打ち切り、504 を返すことを確認"""
+        monkeypatch.setattr(settings, "database_statement_timeout", 0.2)
+
+        async def slow_get_example(db, example_id, session_maker):
+            await db.execute(text("SELECT pg_sleep(5)"))
+
+        monkeypatch.setattr(ExampleService, "get_example", slow_get_example)
+
+        start_time = time.perf_counter()
+        response = client.get("/api/examples/1")
+
+        assert response.status_code == 504
+        assert time.perf_counter() - start_time < 2
+
+    def test_pool_timeout_returns_503(self):
+        """接続プールの取得待ちタイムアウトで 503 を返すことを確認"""
+        response = _timeout_app().get("/pool")
+
+        assert response.status_code == 503
+        assert response.json()["error"] is True
+
+    def test_client_disconnect_cancels_query(self):
+        """クライアントが切断した場合に実行中のクエリをキャンセルすることを確認"""
+
+        @db_time_budget()
+        async def endpoint() -> None:
+            await _sleep_in_db(5)
+
+        async def receive():
+            await asyncio.sleep(0.1)
+            return {"type": "http.disconnect"}
+
+        async def run():
+            request = Request({"type": "http", "method": "GET"}, receive)
+            with pytest.raises(ClientDisconnectedError):
+                await endpoint(**{REQUEST_PARAM: request})
+
+            async with TestingSessionLocal() as session:
+                result = await session.execute(
+                    text(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE query LIKE 'SELECT pg_sleep%' AND state = 'active'"
+                    )
+                )
+                return result.scalar_one()
+
+        start_time = time.perf_counter()
+        assert asyncio.run(run()) == 0
+        assert time.perf_counter() - start_time < 2
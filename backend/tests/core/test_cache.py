@@ -0,0 +1,150 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+import pytest
+
+from src.core.cache import EntityCache, SingleFlight, TTLCache
+
+
+class TestTTLCache:
+    """TTLキャッシュの統計のテスト"""
+
+    def test_counts_hits_misses_and_evictions(self, monkeypatch):
+        """ヒット・ミス・最大件数超過と期限切れによる破棄を数えることを確認"""
+        now = [0.0]
+        monkeypatch.setattr("src.core.cache.time.monotonic", lambda: now[0])
+        cache: TTLCache[str, int] = TTLCache(ttl=10, max_entries=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        now[0] = 10
+        assert cache.get("c") is None
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert (stats.evictions, stats.expirations) == (1, 1)
+        assert stats.entries == 1
+        assert stats.hit_ratio == pytest.approx(1 / 3)
+
+
+class TestSingleFlight:
+    """同時の呼び出しをまとめる処理のテスト"""
+
+    def test_coalesces_concurrent_calls(self):
+        """同じキーの同時の呼び出しは1回だけ実行することを確認"""
+        flights: SingleFlight[int, str] = SingleFlight()
+        calls = []
+
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return f"value {key}"
+
+        async def run():
+            return await asyncio.gather(
+                *(flights.do(key, lambda key=key: load(key)) for key in [1, 1, 1, 2])
+            )
+
+        assert asyncio.run(run()) == ["value 1", "value 1", "value 1", "value 2"]
+        assert calls == [1, 2]
+        assert (flights.executions, flights.coalesced) == (2, 2)
+        assert not flights.in_flight(1)
+
+    def test_exception_is_shared(self):
+        """先行する呼び出しの例外が待機中の呼び出しにも送られることを確認"""
+        flights: SingleFlight[int, str] = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise LookupError("missing")
+
+        async def run():
+            return await asyncio.gather(
+                flights.do(1, fail), flights.do(1, fail), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert [type(result) for result in results] == [LookupError, LookupError]
+
+    def test_waiter_retries_after_leader_cancelled(self):
+        """先行する呼び出しがキャンセルされた場合は待機側が改めて実行することを確認"""
+        flights: SingleFlight[int, str] = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            leader = asyncio.create_task(flights.do(1, load))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flights.do(1, load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()) == "value"
+        assert calls == 2
+
+
+class TestEntityCache:
+    """読み取りスルーのエンティティキャッシュのテスト"""
+
+    def test_loads_once_and_caches(self):
+        """同時のミスは1回の取得にまとめ、以降はキャッシュから返すことを確認"""
+        cache: EntityCache[int, str] = EntityCache(ttl=60, max_entries=10)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            await asyncio.gather(*(cache.get_or_load(1, load) for _ in range(5)))
+            return await cache.get_or_load(1, load)
+
+        assert asyncio.run(run()) == "value"
+        assert calls == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.coalesced) == (1, 5, 4)
+
+    def test_invalidated_during_load_is_not_cached(self):
+        """取得中に破棄したキーは、取得した値を登録しないことを確認"""
+        cache: EntityCache[int, str] = EntityCache(ttl=60, max_entries=10)
+        values = iter(["before write", "after write"])
+
+        async def load():
+            await asyncio.sleep(0.01)
+            return next(values)
+
+        async def run():
+            loading = asyncio.create_task(cache.get_or_load(1, load))
+            await asyncio.sleep(0)
+            cache.invalidate(1)
+            first = await loading
+            return first, await cache.get_or_load(1, load)
+
+        assert asyncio.run(run()) == ("before write", "after write")
+
+    def test_disabled(self):
+        """ttl が0の場合はキャッシュしないことを確認"""
+        cache: EntityCache[int, str] = EntityCache(ttl=0, max_entries=10)
+
+        async def load():
+            return "value"
+
+        assert asyncio.run(cache.get_or_load(1, load)) == "value"
+        assert len(cache) == 0
@@ -0,0 +1,185 @@
+import asyncio
+import gzip
+import zlib
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from src.core.compression import (
+    CompressionMiddleware,
+    compression_stats,
+    negotiate_encoding,
+)
+
+LARGE_TEXT = "compressible text " * 100
+
+
+@pytest.fixture
+def compressed_app():
+    """圧縮ミドルウェアを付けたアプリ（gzip のみ、500バイト以上を圧縮）"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+    @app.get("/large")
+    async def large() -> Response:
+        return PlainTextResponse(LARGE_TEXT, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small() -> Response:
+        return PlainTextResponse("small")
+
+    @app.get("/encoded")
+    async def encoded() -> Response:
+        body = gzip.compress(LARGE_TEXT.encode())
+        return Response(
+            body, media_type="text/plain", headers={"Content-Encoding": "gzip"}
+        )
+
+    @app.get("/image")
+    async def image() -> Response:
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream() -> Response:
+        async def lines():
+            for i in range(3):
+                yield f'{{"line": {i}}}\n'
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    compression_stats.reset()
+    yield app
+    compression_stats.reset()
+
+
+def get(app: FastAPI, path: str, accept_encoding: str = "gzip") -> httpx.Response:
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+            return await ac.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    return asyncio.run(run())
+
+
+class TestNegotiateEncoding:
+    """Accept-Encoding のネゴシエーションのテスト"""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            ("gzip, br, zstd", "zstd"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0.5, zstd;q=0", "br"),
+            ("*", "zstd"),
+            ("gzip;q=0, *", "zstd"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding, expected):
+        """q 値が高いもの、同じ場合はサーバーの優先順の形式を選ぶことを確認"""
+        encodings = ["zstd", "br", "gzip"]
+
+        assert negotiate_encoding(accept_encoding, encodings) == expected
+
+
+class TestCompressionMiddleware:
+    """レスポンス圧縮ミドルウェアのテスト"""
+
+    def test_compresses_large_body(self, compressed_app):
+        """最小サイズ以上の本文を圧縮し、ヘッダーを付け替えることを確認"""
+        response = get(compressed_app, "/large")
+
+        assert response.text == LARGE_TEXT
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(LARGE_TEXT)
+
+        stats = dict(compression_stats.items())["gzip"]
+        assert stats.responses == 1
+        assert stats.bytes_in == len(LARGE_TEXT)
+        assert stats.bytes_out == int(response.headers["content-length"])
+        assert stats.bytes_saved > 0
+
+    @pytest.mark.parametrize("path", ["/small", "/encoded", "/image"])
+    def test_skips(self, compressed_app, path):
+        """小さい・圧縮済み・圧縮対象外の本文はそのまま返すことを確認"""
+        response = get(compressed_app, path)
+
+        assert response.headers.get("vary") is None
+        assert compression_stats.skipped == 1
+        assert compression_stats.items() == []
+
+    def test_client_without_support(self, compressed_app):
+        """対応する形式がない場合は圧縮しないことを確認"""
+        response = get(compressed_app, "/large", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.text == LARGE_TEXT
+
+    def test_streams_incrementally(self, compressed_app):
+        """StreamingResponse は断片ごとに、その時点で復元できる形で送ることを確認"""
+        messages: list[dict] = []
+
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            # 送信が終わるまで切断しない
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/stream",
+            "raw_path": b"/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"accept-encoding", b"gzip")],
+            "server": ("t", 80),
+        }
+        asyncio.run(compressed_app(scope, receive, send))
+
+        start, *bodies = messages
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        # ASGI の本文のメッセージごとに、その行までを復元できる
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        lines = [decompressor.decompress(message["body"]) for message in bodies]
+        assert lines == [
+            b'{"line": 0}\n',
+            b'{"line": 1}\n',
+            b'{"line": 2}\n',
+            b"",
+        ]
+        assert decompressor.eof
+
+
+@pytest.mark.parametrize(
+    ("encoding", "module"), [("br", "brotli"), ("zstd", "zstandard")]
+)
+def test_optional_encodings(encoding, module):
+    """brotli / zstandard がある場合はその形式で圧縮することを確認"""
+    pytest.importorskip(module)
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=[encoding])
+
+    @app.get("/large")
+    async def large() -> Response:
+        return PlainTextResponse(LARGE_TEXT)
+
+    response = get(app, "/large", accept_encoding=encoding)
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.text == LARGE_TEXT
@@ -0,0 +1,118 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+import logging
+
+import pytest
+
+from src.core.response_cache import (
+    MemoryBackend,
+    NullBackend,
+    RedisBackend,
+    ResponseCache,
+    ResponseCacheBackend,
+)
+
+
+def redis_backend() -> RedisBackend:
+    """fakeredis の Redis 互換のクライアントを使うバックエンド"""
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisBackend(fakeredis.FakeAsyncRedis(), prefix="test:")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request) -> ResponseCacheBackend:
+    if request.param == "redis":
+        return redis_backend()
+    return MemoryBackend(max_entries=10)
+
+
+class TestResponseCache:
+    """バージョン番号で無効化するレスポンスキャッシュのテスト"""
+
+    def test_store_and_invalidate(self, backend):
+        """保存したレスポンスを返し、バージョン番号を上げると返さないことを確認"""
+        cache = ResponseCache(backend, ttl=60)
+
+        async def run():
+            key, body = await cache.lookup("examples", "/api/examples/?page=1")
+            assert body is None
+            await cache.store(key, b'{"items":[]}', None)
+
+            assert (await cache.lookup("examples", "/api/examples/?page=1"))[1] == (
+                b'{"items":[]}'
+            )
+
+            # 他の名前空間の無効化は影響しない
+            await cache.invalidate("others")
+            assert (await cache.lookup("examples", "/api/examples/?page=1"))[1]
+
+            await cache.invalidate("examples")
+            new_key, body = await cache.lookup("examples", "/api/examples/?page=1")
+            assert body is None
+            assert new_key != key
+
+        asyncio.run(run())
+
+    def test_entries_expire(self, backend, monkeypatch):
+        """ttl を過ぎたレスポンスは返さないことを確認"""
+        cache = ResponseCache(backend, ttl=60)
+
+        async def run():
+            key, _ = await cache.lookup("examples", "/api/examples/")
+            await cache.store(key, b"{}", 0.05)
+            await asyncio.sleep(0.1)
+            return await cache.lookup("examples", "/api/examples/")
+
+        assert asyncio.run(run())[1] is None
+
+    def test_backend_errors_are_misses(self, caplog):
+        """保存先のエラーはミスとして扱い、例外を送出しないことを確認"""
+
+        class BrokenBackend(NullBackend):
+            async def get_version(self, namespace: str) -> int:
+                raise ConnectionError("connection refused")
+
+            async def bump_version(self, namespace: str) -> None:
+                raise ConnectionError("connection refused")
+
+        cache = ResponseCache(BrokenBackend(), ttl=60)
+
+        async def run():
+            key, body = await cache.lookup("examples", "/api/examples/")
+            await cache.store(key, b"{}", None)
+            await cache.invalidate("examples")
+            return body
+
+        with caplog.at_level(logging.WARNING, logger="src.core.response_cache"):
+            assert asyncio.run(run()) is None
+
+        assert "Response cache lookup failed" in caplog.text
+        assert "Response cache invalidation failed for examples" in caplog.text
+
+    def test_disabled(self):
+        """none バックエンドと ttl が0の場合は無効になることを確認"""
+        assert not ResponseCache(NullBackend(), ttl=60).enabled
+        assert not ResponseCache(MemoryBackend(max_entries=10), ttl=0).enabled
+
+
+class TestRedisBackend:
+    """Redis バックエンドのテスト"""
+
+    def test_lost_version_is_not_reused(self):
+        """バージョン番号のキーが失われても、以前の番号から再開しないことを確認"""
+        backend = redis_backend()
+
+        async def run():
+            await backend.bump_version("examples")
+            before = await backend.get_version("examples")
+            await backend.client.delete("test:version:examples")
+            return before, await backend.get_version("examples")
+
+        before, after = asyncio.run(run())
+        assert after > before
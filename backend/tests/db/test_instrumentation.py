@@ -0,0 +1,219 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api.examples.services import GET_EXAMPLE
+from src.core.config import settings
+from src.db.instrumentation import (
+    QueryBudgetExceededError,
+    QueryStatsCollector,
+    RequestQueryCounter,
+    check_request_queries,
+    count_request_queries,
+    instrument_engine,
+    normalize_sql,
+    query_stats,
+)
+from tests.conftest import TEST_DATABASE_URL
+
+
+class TestNormalizeSql:
+    """SQL文の正規化のテスト"""
+
+    def test_replaces_literals_and_placeholders(self):
+        """リテラルとプレースホルダが ? に置き換わることを確認"""
+        statement = (
+            "SELECT examples.id FROM examples\n"
+            "WHERE examples.id = $1::INTEGER AND name = 'it''s' LIMIT 10"
+        )
+
+        assert normalize_sql(statement) == (
+            "SELECT examples.id FROM examples "
+            "WHERE examples.id = ? AND name = ? LIMIT ?"
+        )
+
+    def test_replaces_multi_word_casts(self):
+        """複数語の型へのキャストもプレースホルダとまとめて置き換わることを確認"""
+        statement = (
+            "INSERT INTO t (a, b) VALUES ($1::TIMESTAMP WITHOUT TIME ZONE, "
+            "$2::DOUBLE PRECISION)"
+        )
+
+        assert normalize_sql(statement) == "INSERT INTO t (a, b) VALUES (?, ?)"
+
+    def test_collapses_in_lists(self):
+        """IN の要素数が異なっても同じ文になることを確認"""
+        two = normalize_sql("SELECT * FROM t WHERE id IN ($1::INTEGER, $2::INTEGER)")
+        three = normalize_sql("SELECT * FROM t WHERE id IN ($1, $2, $3)")
+
+        assert two == three == "SELECT * FROM t WHERE id IN (?, ...)"
+
+    def test_keeps_identifiers_with_digits(self):
+        """数字を含む識別子は置き換えないことを確認"""
+        assert normalize_sql("SELECT t1.c2 FROM t1") == "SELECT t1.c2 FROM t1"
+
+
+class TestQueryStatsCollector:
+    """SQL実行統計の集計のテスト"""
+
+    def test_aggregates_by_normalized_statement(self):
+        """正規化後に同じ文は1件にまとめて集計されることを確認"""
+        collector = QueryStatsCollector(max_statements=10, sample_size=100)
+        collector.record("SELECT * FROM t WHERE id = $1", 0.1, 1)
+        collector.record("SELECT * FROM t WHERE id = $1", 0.3, 1)
+
+        [(statement, stats)] = collector.items()
+        assert statement == "SELECT * FROM t WHERE id = ?"
+        assert stats.calls == 2
+        assert stats.rows == 2
+        assert stats.total_time == pytest.approx(0.4)
+        assert stats.mean_time == pytest.approx(0.2)
+        assert stats.max_time == pytest.approx(0.3)
+
+    def test_p95_uses_recent_samples(self):
+        """p95 は直近 sample_size 件の実行時間から求めることを確認"""
+        collector = QueryStatsCollector(max_statements=10, sample_size=20)
+        for _ in range(100):
+            collector.record("SELECT 1", 10.0, 0)
+        for duration in range(1, 21):
+            collector.record("SELECT 1", duration / 100, 0)
+
+        [(_, stats)] = collector.items()
+        assert stats.p95_time == pytest.approx(0.20)
+        assert stats.max_time == 10.0
+
+    def test_drops_statements_over_limit(self):
+        """文の種類が上限を超えた分は dropped に数えることを確認"""
+        collector = QueryStatsCollector(max_statements=1, sample_size=10)
+        collector.record("SELECT a FROM t", 0.1, 0)
+        collector.record("SELECT b FROM t", 0.1, 0)
+
+        assert [statement for statement, _ in collector.items()] == ["SELECT a FROM t"]
+        assert collector.dropped == 1
+
+        collector.reset()
+        assert collector.items() == []
+        assert collector.dropped == 0
+
+
+class TestInstrumentEngine:
+    """エンジンへの計測の組み込みのテスト"""
+
+    def test_records_executed_statements(self):
+        """実行したSQL文の回数と行数が記録されることを確認"""
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        instrument_engine(engine)
+
+        async def execute():
+            async with engine.connect() as conn:
+                query_stats.reset()
+                for example_id in range(3):
+                    await conn.execute(GET_EXAMPLE, {"example_id": example_id})
+                await conn.execute(text("SELECT generate_series(1, 5)"))
+            await engine.dispose()
+
+        asyncio.run(execute())
+
+        stats = dict(query_stats.items())
+        get_example = next(s for key, s in stats.items() if "FROM examples" in key)
+        assert get_example.calls == 3
+        assert get_example.rows == 0
+        assert stats["SELECT generate_series(?, ?)"].rows == 5
+
+    def test_logs_slow_queries_without_parameters(self, monkeypatch, caplog):
+        """しきい値を超えたSQLはバインド値を伏せてログに出力されることを確認"""
+        monkeypatch.setattr(settings, "database_slow_query_threshold", 0.05)
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        instrument_engine(engine)
+
+        async def execute():
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text("SELECT pg_sleep(0.1), CAST(:secret AS text)"),
+                    {"secret": "top-secret-value"},
+                )
+                await conn.execute(text("SELECT 1"))
+            await engine.dispose()
+
+        with caplog.at_level(logging.WARNING, logger="src.db.instrumentation"):
+            asyncio.run(execute())
+
+        [record] = caplog.records
+        assert "pg_sleep(?)" in record.getMessage()
+        assert "1 parameters redacted" in record.getMessage()
+        assert "top-secret-value" not in record.getMessage()
+
+
+class TestRequestQueryCounter:
+    """リクエストごとのSQL文の集計のテスト"""
+
+    def test_counts_statements_in_context(self):
+        """count_request_queries のブロック内で実行した文だけを数えることを確認"""
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        instrument_engine(engine)
+
+        async def execute():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                with count_request_queries() as counter:
+                    for example_id in range(3):
+                        await conn.execute(GET_EXAMPLE, {"example_id": example_id})
+                await conn.execute(text("SELECT 1"))
+            await engine.dispose()
+            return counter
+
+        counter = asyncio.run(execute())
+
+        assert counter.statements == 3
+        assert counter.total_time > 0
+        [(statement, count)] = counter.shapes.items()
+        assert "FROM examples" in statement
+        assert count == 3
+
+    def test_detects_repeated_statements(self, monkeypatch):
+        """同じ形の文の繰り返しを N+1 として検出することを確認"""
+        monkeypatch.setattr(settings, "database_request_repeated_statement_limit", 3)
+        counter = RequestQueryCounter()
+        for example_id in range(3):
+            counter.record(normalize_sql(f"SELECT * FROM t WHERE id = {example_id}"), 0)
+
+        assert counter.violations() == [
+            "same statement repeated 3 times: SELECT * FROM t WHERE id = ?"
+        ]
+
+    def test_within_budget(self, monkeypatch):
+        """予算内であれば何も検出しないことを確認"""
+        monkeypatch.setattr(settings, "database_request_statement_budget", 2)
+        counter = RequestQueryCounter()
+        counter.record("SELECT a FROM t", 0)
+        counter.record("SELECT b FROM t", 0)
+
+        assert counter.violations() == []
+        check_request_queries(counter, "GET /")
+
+    def test_check_strict_or_warn(self, monkeypatch, caplog):
+        """strict では例外、そうでなければ警告ログになることを確認"""
+        monkeypatch.setattr(settings, "database_request_statement_budget", 1)
+        counter = RequestQueryCounter()
+        counter.record("SELECT a FROM t", 0)
+        counter.record("SELECT b FROM t", 0)
+
+        monkeypatch.setattr(settings, "database_query_budget_strict", True)
+        with pytest.raises(QueryBudgetExceededError, match="GET /"):
+            check_request_queries(counter, "GET /")
+
+        monkeypatch.setattr(settings, "database_query_budget_strict", False)
+        with caplog.at_level(logging.WARNING, logger="src.db.instrumentation"):
+            check_request_queries(counter, "GET /")
+        assert "2 statements (budget 1)" in caplog.text
@@ -0,0 +1,465 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, event, select, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from src.api.examples.schemas import (
+    ExampleBulkCreate,
+    ExampleBulkDelete,
+    ExampleCreate,
+    ExampleUpdate,
+)
+from src.api.examples.services import ExampleService
+from src.core.config import settings
+from src.db.models.example import Example, ExampleKey
+from src.db.partitions import (
+    PARTITION_LOCK,
+    add_months,
+    create_partitions,
+    detach_partitions_before,
+    is_partition_name,
+    is_range_partitioned,
+    list_partitions,
+    maintain_partitions,
+    month_start,
+    partition_coverage,
+    uncovered_tables,
+)
+from src.db.unit_of_work import UNIT_OF_WORK
+from tests.conftest import TestingSessionLocal, test_engine
+
+metadata = MetaData()
+
+# テスト用の範囲パーティションのテーブル（examples のパーティションには触れない）
+events = Table(
+    "partition_test_events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime, primary_key=True),
+    postgresql_partition_by="RANGE (created_at)",
+    info={"key_table": "partition_test_event_keys"},
+)
+event_keys = Table(
+    "partition_test_event_keys",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+def run_sync(fn, *args, **kwargs):
+    """テスト用エンジンのトランザクション内で同期関数を実行"""
+
+    async def execute():
+        async with test_engine.begin() as conn:
+            return await conn.run_sync(lambda sync_conn: fn(sync_conn, *args, **kwargs))
+
+    return asyncio.run(execute())
+
+
+@pytest.fixture
+def events_table():
+    """パーティションのないテスト用の親テーブルと対応表を作成し、終了後に削除"""
+    run_sync(metadata.create_all)
+    yield events.name
+    run_sync(metadata.drop_all)
+
+
+def partition_names(table: str) -> list[str]:
+    return [partition.name for partition in run_sync(list_partitions, table)]
+
+
+class TestMonthArithmetic:
+    """月の計算のテスト"""
+
+    def test_month_start(self):
+        assert month_start(datetime(2026, 10, 16, 12, 30, 5, 1)) == datetime(
+            2026, 10, 1
+        )
+
+    def test_add_months_across_years(self):
+        assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+        assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+    def test_partition_detection(self):
+        """モデルの partition_by とパーティション名を判定できることを確認"""
+        assert is_range_partitioned(Example.__table__)
+        assert is_partition_name("examples_p2026_10")
+        assert not is_partition_name("examples")
+
+
+class TestPartitionManagement:
+    """月次パーティションの作成と切り離しのテスト"""
+
+    def test_create_partitions_is_idempotent(self, events_table):
+        """両端の月を含めて作成し、既存の月は作成しないことを確認"""
+        created = run_sync(
+            create_partitions,
+            events_table,
+            datetime(2026, 11, 20),
+            datetime(2027, 1, 5),
+        )
+        assert created == [
+            "partition_test_events_p2026_11",
+            "partition_test_events_p2026_12",
+            "partition_test_events_p2027_01",
+        ]
+
+        created = run_sync(
+            create_partitions,
+            events_table,
+            datetime(2026, 12, 1),
+            datetime(2027, 2, 1),
+        )
+        assert created == ["partition_test_events_p2027_02"]
+
+    def test_rows_routed_by_created_at(self, events_table):
+        """行が created_at の月のパーティションに格納されることを確認"""
+        run_sync(
+            create_partitions, events_table, datetime(2026, 9, 1), datetime(2026, 10, 1)
+        )
+
+        def insert_and_locate(conn):
+            conn.execute(
+                text(
+                    f"INSERT INTO {events_table} VALUES "
+                    "(1, '2026-09-30 23:59:59'), (2, '2026-10-01 00:00:00')"
+                )
+            )
+            rows = conn.execute(
+                text(f"SELECT id, tableoid::regclass::text FROM {events_table}")
+            )
+            return dict(rows.all())
+
+        assert run_sync(insert_and_locate) == {
+            1: "partition_test_events_p2026_09",
+            2: "partition_test_events_p2026_10",
+        }
+
+    def test_detach_partitions_before(self, events_table):
+        """指定した月より前のパーティションだけを切り離し、drop で削除することを確認"""
+        run_sync(
+            create_partitions, events_table, datetime(2026, 1, 1), datetime(2026, 4, 1)
+        )
+
+        detached = run_sync(
+            detach_partitions_before, events_table, datetime(2026, 2, 15)
+        )
+        assert detached == ["partition_test_events_p2026_01"]
+        assert partition_names(events_table) == [
+            "partition_test_events_p2026_02",
+            "partition_test_events_p2026_03",
+            "partition_test_events_p2026_04",
+        ]
+
+        # 切り離したパーティションは通常のテーブルとして残る
+        def table_exists(conn, name):
+            return conn.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+            ).scalar()
+
+        assert run_sync(table_exists, "partition_test_events_p2026_01")
+        run_sync(
+            lambda conn: conn.execute(text("DROP TABLE partition_test_events_p2026_01"))
+        )
+
+        detached = run_sync(
+            detach_partitions_before, events_table, datetime(2026, 4, 1), drop=True
+        )
+        assert detached == [
+            "partition_test_events_p2026_02",
+            "partition_test_events_p2026_03",
+        ]
+        assert not run_sync(table_exists, "partition_test_events_p2026_02")
+
+    def test_maintain_partitions(self, events_table, monkeypatch):
+        """先の月を作成し、保持期間より古い月を切り離すことを確認"""
+        monkeypatch.setattr(settings, "database_partition_months_ahead", 2)
+        monkeypatch.setattr(settings, "database_partition_retention_months", 1)
+        monkeypatch.setattr(settings, "database_partition_drop_expired", True)
+        run_sync(
+            create_partitions, events_table, datetime(2026, 7, 1), datetime(2026, 8, 1)
+        )
+
+        run_sync(maintain_partitions, metadata, now=datetime(2026, 10, 16))
+
+        # 保持期間1か月のため9月以降を残す（9月は作成していない）
+        assert partition_names(events_table) == [
+            "partition_test_events_p2026_10",
+            "partition_test_events_p2026_11",
+            "partition_test_events_p2026_12",
+        ]
+
+    def test_maintain_partitions_skips_while_locked(self, events_table):
+        """他の接続が保守中の場合は待たずに何もしないことを確認"""
+
+        async def maintain_while_locked() -> bool:
+            async with test_engine.begin() as holder:
+                await holder.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:lock))"),
+                    {"lock": PARTITION_LOCK},
+                )
+                async with test_engine.begin() as conn:
+                    return await conn.run_sync(maintain_partitions, metadata)
+
+        assert asyncio.run(maintain_while_locked()) is False
+        assert partition_names(events_table) == []
+        assert run_sync(maintain_partitions, metadata) is True
+        assert partition_names(events_table) != []
+
+    def test_partition_coverage(self, events_table):
+        """最も新しいパーティションが現在の月の何か月先かを確認"""
+        now = datetime(2026, 10, 16)
+        assert run_sync(partition_coverage, metadata, now=now) == {events_table: None}
+
+        run_sync(
+            create_partitions, events_table, datetime(2026, 9, 1), datetime(2026, 10, 1)
+        )
+        coverage = run_sync(partition_coverage, metadata, now=now)
+        assert coverage == {events_table: 0}
+        assert uncovered_tables(coverage) == [events_table]
+
+        run_sync(create_partitions, events_table, now, datetime(2026, 11, 1))
+        coverage = run_sync(partition_coverage, metadata, now=now)
+        assert coverage == {events_table: 1}
+        assert uncovered_tables(coverage) == []
+
+    def test_maintain_partitions_deletes_expired_keys(self, events_table, monkeypatch):
+        """切り離す月の行のキーだけを対応表から削除することを確認"""
+        monkeypatch.setattr(settings, "database_partition_retention_months", 1)
+        monkeypatch.setattr(settings, "database_partition_drop_expired", True)
+        run_sync(
+            create_partitions, events_table, datetime(2026, 8, 1), datetime(2026, 9, 1)
+        )
+        run_sync(
+            lambda conn: conn.execute(
+                event_keys.insert(),
+                [
+                    {"id": 1, "created_at": datetime(2026, 8, 31)},
+                    {"id": 2, "created_at": datetime(2026, 9, 1)},
+                ],
+            )
+        )
+
+        run_sync(maintain_partitions, metadata, now=datetime(2026, 10, 16))
+
+        assert "partition_test_events_p2026_08" not in partition_names(events_table)
+        remaining = run_sync(lambda conn: conn.execute(event_keys.select()).all())
+        assert [row.id for row in remaining] == [2]
+
+
+async def count_keys(session) -> int:
+    result = await session.execute(text("SELECT count(*) FROM example_keys"))
+    return result.scalar_one()
+
+
+def insert_examples(*rows: tuple[int, datetime]) -> None:
+    run_sync(
+        lambda conn: conn.execute(
+            Example.__table__.insert(),
+            [
+                {
+                    "id": id_,
+                    "name": f"Key {id_}",
+                    "is_active": True,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                for id_, created_at in rows
+            ],
+        )
+    )
+
+
+class TestExampleKeys:
+    """examples の id の一意性（example_keys）のテスト"""
+
+    def test_id_unique_across_partitions(self):
+        """別の月のパーティションでも同じ id の行を作成できないことを確認"""
+        current = month_start(datetime.now())
+        insert_examples((1, add_months(current, -1)))
+
+        with pytest.raises(IntegrityError):
+            insert_examples((1, current))
+        keys = run_sync(lambda conn: conn.execute(select(ExampleKey.id)).all())
+        assert [row.id for row in keys] == [1]
+
+    def test_keys_follow_writes(self):
+        """INSERT・COPY・DELETE でキーが維持されることを確認"""
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                created = await ExampleService.create_example(
+                    session, ExampleCreate(name="single")
+                )
+                await ExampleService.bulk_create_examples(
+                    session,
+                    ExampleBulkCreate(items=[{"name": f"copy {i}"} for i in range(3)]),
+                )
+                assert await count_keys(session) == 4
+
+                await ExampleService.delete_example(session, created.id)
+                assert await count_keys(session) == 3
+                ids = [row[0] for row in await session.execute(select(ExampleKey.id))]
+                await ExampleService.bulk_delete_examples(
+                    session, ExampleBulkDelete(ids=ids)
+                )
+                assert await count_keys(session) == 0
+
+        asyncio.run(run())
+
+    def test_partition_truncate_deletes_keys(self):
+        """パーティションを直接 TRUNCATE するとその月のキーだけを削除することを確認"""
+        current = month_start(datetime.now())
+        previous = add_months(current, -1)
+        insert_examples((1, previous), (2, current))
+
+        run_sync(
+            lambda conn: conn.execute(text(f"TRUNCATE examples_p{previous:%Y_%m}"))
+        )
+
+        keys = run_sync(lambda conn: conn.execute(select(ExampleKey.id)).all())
+        assert [row.id for row in keys] == [2]
+
+    def test_keys_cannot_be_updated(self):
+        """id と created_at は変更できないことを確認（パーティション間の移動を含む）"""
+        current = month_start(datetime.now())
+        insert_examples((1, current))
+
+        for values in ({"created_at": add_months(current, -1)}, {"id": 2}):
+            with pytest.raises(DBAPIError) as exc_info:
+                run_sync(
+                    lambda conn, values=values: conn.execute(
+                        Example.__table__.update().values(**values)
+                    )
+                )
+            assert exc_info.value.orig.sqlstate == "0A000"
+
+
+async def explain_analyze(session, run) -> str:
+    """run で最後に実行した文の実際の実行計画（run の変更はロールバックされる）"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        statements.append((statement, parameters))
+
+    sync_engine = test_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await run()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    # 実行した変更を取り消してから、同じ状態で文を実行し直す
+    await session.rollback()
+    statement, parameters = statements[-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (ANALYZE) {statement}", parameters
+    )
+    plan = "\n".join(row[0] for row in result)
+    await session.rollback()
+    return plan
+
+
+def partitions_read(plan: str) -> list[str]:
+    """実行時に読んだ examples のパーティション（UPDATE・DELETE の対象の一覧は除く）"""
+    return [
+        line.split(" on ")[1].split()[0]
+        for line in plan.splitlines()
+        if "Scan" in line and " on examples_p" in line and "never executed" not in line
+    ]
+
+
+class TestPartitionPruning:
+    """ExampleService のクエリのパーティション刈り込みのテスト"""
+
+    def test_cursor_page_prunes_newer_partitions(self):
+        """カーソルの月より新しい月のパーティションを読まないことを確認"""
+        current = month_start(datetime.now())
+        previous = add_months(current, -1)
+
+        async def explain_cursor_page():
+            async with TestingSessionLocal() as session:
+                session.add_all(
+                    Example(name=f"Pruning {i}", created_at=created_at)
+                    for i, created_at in enumerate([previous, current.replace(day=2)])
+                )
+                await session.commit()
+
+                # 1ページ目の末尾（当月の行）をカーソルにして2ページ目を取得
+                first = await ExampleService.list_examples(
+                    session, page=1, per_page=1, search=None
+                )
+                statements = []
+
+                def capture(conn, cursor, statement, parameters, context, many):
+                    statements.append((statement, parameters))
+
+                sync_engine = test_engine.sync_engine
+                event.listen(sync_engine, "before_cursor_execute", capture)
+                try:
+                    second = await ExampleService.list_examples(
+                        session,
+                        page=1,
+                        per_page=1,
+                        search=None,
+                        after=first.next_cursor,
+                    )
+                finally:
+                    event.remove(sync_engine, "before_cursor_execute", capture)
+                assert [item.name for item in second.items] == ["Pruning 0"]
+
+                statement, parameters = statements[-1]
+                connection = await session.connection()
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN {statement}", parameters
+                )
+                return "\n".join(row[0] for row in result)
+
+        plan = asyncio.run(explain_cursor_page())
+
+        assert f"examples_p{previous:%Y_%m}" in plan
+        assert f"examples_p{current:%Y_%m}" in plan
+        # 先の月のパーティション（create_all 後に作成済み）は刈り込まれる
+        assert f"examples_p{add_months(current, 1):%Y_%m}" not in plan
+
+    @pytest.mark.parametrize("operation", ["get", "update", "delete", "bulk_delete"])
+    def test_id_lookups_read_one_partition(self, operation):
+        """id で引く操作は example_keys の created_at の月だけを読むことを確認"""
+        current = month_start(datetime.now())
+        previous = add_months(current, -1)
+        insert_examples((1, previous), (2, current))
+        # 空のテーブルの統計情報では実行時の刈り込みのない計画になることがあるため
+        run_sync(lambda conn: conn.execute(text("ANALYZE examples, example_keys")))
+        operations = {
+            "get": lambda session: ExampleService._load_example(session, 1),
+            "update": lambda session: ExampleService.update_example(
+                session, 1, ExampleUpdate(name="updated")
+            ),
+            "delete": lambda session: ExampleService.delete_example(session, 1),
+            "bulk_delete": lambda session: ExampleService.bulk_delete_examples(
+                session, ExampleBulkDelete(ids=[1])
+            ),
+        }
+
+        async def explain():
+            async with TestingSessionLocal() as session:
+                # サービスがコミットせず、実行した変更をロールバックできるようにする
+                session.info[UNIT_OF_WORK] = True
+                return await explain_analyze(
+                    session, lambda: operations[operation](session)
+                )
+
+        plan = asyncio.run(explain())
+
+        assert set(partitions_read(plan)) == {f"examples_p{previous:%Y_%m}"}
@@ -0,0 +1,75 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
+from src.api.health.services import HealthService
+from src.core.config import settings
+from src.db.database import create_engine_from_settings, engine_options
+from src.db.pool import InstrumentedAsyncQueuePool
+from tests.conftest import TEST_DATABASE_URL
+
+
+class TestPoolerMode:
+    """接続プーラーの動作モードのテスト"""
+
+    def test_session_mode_options(self, monkeypatch):
+        """session モードではプールとステートメントキャッシュを使うことを確認"""
+        monkeypatch.setattr(settings, "database_pooler_mode", "session")
+
+        options = engine_options(TEST_DATABASE_URL)
+
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert options["pool_size"] == settings.database_pool_size
+        assert options["connect_args"]["prepared_statement_cache_size"] == (
+            settings.database_prepared_statement_cache_size
+        )
+        # 既定の statement_timeout は接続時に設定する
+        assert options["connect_args"]["server_settings"] == {
+            "statement_timeout": str(int(settings.database_statement_timeout * 1000))
+        }
+
+    def test_transaction_mode_options(self, monkeypatch):
+        """transaction モードではプールとステートメントキャッシュを使わないことを確認"""
+        monkeypatch.setattr(settings, "database_pooler_mode", "transaction")
+
+        options = engine_options(TEST_DATABASE_URL)
+        connect_args = options["connect_args"]
+
+        assert options["poolclass"] is NullPool
+        assert "pool_size" not in options
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        # 接続単位の設定は他のクライアントに漏れるため使わない
+        assert "server_settings" not in connect_args
+        # プリペアドステートメント名は接続をまたいで重複しない
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    def test_transaction_mode_executes_queries(self, monkeypatch):
+        """transaction モードのエンジンでクエリを実行でき、接続を保持しないことを確認"""
+        monkeypatch.setattr(settings, "database_pooler_mode", "transaction")
+        engine = create_engine_from_settings(TEST_DATABASE_URL)
+
+        async def run():
+            for _ in range(3):
+                async with engine.connect() as conn:
+                    value = await conn.scalar(
+                        text("SELECT CAST(:value AS integer)"), {"value": 1}
+                    )
+                    assert value == 1
+            await engine.dispose()
+
+        asyncio.run(run())
+
+        status = HealthService.get_pool_status(engine.pool)
+        assert status.pool_class == "NullPool"
+        assert status.size == 0
+        assert status.checked_out == 0
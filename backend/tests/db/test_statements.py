@@ -0,0 +1,87 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+import pytest
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api.examples.schemas import ExampleOrder
+from src.api.examples.services import GET_EXAMPLE, ExampleService
+from src.db.models.example import Example
+from src.db.statements import (
+    StatementRegistry,
+    compile_cache_stats,
+    track_compile_cache,
+)
+from tests.conftest import TEST_DATABASE_URL, TestingSessionLocal
+
+
+class TestStatementRegistry:
+    """構築済みステートメントのテスト"""
+
+    def test_register_and_get(self):
+        """名前で登録したステートメントを取得できることを確認"""
+        registry = StatementRegistry()
+        stmt = select(Example).where(Example.id == bindparam("example_id"))
+
+        assert registry.register("example.get", stmt) is stmt
+        assert registry.get("example.get") is stmt
+        assert registry.names() == ["example.get"]
+
+    def test_register_duplicate_name(self):
+        """同じ名前の二重登録はエラーになることを確認"""
+        registry = StatementRegistry()
+        registry.register("example.get", select(Example))
+
+        with pytest.raises(ValueError):
+            registry.register("example.get", select(Example))
+
+    def test_compile_cache_hits_on_repeated_execution(self):
+        """構築済みステートメントの再実行がコンパイルキャッシュにヒットすることを確認"""
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        track_compile_cache(engine)
+
+        async def execute():
+            async with engine.connect() as conn:
+                compile_cache_stats.reset()
+                for example_id in range(3):
+                    await conn.execute(GET_EXAMPLE, {"example_id": example_id})
+                await conn.exec_driver_sql("SELECT 1")
+            await engine.dispose()
+
+        asyncio.run(execute())
+
+        assert compile_cache_stats.misses == 1
+        assert compile_cache_stats.hits == 2
+        assert compile_cache_stats.uncached == 1
+        assert compile_cache_stats.hit_ratio == pytest.approx(2 / 3)
+
+    def test_list_examples_uses_registered_statements(self):
+        """一覧取得がページ番号方式・検索・類似度順のいずれでも動作することを確認"""
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                for name in ["alpha", "alphabet", "beta"]:
+                    session.add(Example(name=name))
+                await session.commit()
+
+                listed = await ExampleService.list_examples(session, per_page=2)
+                searched = await ExampleService.list_examples(session, search="alpha")
+                ranked = await ExampleService.list_examples(
+                    session, search="alpha", order=ExampleOrder.RELEVANCE
+                )
+                return listed, searched, ranked
+
+        listed, searched, ranked = asyncio.run(run())
+
+        assert [item.name for item in listed.items] == ["beta", "alphabet"]
+        assert listed.next_cursor is not None
+        assert sorted(item.name for item in searched.items) == ["alpha", "alphabet"]
+        assert ranked.items[0].name == "alpha"
@@ -0,0 +1,186 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from src.api.common.exceptions import NotFoundException
+from src.api.examples.schemas import ExampleCreate, ExampleUpdate
+from src.api.examples.services import ExampleService
+from src.core.config import settings
+from src.db import database
+from src.db.models.example import Example
+from src.db.unit_of_work import (
+    after_commit,
+    after_commit_async,
+    in_unit_of_work,
+    unit_of_work,
+)
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def commits():
+    """コミット回数を記録"""
+    committed: list[Session] = []
+
+    def listener(session):
+        committed.append(session)
+
+    event.listen(Session, "after_commit", listener)
+    yield committed
+    event.remove(Session, "after_commit", listener)
+
+
+async def _count_examples() -> int:
+    async with TestingSessionLocal() as session:
+        return (await session.execute(select(func.count(Example.id)))).scalar_one()
+
+
+class TestUnitOfWork:
+    """作業単位（リクエスト単位のトランザクション）のテスト"""
+
+    def test_services_commit_standalone(self, commits):
+        """作業単位の外ではサービスが各自コミットすることを確認"""
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                created = await ExampleService.create_example(
+                    session, ExampleCreate(name="standalone")
+                )
+                await ExampleService.update_example(
+                    session, created.id, ExampleUpdate(name="updated")
+                )
+
+        asyncio.run(run())
+
+        assert len(commits) == 2
+        assert asyncio.run(_count_examples()) == 1
+
+    def test_single_commit_for_composed_calls(self, commits):
+        """作業単位の中では複数のサービス呼び出しが1回のコミットになることを確認"""
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                async with unit_of_work(session):
+                    assert in_unit_of_work(session)
+                    created = await ExampleService.create_example(
+                        session, ExampleCreate(name="first")
+                    )
+                    await ExampleService.create_example(
+                        session, ExampleCreate(name="second")
+                    )
+                    await ExampleService.update_example(
+                        session, created.id, ExampleUpdate(name="renamed")
+                    )
+                    assert commits == []
+                assert not in_unit_of_work(session)
+
+        asyncio.run(run())
+
+        assert len(commits) == 1
+        assert asyncio.run(_count_examples()) == 2
+
+    def test_rollback_on_error(self, commits):
+        """作業単位の途中で例外が発生した場合は全体をロールバックすることを確認"""
+        callbacks: list[str] = []
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                async with unit_of_work(session):
+                    await ExampleService.create_example(
+                        session, ExampleCreate(name="discarded")
+                    )
+                    after_commit(session, lambda: callbacks.append("called"))
+                    await ExampleService.delete_example(session, 999999)
+
+        with pytest.raises(NotFoundException):
+            asyncio.run(run())
+
+        assert commits == []
+        assert callbacks == []
+        assert asyncio.run(_count_examples()) == 0
+
+    def test_after_commit_callbacks(self):
+        """コミット後の処理が作業単位の外では即座に、中ではコミット後に実行されることを確認"""
+        calls: list[str] = []
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                after_commit(session, lambda: calls.append("standalone"))
+                assert calls == ["standalone"]
+
+                async with unit_of_work(session):
+                    after_commit(session, lambda: calls.append("deferred"))
+                    assert calls == ["standalone"]
+                assert calls == ["standalone", "deferred"]
+
+        asyncio.run(run())
+
+    def test_after_commit_async_callbacks(self):
+        """非同期のコミット後の処理も作業単位の終了時に await されることを確認"""
+        calls: list[str] = []
+
+        async def record(name: str) -> None:
+            await asyncio.sleep(0)
+            calls.append(name)
+
+        async def run():
+            async with TestingSessionLocal() as session:
+                await after_commit_async(session, lambda: record("standalone"))
+                assert calls == ["standalone"]
+
+                async with unit_of_work(session):
+                    await after_commit_async(session, lambda: record("deferred"))
+                    assert calls == ["standalone"]
+                assert calls == ["standalone", "deferred"]
+
+        asyncio.run(run())
+
+    def test_get_async_session_unit_of_work_mode(self, commits, monkeypatch):
+        """unit of work 有効時は get_async_session が一度だけコミットすることを確認"""
+        monkeypatch.setattr(settings, "database_unit_of_work", True)
+        monkeypatch.setattr(database, "async_session_maker", TestingSessionLocal)
+
+        async def run():
+            sessions = database.get_async_session()
+            session = await sessions.__anext__()
+            assert in_unit_of_work(session)
+            await ExampleService.create_example(session, ExampleCreate(name="a"))
+            await ExampleService.create_example(session, ExampleCreate(name="b"))
+            assert commits == []
+            with pytest.raises(StopAsyncIteration):
+                await sessions.__anext__()
+
+        asyncio.run(run())
+
+        assert len(commits) == 1
+        assert asyncio.run(_count_examples()) == 2
+
+    def test_commit_failure_returns_error(self, client, monkeypatch):
+        """作業単位のコミットに失敗した場合は成功のレスポンスを返さないことを確認"""
+        from sqlalchemy.exc import OperationalError
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        from src.main import app
+
+        monkeypatch.setattr(settings, "database_unit_of_work", True)
+        monkeypatch.setattr(database, "async_session_maker", TestingSessionLocal)
+        del app.dependency_overrides[database.get_async_session]
+
+        async def fail_commit(self):
+            raise OperationalError("COMMIT", {}, Exception("connection lost"))
+
+        monkeypatch.setattr(AsyncSession, "commit", fail_commit)
+
+        response = client.post("/api/examples/", json={"name": "lost"})
+
+        assert response.status_code == 500
+        assert asyncio.run(_count_examples()) == 0
@@ -0,0 +1,45 @@
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+# ウォームアップ対象のステートメントを登録させる
+from src.api.examples import services  # noqa: F401
+from src.db.database import create_engine_from_settings, warm_up_engine
+from src.db.statements import compile_cache_stats, statements
+from tests.conftest import TEST_DATABASE_URL
+
+
+class TestWarmUp:
+    """起動時のウォームアップのテスト"""
+
+    def test_warm_up_opens_pool_connections(self):
+        """指定した数の接続がプールに作成され、ステートメントがコンパイル済みになることを確認"""
+        engine = create_engine_from_settings(TEST_DATABASE_URL)
+        warmup_count = len(statements.warmup_statements())
+        assert warmup_count > 0
+
+        async def run():
+            assert engine.pool.checkedin() == 0
+            compile_cache_stats.reset()
+            await warm_up_engine(engine, 3)
+            checked_in = engine.pool.checkedin()
+            await engine.dispose()
+            return checked_in
+
+        assert asyncio.run(run()) == 3
+        # 1本目の接続でコンパイルし、残りの接続はキャッシュから再利用する
+        assert compile_cache_stats.misses == warmup_count
+        assert compile_cache_stats.hits == warmup_count * 2
+
+    def test_warm_up_disabled(self):
+        """接続数0ではプールに接続を作成しないことを確認"""
+        engine = create_engine_from_settings(TEST_DATABASE_URL)
+
+        asyncio.run(warm_up_engine(engine, 0))
+
+        assert engine.pool.checkedin() == 0
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.db.models.example import Example
+from src.db.utils import create_model, delete_model, get_by_id, update_model
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def statements():
+    """実行されたSQL文を記録（conftest は複数回読み込まれるため Engine 全体を監視）"""
+    executed: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        executed.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _kinds(executed: list[str]) -> list[str]:
+    return [statement.split()[0].upper() for statement in executed]
+
+
+class TestExampleServiceWriteStatements:
+    """ExampleService の書き込みが1文で完了することのテスト"""
+
+    def test_create_example_single_statement(self, client, statements):
+        """作成は INSERT ... RETURNING の1文のみ"""
+        response = client.post("/api/examples/", json={"name": "Single"})
+
+        assert response.status_code == 201
+        assert _kinds(statements) == ["INSERT"]
+        assert "RETURNING" in statements[0]
+
+    def test_update_example_single_statement(self, client, statements):
+        """更新は UPDATE ... RETURNING の1文のみ"""
+        example_id = client.post("/api/examples/", json={"name": "Before"}).json()["id"]
+        statements.clear()
+
+        response = client.put(f"/api/examples/{example_id}", json={"name": "After"})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "After"
+        assert _kinds(statements) == ["UPDATE"]
+        assert "RETURNING" in statements[0]
+
+    def test_delete_example_single_statement(self, client, statements):
+        """削除は DELETE ... RETURNING の1文のみ"""
+        example_id = client.post("/api/examples/", json={"name": "Delete"}).json()["id"]
+        statements.clear()
+
+        response = client.delete(f"/api/examples/{example_id}")
+
+        assert response.status_code == 200
+        assert _kinds(statements) == ["DELETE"]
+
+    def test_not_found_single_statement(self, client, statements):
+        """存在しないIDの更新・削除も1文で404を返す"""
+        response = client.put("/api/examples/99999", json={"name": "Missing"})
+        assert response.status_code == 404
+        response = client.delete("/api/examples/99999")
+        assert response.status_code == 404
+
+        assert _kinds(statements) == ["UPDATE", "DELETE"]
+
+
+class TestModelUtilsWriteStatements:
+    """src/db/utils.py の汎用ヘルパーの発行SQL数のテスト"""
+
+    def test_model_helpers_single_statement(self, statements):
+        """create_model / update_model / delete_model はそれぞれ1文"""
+
+        async def run() -> None:
+            async with TestingSessionLocal() as session:
+                created = await create_model(session, Example, name="Helper")
+                assert created.id is not None
+                assert created.is_active is True
+                assert _kinds(statements) == ["INSERT"]
+
+                statements.clear()
+                updated = await update_model(
+                    session, Example, created.id, description="updated"
+                )
+                assert updated is not None
+                assert updated.description == "updated"
+                assert _kinds(statements) == ["UPDATE"]
+
+                statements.clear()
+                assert await delete_model(session, Example, created.id) is True
+                assert await delete_model(session, Example, created.id) is False
+                assert (
+                    await update_model(session, Example, created.id, name="x") is None
+                )
+                assert _kinds(statements) == ["DELETE", "DELETE", "UPDATE"]
+
+                assert await get_by_id(session, Example, created.id) is None
+
+        asyncio.run(run())
@@ -0,0 +1,108 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import text
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.api.examples.schemas import ExportFormat
+from src.api.examples.services import ExampleService
+from tests.conftest import TestingSessionLocal
+
+# テーブルサイズ（カンマ区切り）。1Mまで確認する場合は
+# EXPORT_BENCHMARK_SIZES=10000,100000,1000000 を指定する
+BENCHMARK_SIZES = [
+    int(size) for size in os.getenv("EXPORT_BENCHMARK_SIZES", "10000,100000").split(",")
+]
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int | None:
+    """現在の常駐メモリ（RSS）をバイト単位で取得（Linux以外はNone）"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+async def grow_table(target_size: int) -> None:
+    """examplesテーブルを指定件数まで増やす"""
+    async with TestingSessionLocal() as session:
+        current = (
+            await session.execute(text("SELECT count(*) FROM examples"))
+        ).scalar()
+        await session.execute(
+            text(
+                "INSERT INTO examples (name, description, is_active, "
+                "created_at, updated_at) "
+                "SELECT md5(g::text), repeat(md5(g::text), 4), true, now(), now() "
+                "FROM generate_series("
+                "CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+            ),
+            {"start": current + 1, "stop": target_size},
+        )
+        await session.commit()
+
+
+async def measure_export(export_format: ExportFormat) -> tuple[int, int, int, float]:
+    """エクスポートを最後まで読み、(行数, ヒープのピーク, RSSのピーク, 秒) を返す"""
+    gc.collect()
+    baseline_rss = current_rss() or 0
+    peak_rss = baseline_rss
+    lines = 0
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    async for chunk in ExampleService.export_examples(
+        TestingSessionLocal, export_format
+    ):
+        lines += chunk.count(b"\n")
+        peak_rss = max(peak_rss, current_rss() or 0)
+    elapsed = time.perf_counter() - start_time
+    _, peak_heap = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return lines, peak_heap, peak_rss - baseline_rss, elapsed
+
+
+@pytest.mark.asyncio
+class TestExportMemory:
+    """ストリーミングエクスポートのメモリ使用量ベンチマーク"""
+
+    @pytest.mark.parametrize("export_format", [ExportFormat.NDJSON, ExportFormat.CSV])
+    async def test_export_memory_flat_as_table_grows(self, export_format):
+        """テーブルが大きくなってもエクスポート中のメモリ使用量が一定であることを確認"""
+        header_lines = 1 if export_format == ExportFormat.CSV else 0
+        results = {}
+        for size in BENCHMARK_SIZES:
+            await grow_table(size)
+            lines, peak_heap, rss_growth, elapsed = await measure_export(export_format)
+            assert lines == size + header_lines
+            results[size] = (peak_heap, rss_growth)
+            print(
+                f"export {export_format.value} @ {size:>9,} rows: "
+                f"heap peak {peak_heap / 1024 / 1024:.1f}MiB, "
+                f"RSS growth {rss_growth / 1024 / 1024:.1f}MiB, {elapsed:.2f}s"
+            )
+
+        smallest, largest = BENCHMARK_SIZES[0], BENCHMARK_SIZES[-1]
+        small_heap, _ = results[smallest]
+        large_heap, large_rss = results[largest]
+
+        # 全件をメモリに載せると件数に比例して増えるが、
+        # ストリーミングではバッチサイズ分のメモリしか使わない
+        assert large_heap < small_heap * 2 + 1024 * 1024, (
+            f"Export heap usage grew with table size: {results}"
+        )
+        # 全件バッファリングなら100k行で数十MiBになる
+        assert large_rss < 32 * 1024 * 1024, (
+            f"Export RSS grew with table size: {results}"
+        )
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.core.compression import CompressionMiddleware
+from src.core.middleware import (
+    ErrorHandlerMiddleware,
+    LoggingMiddleware,
+    QueryCounterMiddleware,
+)
+from src.db.instrumentation import check_request_queries, count_request_queries
+
+ITERATIONS = 500
+
+logger = logging.getLogger("src.core.middleware")
+
+
+class BaseErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """変更前: BaseHTTPMiddleware による ErrorHandlerMiddleware"""
+
+    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            return ErrorHandlerMiddleware(self.app).handle_exception(request, exc)
+
+
+class BaseQueryCounterMiddleware(BaseHTTPMiddleware):
+    """変更前: BaseHTTPMiddleware による QueryCounterMiddleware"""
+
+    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        with count_request_queries() as counter:
+            response = await call_next(request)
+        check_request_queries(counter, f"{request.method} {request.url.path}")
+        return response
+
+
+class BaseLoggingMiddleware(BaseHTTPMiddleware):
+    """変更前: BaseHTTPMiddleware による LoggingMiddleware"""
+
+    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
+        return response
+
+
+def build_app(*middlewares: type) -> FastAPI:
+    """main.py と同じ順（先に渡したものほど内側）でミドルウェアを付けたアプリ"""
+    app = FastAPI()
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+APPS = {
+    "bare": FastAPI(),
+    "base_http": build_app(
+        BaseErrorHandlerMiddleware,
+        BaseQueryCounterMiddleware,
+        BaseLoggingMiddleware,
+        CompressionMiddleware,
+    ),
+    "asgi": build_app(
+        ErrorHandlerMiddleware,
+        QueryCounterMiddleware,
+        LoggingMiddleware,
+        CompressionMiddleware,
+    ),
+}
+
+
+@APPS["bare"].get("/ping")
+async def bare_ping() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+async def cpu_per_request(app: FastAPI) -> float:
+    """1リクエストあたりのCPU時間（マイクロ秒、アプリとクライアントの合計）"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        headers = {"Accept-Encoding": "gzip", "Origin": "http://localhost:3000"}
+        assert (await ac.get("/ping", headers=headers)).json() == {"status": "ok"}
+        start_time = time.process_time()
+        for _ in range(ITERATIONS):
+            await ac.get("/ping", headers=headers)
+        return (time.process_time() - start_time) / ITERATIONS * 1_000_000
+
+
+class TestMiddlewareOverhead:
+    """ミドルウェア一式のリクエストごとのオーバーヘッドのベンチマーク
+
+    ログの出力先による差を除くため、測定中はミドルウェアのログを無効にする。
+    """
+
+    def test_asgi_stack_overhead(self, monkeypatch):
+        """ASGI のミドルウェアの方が BaseHTTPMiddleware よりオーバーヘッドが小さい"""
+        monkeypatch.setattr(logger, "disabled", True)
+
+        async def measure():
+            # 交互に3回ずつ測定し、それぞれ最小の値を採用する
+            timings: dict[str, list[float]] = {name: [] for name in APPS}
+            for _ in range(3):
+                for name, values in timings.items():
+                    values.append(await cpu_per_request(APPS[name]))
+            return {name: min(values) for name, values in timings.items()}
+
+        timings = asyncio.run(measure())
+        bare = timings["bare"]
+        print(
+            f"middleware stack per request: bare {bare:.0f}us, "
+            f"BaseHTTPMiddleware +{timings['base_http'] - bare:.0f}us, "
+            f"ASGI +{timings['asgi'] - bare:.0f}us"
+        )
+        assert timings["asgi"] < timings["base_http"]
@@ -0,0 +1,249 @@
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.db.partitions import (
+    add_months,
+    create_partitions,
+    detach_partitions_before,
+    month_start,
+    partition_name,
+    utcnow,
+)
+from tests.conftest import TestingSessionLocal, test_engine
+
+# 投入する行数と期間（月数）。大きなデータで確認する場合は
+# PARTITION_BENCHMARK_ROWS=5000000 などを指定する
+BENCHMARK_ROWS = int(os.getenv("PARTITION_BENCHMARK_ROWS", "200000"))
+BENCHMARK_MONTHS = 24
+# 保持期間を過ぎたとして削除する月数（古い側から）
+EXPIRED_MONTHS = 12
+ITERATIONS = 50
+PAGE_SIZE = 20
+
+# 比較用のパーティションなしのテーブル（同じ列とインデックス）
+UNPARTITIONED = "examples_unpartitioned"
+
+COLUMNS = "id, name, description, is_active, created_at, updated_at"
+
+FIRST_PAGE_SQL = (
+    "SELECT {columns} FROM {table} ORDER BY created_at DESC, id DESC LIMIT {limit}"
+)
+# PaginationHelper.paginate_keyset と同じ形（行比較に先頭キー単独の比較を加える）
+CURSOR_PAGE_SQL = (
+    "SELECT {columns} FROM {table} "
+    "WHERE (created_at, id) < (:created_at, :id) AND created_at <= :created_at "
+    "ORDER BY created_at DESC, id DESC LIMIT {limit}"
+)
+GET_BY_ID_SQL = "SELECT {columns} FROM {table} WHERE id = CAST(:id AS integer)"
+# ExampleService の取得と同じ形（example_keys の created_at で刈り込む）
+GET_BY_KEY_SQL = (
+    "SELECT {columns} FROM examples WHERE id = CAST(:id AS integer) "
+    "AND created_at = "
+    "(SELECT created_at FROM example_keys WHERE id = CAST(:id AS integer))"
+)
+
+
+async def seed(current: datetime) -> None:
+    """BENCHMARK_MONTHS か月に均等に分散した行を両方のテーブルに投入"""
+    start = add_months(current, -BENCHMARK_MONTHS)
+    async with test_engine.begin() as conn:
+        await conn.run_sync(create_partitions, "examples", start, current)
+        await conn.execute(
+            text(f"CREATE TABLE {UNPARTITIONED} (LIKE examples INCLUDING ALL)")
+        )
+        seconds = (current - start).total_seconds()
+        await conn.execute(
+            text(
+                "INSERT INTO examples (id, name, description, is_active, "
+                "created_at, updated_at) "
+                "SELECT g, md5(g::text), 'benchmark row', true, "
+                "CAST(:start AS timestamp) "
+                "+ make_interval(secs => g * CAST(:step AS double precision)), "
+                "CAST(:start AS timestamp) "
+                "FROM generate_series(1, CAST(:rows AS integer)) AS g"
+            ),
+            {"start": start, "step": seconds / BENCHMARK_ROWS, "rows": BENCHMARK_ROWS},
+        )
+        await conn.execute(
+            text(
+                f"INSERT INTO {UNPARTITIONED} ({COLUMNS}) "
+                f"SELECT {COLUMNS} FROM examples"
+            )
+        )
+        await conn.execute(text("ANALYZE examples"))
+        await conn.execute(text("ANALYZE example_keys"))
+        await conn.execute(text(f"ANALYZE {UNPARTITIONED}"))
+
+
+async def measure(
+    sql: str, params: dict[str, object], expected_rows: int = PAGE_SIZE
+) -> float:
+    """クエリのレイテンシ（中央値）を測定"""
+    timings = []
+    async with TestingSessionLocal() as session:
+        for _ in range(ITERATIONS):
+            start_time = time.perf_counter()
+            rows = (await session.execute(text(sql), params)).all()
+            timings.append(time.perf_counter() - start_time)
+            assert len(rows) == expected_rows
+    return statistics.median(timings)
+
+
+async def partitions_read(sql: str, params: dict[str, object]) -> set[str]:
+    """EXPLAIN (ANALYZE) で実行時に読んだ examples のパーティションの名前"""
+    async with TestingSessionLocal() as session:
+        plan = await session.execute(text(f"EXPLAIN (ANALYZE) {sql}"), params)
+        return {
+            row[0].split(" on ")[1].split()[0]
+            for row in plan
+            if " on examples_p" in row[0] and "never executed" not in row[0]
+        }
+
+
+async def count_before(table: str, cutoff: datetime) -> int:
+    async with TestingSessionLocal() as session:
+        return (
+            await session.execute(
+                text(f"SELECT count(*) FROM {table} WHERE created_at < :cutoff"),
+                {"cutoff": cutoff},
+            )
+        ).scalar_one()
+
+
+@pytest.mark.asyncio
+class TestPartitionPruning:
+    """created_at の月次パーティションのベンチマーク"""
+
+    async def test_pruning_and_retention(self):
+        """パーティションの刈り込みと、古い月を切り離して削除できることを確認"""
+        current = month_start(utcnow())
+        await seed(current)
+        try:
+            await self._benchmark(current)
+        finally:
+            # 投入のために作成した過去の月のパーティションも削除する
+            async with test_engine.begin() as conn:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {UNPARTITIONED}"))
+                await conn.run_sync(
+                    detach_partitions_before,
+                    "examples",
+                    add_months(current, -1),
+                    drop=True,
+                )
+                # 残ったパーティションの行と統計情報が後続のテストの計画に影響しないよう
+                # 空にして統計情報を取り直す
+                await conn.execute(
+                    text("TRUNCATE TABLE examples RESTART IDENTITY CASCADE")
+                )
+                await conn.execute(text("ANALYZE examples"))
+
+    async def _benchmark(self, current: datetime) -> None:
+        # 期間の中ほど（約1年前）の行をカーソルにする
+        async with TestingSessionLocal() as session:
+            cursor = (
+                await session.execute(
+                    text(
+                        "SELECT created_at, id FROM examples "
+                        "WHERE id = CAST(:id AS integer)"
+                    ),
+                    {"id": BENCHMARK_ROWS // 2},
+                )
+            ).one()
+        cursor_params = {"created_at": cursor.created_at, "id": cursor.id}
+
+        results = {}
+        for name, sql, params in [
+            ("first page", FIRST_PAGE_SQL, {}),
+            ("cursor page", CURSOR_PAGE_SQL, cursor_params),
+        ]:
+            for table in ["examples", UNPARTITIONED]:
+                query = sql.format(columns=COLUMNS, table=table, limit=PAGE_SIZE)
+                results[name, table] = await measure(query, params)
+            print(
+                f"{name:>12} @ {BENCHMARK_ROWS:,} rows: "
+                f"partitioned {results[name, 'examples'] * 1000:.2f}ms, "
+                f"unpartitioned {results[name, UNPARTITIONED] * 1000:.2f}ms"
+            )
+
+        # カーソルより新しい月のパーティションは読まない
+        cursor_month = month_start(cursor.created_at)
+        cursor_read = await partitions_read(
+            CURSOR_PAGE_SQL.format(columns=COLUMNS, table="examples", limit=PAGE_SIZE),
+            cursor_params,
+        )
+        print(f"partitions read by cursor page: {sorted(cursor_read)}")
+        assert partition_name("examples", cursor_month) in cursor_read
+        assert all(
+            name <= partition_name("examples", cursor_month) for name in cursor_read
+        )
+
+        # id だけの取得: 全パーティションの ix_examples_id を引く場合と、
+        # example_keys で created_at を引いて1つのパーティションだけを読む場合
+        id_params = {"id": cursor.id}
+        id_results = {
+            name: await measure(sql.format(columns=COLUMNS, table=table), id_params, 1)
+            for name, sql, table in [
+                ("id only", GET_BY_ID_SQL, "examples"),
+                ("keyed", GET_BY_KEY_SQL, "examples"),
+                ("unpartitioned", GET_BY_ID_SQL, UNPARTITIONED),
+            ]
+        }
+        id_partitions = {
+            name: await partitions_read(
+                sql.format(columns=COLUMNS, table="examples"), id_params
+            )
+            for name, sql in [("id only", GET_BY_ID_SQL), ("keyed", GET_BY_KEY_SQL)]
+        }
+        print(
+            "  get by id: "
+            + ", ".join(f"{name} {t * 1000:.3f}ms" for name, t in id_results.items())
+            + f" (partitions read: id only {len(id_partitions['id only'])}, "
+            f"keyed {len(id_partitions['keyed'])})"
+        )
+        # example_keys の created_at の月のパーティションだけを読む
+        assert id_partitions["keyed"] == {partition_name("examples", cursor_month)}
+
+        # 保持期間を過ぎた行の削除: DELETE とパーティションの切り離し・削除
+        # （所要時間は環境に左右されるため表示のみとし、結果だけを確認する）
+        cutoff = add_months(current, EXPIRED_MONTHS - BENCHMARK_MONTHS)
+        expired_rows = await count_before("examples", cutoff)
+        async with test_engine.begin() as conn:
+            start_time = time.perf_counter()
+            deleted = await conn.execute(
+                text(f"DELETE FROM {UNPARTITIONED} WHERE created_at < :cutoff"),
+                {"cutoff": cutoff},
+            )
+            delete_time = time.perf_counter() - start_time
+        async with test_engine.begin() as conn:
+            start_time = time.perf_counter()
+            detached = await conn.run_sync(
+                detach_partitions_before,
+                "examples",
+                cutoff,
+                drop=True,
+                keys=("example_keys", "created_at"),
+            )
+            detach_time = time.perf_counter() - start_time
+        print(
+            f"expire {deleted.rowcount:,} rows: DELETE {delete_time * 1000:.1f}ms, "
+            f"detach + drop {len(detached)} partitions (with keys) "
+            f"{detach_time * 1000:.1f}ms"
+        )
+        assert deleted.rowcount == expired_rows > 0
+        assert detached == [
+            partition_name("examples", add_months(current, -BENCHMARK_MONTHS + i))
+            for i in range(EXPIRED_MONTHS)
+        ]
+        assert await count_before("examples", cutoff) == 0
+        assert await count_before("example_keys", cutoff) == 0
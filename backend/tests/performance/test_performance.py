@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import os
 import sys
 import time
@@ -80,6 +81,8 @@ class TestPerformance:
 
         for per_page in page_sizes:
             async with TestingSessionLocal() as session:
+                # 先行するテストで増えたオブジェクトのGCが計測中に走らないようにする
+                gc.collect()
                 start_time = time.time()
 
                 result = await ExampleService.list_examples(
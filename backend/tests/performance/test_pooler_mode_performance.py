@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+import asyncio
+
+from src.api.examples.services import GET_EXAMPLE
+from src.core.config import settings
+from src.db.database import create_engine_from_settings
+from tests.conftest import TEST_DATABASE_URL
+
+# transaction モードの PgBouncer のURL。未指定の場合は PostgreSQL に直接接続し、
+# transaction モードの設定（ローカルのプールとステートメントキャッシュなし）の
+# コストのみを測定する
+PGBOUNCER_URL = os.getenv("PGBOUNCER_URL")
+CONCURRENCY = 20
+REQUESTS = 1000
+
+
+async def measure_throughput(url: str) -> float:
+    """同時実行数 CONCURRENCY で REQUESTS 回の取得を行い、1秒あたりの件数を返す"""
+    engine = create_engine_from_settings(url)
+    remaining = iter(range(REQUESTS))
+
+    async def worker():
+        for example_id in remaining:
+            async with engine.connect() as conn:
+                await conn.execute(GET_EXAMPLE, {"example_id": example_id})
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - start_time
+    await engine.dispose()
+    return REQUESTS / elapsed
+
+
+class TestPoolerModePerformance:
+    """session モードと transaction モードのスループット比較"""
+
+    def test_pooler_mode_throughput(self, monkeypatch):
+        """各モードでエラーなく取得できることを確認し、スループットを出力"""
+        monkeypatch.setattr(settings, "database_pool_size", CONCURRENCY)
+        cases = [
+            ("session", TEST_DATABASE_URL),
+            ("transaction", TEST_DATABASE_URL),
+        ]
+        if PGBOUNCER_URL:
+            cases.append(("transaction", PGBOUNCER_URL))
+
+        results = {}
+        for pooler_mode, url in cases:
+            monkeypatch.setattr(settings, "database_pooler_mode", pooler_mode)
+            results[(pooler_mode, url)] = asyncio.run(measure_throughput(url))
+
+        baseline = results[("session", TEST_DATABASE_URL)]
+        for (pooler_mode, url), throughput in results.items():
+            print(
+                f"pooler_mode={pooler_mode} via {url}: {throughput:,.0f} req/s "
+                f"({throughput / baseline:.2f}x)"
+            )
+            assert throughput > 0
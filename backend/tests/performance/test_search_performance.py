@@ -0,0 +1,108 @@
+import os
+import statistics
+import sys
+import time
+
+import pytest
+from sqlalchemy import text
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.api.common.pagination import count_cache
+from src.api.examples.services import ExampleService
+from tests.conftest import TestingSessionLocal
+
+# テーブルサイズ（カンマ区切り）。10Mまで確認する場合は
+# SEARCH_BENCHMARK_SIZES=10000,100000,1000000,10000000 を指定する
+BENCHMARK_SIZES = [
+    int(size) for size in os.getenv("SEARCH_BENCHMARK_SIZES", "10000,100000").split(",")
+]
+ITERATIONS = 20
+NEEDLE_COUNT = 5
+
+
+async def grow_table(target_size: int) -> None:
+    """examplesテーブルを指定件数まで増やす（名前は16進文字列のみ）"""
+    async with TestingSessionLocal() as session:
+        current = (
+            await session.execute(text("SELECT count(*) FROM examples"))
+        ).scalar()
+        await session.execute(
+            text(
+                "INSERT INTO examples (name, description, is_active, "
+                "created_at, updated_at) "
+                "SELECT md5(g::text), 'benchmark row', true, now(), now() "
+                "FROM generate_series("
+                "CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+            ),
+            {"start": current + 1, "stop": target_size},
+        )
+        await session.execute(text("ANALYZE examples"))
+        await session.commit()
+
+
+async def measure_search(search: str) -> float:
+    """検索付き一覧取得のレイテンシ（中央値）を測定"""
+    timings = []
+    async with TestingSessionLocal() as session:
+        for _ in range(ITERATIONS):
+            count_cache.clear()
+            start_time = time.perf_counter()
+            result = await ExampleService.list_examples(
+                db=session, page=1, per_page=10, search=search
+            )
+            timings.append(time.perf_counter() - start_time)
+            assert result.total == NEEDLE_COUNT
+    return statistics.median(timings)
+
+
+@pytest.mark.asyncio
+class TestSearchPerformance:
+    """トライグラムインデックスによる部分一致検索のベンチマーク"""
+
+    async def test_search_latency_flat_as_table_grows(self):
+        """テーブルが大きくなっても検索レイテンシがほぼ一定であることを確認"""
+        async with TestingSessionLocal() as session:
+            for i in range(NEEDLE_COUNT):
+                await session.execute(
+                    text(
+                        "INSERT INTO examples (name, is_active, created_at, "
+                        "updated_at) VALUES (:name, true, now(), now())"
+                    ),
+                    {"name": f"Needle Zebra {i}"},
+                )
+            await session.commit()
+
+        latencies = {}
+        for size in BENCHMARK_SIZES:
+            await grow_table(size)
+            latencies[size] = await measure_search("zebra")
+            print(f"search latency @ {size:>10,} rows: {latencies[size] * 1000:.2f}ms")
+
+        # 検索クエリがトライグラムインデックスを使っていることを確認
+        async with TestingSessionLocal() as session:
+            plan = await session.execute(
+                text("EXPLAIN SELECT * FROM examples WHERE name ILIKE :pattern"),
+                {"pattern": "%zebra%"},
+            )
+            plan_text = "\n".join(row[0] for row in plan)
+            # examples はパーティションのテーブルのため、各パーティションの
+            # 対応するインデックス（ix_examples_name_trgm の子）が使われる
+            trgm_indexes = await session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = CAST('ix_examples_name_trgm' AS regclass)"
+                )
+            )
+        assert any(f" on {index} " in plan_text for index in trgm_indexes.scalars())
+
+        # シーケンシャルスキャンなら件数に比例して遅くなるが、
+        # インデックス検索では最小サイズ比で数倍以内に収まる
+        smallest, largest = BENCHMARK_SIZES[0], BENCHMARK_SIZES[-1]
+        assert latencies[largest] < latencies[smallest] * 5 + 0.005, (
+            f"Search latency grew with table size: {latencies}"
+        )
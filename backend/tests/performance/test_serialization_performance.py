@@ -0,0 +1,139 @@
+import asyncio
+import os
+import sys
+import time
+from collections.abc import AsyncGenerator
+
+import httpx
+from fastapi import Depends, FastAPI, Response
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.api.common.pagination import CountMode
+from src.api.common.serialization import ModelJSONResponse
+from src.api.examples.schemas import ExampleListResponse, ExampleResponse
+from src.api.examples.services import PAGE_ORDER, ExampleService
+from src.db.models.example import Example
+from tests.conftest import TEST_DATABASE_URL, TestingSessionLocal
+
+PER_PAGE = 100
+ITERATIONS = 200
+
+# 接続の確立がCPU時間の大半を占めないよう、プールを使うエンジンで測定する
+# （測定ごとに asyncio.run の中で作成・破棄する）
+session_maker: async_sessionmaker[AsyncSession] | None = None
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    assert session_maker is not None
+    async with session_maker() as session:
+        yield session
+
+
+# 変更前後の一覧取得（件数は取得しない）を並べたアプリ
+app = FastAPI()
+
+
+@app.get("/before", response_model=ExampleListResponse)
+async def list_before(
+    db: AsyncSession = Depends(get_session),  # noqa: B008
+) -> ExampleListResponse:
+    """変更前: エンティティを1行ずつ検証し、response_model を通して返す"""
+    stmt = select(Example).order_by(*PAGE_ORDER).limit(PER_PAGE + 1)
+    examples = list((await db.execute(stmt)).scalars().all())[:PER_PAGE]
+    return ExampleListResponse(
+        items=[ExampleResponse.model_validate(example) for example in examples],
+        total=None,
+        page=1,
+        per_page=PER_PAGE,
+        pages=None,
+        total_exact=False,
+    )
+
+
+@app.get("/after", response_model=ExampleListResponse)
+async def list_after(
+    db: AsyncSession = Depends(get_session),  # noqa: B008
+) -> Response:
+    """変更後: カラムの行をまとめて検証し、ModelJSONResponse で返す"""
+    return ModelJSONResponse(
+        await ExampleService.list_examples(db, 1, PER_PAGE, count=CountMode.NONE)
+    )
+
+
+def seed() -> None:
+    """1ページ分より多い行を投入"""
+
+    async def insert():
+        async with TestingSessionLocal() as session:
+            await session.execute(
+                text(
+                    "INSERT INTO examples (name, description, is_active, "
+                    "created_at, updated_at) "
+                    "SELECT 'Serialization ' || g, repeat('x', 200), true, "
+                    "now(), now() FROM generate_series(1, :rows) AS g"
+                ),
+                {"rows": PER_PAGE * 2},
+            )
+            await session.commit()
+
+    asyncio.run(insert())
+
+
+async def cpu_per_request(client: httpx.AsyncClient, path: str) -> float:
+    """1リクエストあたりのCPU時間（ミリ秒、同じプロセスのアプリとクライアントの合計）
+
+    DBサーバーは別プロセスのため含まない。
+    """
+    start_time = time.process_time()
+    for _ in range(ITERATIONS):
+        response = await client.get(path)
+        assert response.status_code == 200
+    return (time.process_time() - start_time) / ITERATIONS * 1000
+
+
+class TestSerializationPerformance:
+    """一覧取得（per_page=100）の行の読み込みとシリアライズのベンチマーク"""
+
+    def test_list_uses_less_cpu(self):
+        """変更後の方が1リクエストあたりのCPU時間が少ないことを確認"""
+        seed()
+
+        async def run():
+            global session_maker
+            engine = create_async_engine(TEST_DATABASE_URL)
+            session_maker = async_sessionmaker(engine, expire_on_commit=False)
+            try:
+                return await measure()
+            finally:
+                await engine.dispose()
+
+        async def measure():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                # 変更前後で同じ JSON を返す
+                before_body = (await client.get("/before")).json()
+                after_body = (await client.get("/after")).json()
+                assert after_body["items"] == before_body["items"]
+                assert len(after_body["items"]) == PER_PAGE
+
+                # 交互に3回ずつ測定し、それぞれ最小の値を採用する
+                timings: dict[str, list[float]] = {"/before": [], "/after": []}
+                for _ in range(3):
+                    for path, values in timings.items():
+                        values.append(await cpu_per_request(client, path))
+                return min(timings["/before"]), min(timings["/after"])
+
+        before, after = asyncio.run(run())
+        print(
+            f"list_examples per_page={PER_PAGE}: before {before:.2f}ms CPU, "
+            f"after {after:.2f}ms CPU ({(1 - after / before) * 100:.0f}% less)"
+        )
+        assert after < before
@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from sqlalchemy import select
+
+from src.api.examples.services import (
+    GET_EXAMPLE,
+    LIST_EXAMPLES_PAGE,
+    PAGE_ORDER,
+    ROW_COLUMNS,
+)
+from src.db.models.example import Example
+
+ITERATIONS = 5000
+
+
+def per_call_overhead(build) -> float:
+    """ステートメントの用意とキャッシュキー計算にかかる1回あたりの時間（マイクロ秒）
+
+    実行時に SQLAlchemy がコンパイルキャッシュを引くまでのPython側の処理に相当する。
+    """
+    start_time = time.perf_counter()
+    for i in range(ITERATIONS):
+        stmt = build(i)
+        stmt._generate_cache_key()
+    return (time.perf_counter() - start_time) / ITERATIONS * 1_000_000
+
+
+class TestStatementOverhead:
+    """構築済みステートメントによる呼び出しごとのオーバーヘッドのマイクロベンチマーク"""
+
+    def test_registered_statements_reduce_overhead(self):
+        """毎回構築する場合と比べて構築済みステートメントの方が速いことを確認"""
+        cases = {
+            "get_example": (
+                lambda i: select(Example).where(Example.id == i),
+                lambda i: GET_EXAMPLE,
+            ),
+            "list_examples": (
+                lambda i: (
+                    select(*ROW_COLUMNS).order_by(*PAGE_ORDER).offset(i).limit(11)
+                ),
+                lambda i: LIST_EXAMPLES_PAGE,
+            ),
+        }
+        for name, (rebuild, registered) in cases.items():
+            before = per_call_overhead(rebuild)
+            after = per_call_overhead(registered)
+            print(
+                f"{name}: rebuild {before:.1f}us/call, "
+                f"registered {after:.1f}us/call ({before / after:.0f}x)"
+            )
+            assert after < before, f"{name}: registered {after}us >= rebuild {before}us"
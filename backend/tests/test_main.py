@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,3 +21,54 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_import_opens_no_connections():
+    """インポートしただけでは接続を開かないことを確認
+
+    フォークしたワーカー間で接続を共有しないため。他のテストがエンジンを使った
+    後でも確認できるよう、別プロセスでインポートする。
+    """
+    code = (
+        "from src.db.database import engine\n"
+        "import src.main\n"
+        "assert engine.pool.checkedin() == 0, engine.pool.checkedin()\n"
+        "assert engine.pool.checkedout() == 0, engine.pool.checkedout()\n"
+    )
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_internal_endpoints_disabled_by_default():
+    """debug_endpoints が無効の場合は内部向けのエンドポイントを登録しないことを確認"""
+    code = (
+        "from fastapi.testclient import TestClient\n"
+        "from src.main import app\n"
+        "client = TestClient(app)\n"
+        "assert client.get('/api/health/simple').status_code == 200\n"
+        "for path in ['/api/health/pool', '/api/health/statements',\n"
+        "             '/api/debug/queries', '/api/debug/caches',\n"
+        "             '/api/debug/coalescing', '/api/debug/compression']:\n"
+        "    assert client.get(path).status_code == 404, path\n"
+        "    assert client.delete(path).status_code in (404, 405), path\n"
+    )
+    env = {**os.environ, "DEBUG_ENDPOINTS": "false"}
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=backend_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr